@@ -0,0 +1,428 @@
+# Banc de mesure des tableaux de bord GED sur des exports synthétiques de taille croissante.
+#
+#   python benchmark.py --tailles 10k 100k 1M 5M --sortie resultats.json
+#   python benchmark.py --projets --tours 5 --sans-memoire --reference benchmark_reference.json
+#   python benchmark.py --demarrage --tours 5
+#
+# Pour chaque taille, l'export est généré une fois (puis réutilisé depuis --dossier), puis on mesure
+# le chargement, le prétraitement et, pour chaque onglet, l'agrégation et la construction des figures
+# (sérialisation JSON comprise, comme lors de l'envoi au navigateur). Le pic mémoire de chaque étape
+# est mesuré avec tracemalloc lors d'une exécution supplémentaire, pour ne pas fausser les durées.
+#
+# Avec --reference, les meilleures durées sont comparées à une référence enregistrée (--enregistrer-reference),
+# ramenée à la vitesse de la machine courante par une calibration, et le script échoue (code 1)
+# avec un rapport par étape dès qu'une étape a régressé au-delà de la tolérance, ou qu'une étape (ou un jeu)
+# de la référence n'a pas été mesurée, sauf avec --manquantes-permises.
+#
+# Avec --demarrage, on mesure le démarrage à froid : chaque tour lance un nouveau processus qui exécute
+# app.py une fois (API de test de Streamlit, profilage activé) et relève le délai jusqu'au début du script,
+# à l'envoi du menu et à la fin de la première page, ainsi que les modules lourds déjà importés au menu.
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from ged import agregations, alertes, doublons, dossiers, graphiques, quantiles, sequences, visas
+from ged.chargement import charger_donnees
+from ged.config import PROJETS
+from ged.jours_ouvres import calendrier_ouvre
+from ged.pretraitement import durees_jours_ouvres, pretraiter_donnees
+from ged.projet import jours_depot_tries, mois_depot
+from ged.synthetique import ecrire_export
+
+# Dossier de l'application : les chemins des projets configurés sont relatifs à ce dossier, comme avec streamlit run
+DOSSIER_APPLICATION = os.path.dirname(os.path.abspath(__file__))
+
+TAILLES_DEFAUT = ['10k', '100k', '1M', '5M']
+MULTIPLICATEURS = {'k': 1_000, 'M': 1_000_000}
+
+# Tolérance de la comparaison à la référence. Chaque étape est résumée par sa meilleure durée, la moins
+# sensible à la charge de la machine ; elle régresse si cette durée dépasse à la fois la référence majorée
+# de TOLERANCE_RELATIVE, SIGMAS_MAD écarts (estimés par l'écart absolu médian des échantillons de
+# référence) et PLANCHER_SECONDES, pour ignorer le bruit des étapes très courtes
+TOLERANCE_RELATIVE = 0.3
+SIGMAS_MAD = 4
+PLANCHER_SECONDES = 0.01
+
+# Fonction pour convertir une taille lisible ('10k', '1M') en nombre de lignes
+def nombre_de_lignes(taille):
+    if taille[-1] in MULTIPLICATEURS:
+        return int(float(taille[:-1]) * MULTIPLICATEURS[taille[-1]])
+    return int(taille)
+
+# Fonction pour exécuter une étape et renvoyer son résultat et sa durée en secondes
+def chronometrer(fonction, *arguments):
+    debut = time.perf_counter()
+    resultat = fonction(*arguments)
+    return resultat, time.perf_counter() - debut
+
+# Fonction pour mesurer le pic mémoire (en Mo) alloué pendant une étape
+def pic_memoire(fonction, *arguments):
+    tracemalloc.start()
+    try:
+        fonction(*arguments)
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+# Fonction pour sérialiser les figures comme st.plotly_chart le fait avant l'envoi au navigateur
+def serialiser(*figures):
+    return [figure.to_json() for figure in figures]
+
+# Agrégations et figures de chaque onglet, dans l'ordre des pages de app.py
+def _flux(donnees):
+    return agregations.flux_documents(donnees)
+
+def _flux_figure(resultat):
+    return serialiser(graphiques.figure_sankey(*resultat))
+
+def _evolution(donnees):
+    return agregations.evolution_types(donnees, mois_depot(donnees)), donnees['TYPE DE DOCUMENT'].iloc[0]
+
+def _evolution_figure(resultat):
+    donnees_groupees, type_document = resultat
+    return serialiser(graphiques.figure_evolution(donnees_groupees, [type_document], 'SYN'))
+
+def _lot_indice(donnees):
+    comptes = agregations.repartition(donnees, ['LOT', 'TYPE DE DOCUMENT', 'INDICE'])
+    return comptes, comptes.groupby('LOT')['Nombre de documents'].sum().reset_index(), comptes.groupby('TYPE DE DOCUMENT')['Nombre de documents'].sum().reset_index()
+
+def _lot_indice_figure(resultat):
+    comptes, documents_par_lot, documents_par_type = resultat
+    return serialiser(
+        graphiques.figure_treemap(comptes, ['LOT', 'INDICE'], 'Lot et indice', 500),
+        graphiques.figure_treemap(comptes, ['TYPE DE DOCUMENT', 'INDICE'], 'Type et indice', 550),
+        graphiques.figure_treemap(comptes, ['LOT', 'TYPE DE DOCUMENT', 'INDICE'], 'Type, lot et indice', 800),
+        graphiques.figure_barres_horizontales(documents_par_lot, 'LOT', 'Lot', 'Par lot', 1000),
+        graphiques.figure_barres_horizontales(documents_par_type, 'TYPE DE DOCUMENT', 'Type de documents', 'Par type', 1200)
+    )
+
+def _acteurs(donnees):
+    return agregations.repartition(donnees, ['EMET', 'TYPE DE DOCUMENT']), agregations.repartition(donnees, ['Ajouté par', 'TYPE DE DOCUMENT'])
+
+def _acteurs_figure(resultat):
+    comptes_emetteur, comptes_ajoute_par = resultat
+    return serialiser(
+        graphiques.figure_treemap(comptes_emetteur, ['EMET', 'TYPE DE DOCUMENT'], 'Par émetteur', 480),
+        graphiques.figure_treemap(comptes_ajoute_par, ['Ajouté par', 'TYPE DE DOCUMENT'], 'Par acteur', 480)
+    )
+
+def _dossiers(donnees):
+    return dossiers.arbre_dossiers(donnees)
+
+def _dossiers_figure(resultat):
+    return serialiser(graphiques.figure_dossiers(resultat, 'Icicle', 3), graphiques.figure_dossiers(resultat, 'Treemap', 3))
+
+def _masse(donnees):
+    return agregations.masse_documents({'SYN': jours_depot_tries(donnees)}, 'all')
+
+def _masse_figure(resultat):
+    return serialiser(graphiques.figure_masse_documents(resultat))
+
+def _indices(donnees):
+    return agregations.statistiques_boites(donnees, 'TYPE DE DOCUMENT', 'Nombre d\'indices'), agregations.statistique_par_categorie(donnees, 'TYPE DE DOCUMENT', 'Nombre d\'indices', 'mean')
+
+def _indices_figure(resultat):
+    (boites, aberrants), resultats = resultat
+    return serialiser(
+        graphiques.figure_barres_categorie(resultats, 'TYPE DE DOCUMENT', 'Nombre moyen d\'indices', 'TYPE DE DOCUMENT'),
+        graphiques.figure_boxplot(boites, aberrants, 'TYPE DE DOCUMENT', 'Nombre d\'indices', 'Nombre moyen d\'indices')
+    )
+
+def _doublons(donnees):
+    return doublons.doublons_par_lot(doublons.groupes_doublons(donnees))
+
+def _doublons_figure(resultat):
+    return serialiser(graphiques.figure_doublons_par_lot(resultat))
+
+def _durees(donnees):
+    return agregations.statistiques_boites(donnees, 'TYPE DE DOCUMENT', 'Durée entre versions'), agregations.statistique_par_categorie(donnees, 'TYPE DE DOCUMENT', 'Durée entre versions', 'mean'), agregations.durees_entre_indices(donnees)
+
+def _durees_figure(resultat):
+    (boites, aberrants), resultats, _ = resultat
+    return serialiser(
+        graphiques.figure_barres_categorie(resultats, 'TYPE DE DOCUMENT', 'Durée moyenne entre versions (jours)', 'TYPE DE DOCUMENT'),
+        graphiques.figure_boxplot(boites, aberrants, 'TYPE DE DOCUMENT', 'Durée entre versions', 'Durée moyenne entre versions (jours)')
+    )
+
+# Durées recalculées en jours ouvrés (jours fériés exclus)
+def _durees_ouvres(donnees):
+    calendrier = calendrier_ouvre()
+    donnees = donnees.assign(**durees_jours_ouvres(donnees, calendrier))
+    return agregations.statistiques_boites(donnees, 'TYPE DE DOCUMENT', 'Durée entre versions'), agregations.statistique_par_categorie(donnees, 'TYPE DE DOCUMENT', 'Durée entre versions', 'mean'), agregations.durees_entre_indices(donnees, calendrier)
+
+# Esquisses de quantiles des durées, puis p90 par type de document lu sur les esquisses
+def _durees_projets(donnees):
+    esquisses = quantiles.esquisses_durees(donnees, visas.demandes_visa(donnees))
+    return quantiles.durees_par_projet({'SYN': esquisses}, 'Durée entre versions', 'TYPE DE DOCUMENT', 'p90')
+
+def _durees_projets_figure(resultat):
+    return serialiser(graphiques.figure_barres_categorie(resultat[0], 'TYPE DE DOCUMENT', 'Durée entre versions, p90 (jours)', 'TYPE DE DOCUMENT'))
+
+def _calendrier(donnees):
+    return agregations.calendrier(donnees, 'LOT')
+
+def _calendrier_figure(resultat):
+    return serialiser(graphiques.figure_gantt(resultat, 'LOT', 'Calendrier des Projets par LOT', 'LOT'))
+
+def _calendrier_lot(donnees):
+    return agregations.calendrier(donnees[donnees['LOT'] == donnees['LOT'].iloc[0]], 'TYPE DE DOCUMENT')
+
+def _calendrier_lot_figure(resultat):
+    return serialiser(graphiques.figure_gantt(resultat, 'TYPE DE DOCUMENT', 'Calendrier par Lot', 'Type de Document'))
+
+def _sequences(donnees):
+    donnees_filtrees = sequences.filtrer_donnees_par_periode(donnees, '6 mois')
+    donnees_lot = donnees_filtrees[donnees_filtrees['LOT'] == donnees_filtrees['LOT'].iloc[0]].sort_values(by='Date dépôt GED')
+    return (donnees_lot, sequences.calculer_sequence_moyenne(donnees_lot), sequences.calculer_clusters(donnees_lot),
+            sequences.detecter_anomalies(donnees_lot), sequences.resume_statistique(donnees_lot))
+
+def _sequences_figure(resultat):
+    donnees_lot, moyenne_dates, clusters, anomalies, _ = resultat
+    distribution_types = donnees_lot['TYPE DE DOCUMENT'].value_counts().reset_index()
+    distribution_types.columns = ['Type de Document', 'Nombre de Documents']
+    return serialiser(
+        graphiques.figure_distribution_types(distribution_types),
+        graphiques.figure_sequence(donnees_lot, 'TYPE DE DOCUMENT', 'Séquence de diffusion des documents'),
+        graphiques.figure_sequence_moyenne(moyenne_dates),
+        graphiques.figure_sequence(donnees_lot, clusters, 'Clustering des documents par date de dépôt'),
+        graphiques.figure_sequence(donnees_lot, anomalies, 'Détection des anomalies')
+    )
+
+def _alertes(donnees):
+    return alertes.calculer_alertes(donnees, 'LOT')
+
+def _alertes_figure(resultat):
+    return serialiser(
+        graphiques.figure_camembert_alerte(alertes.comptes_par_niveau(resultat['Code Alerte 1'].to_numpy(), alertes.LIBELLES_ALERTE_1), alertes.LIBELLES_ALERTE_1, alertes.COULEURS_ALERTE_1, 'Alerte 1'),
+        graphiques.figure_camembert_alerte(alertes.comptes_par_niveau(resultat['Code Alerte 2'].to_numpy(), alertes.LIBELLES_ALERTE_2), alertes.LIBELLES_ALERTE_2, alertes.COULEURS_ALERTE_2, 'Alerte 2')
+    )
+
+def _attente(donnees):
+    demandes = visas.demandes_visa(donnees)
+    return visas.visas_en_attente(demandes, 'Relecteur', donnees['Date dépôt GED'].max()), visas.visas_en_attente(demandes, 'LOT', donnees['Date dépôt GED'].max())
+
+def _attente_figure(resultat):
+    return serialiser(*[graphiques.figure_visas_en_attente(attente, 'Visas en attente', attente.columns.name) for attente in resultat])
+
+def _visas(donnees):
+    demandes = visas.demandes_visa(donnees)
+    return [visas.delais_par_relecteur(demandes, ['Relecteur'])] + [visas.delais_par_relecteur(demandes, ['Relecteur', categorie]) for categorie in visas.CATEGORIES]
+
+def _visas_figure(resultat):
+    return serialiser(graphiques.figure_retards_relecteurs(resultat[0]), graphiques.figure_delais_relecteurs(resultat[0]))
+
+ONGLETS = [
+    ('flux', _flux, _flux_figure),
+    ('evolution', _evolution, _evolution_figure),
+    ('attente', _attente, _attente_figure),
+    ('lot-indice', _lot_indice, _lot_indice_figure),
+    ('acteurs', _acteurs, _acteurs_figure),
+    ('dossiers', _dossiers, _dossiers_figure),
+    ('masse', _masse, _masse_figure),
+    ('indices', _indices, _indices_figure),
+    ('doublons', _doublons, _doublons_figure),
+    ('durees', _durees, _durees_figure),
+    ('durees-ouvres', _durees_ouvres, _durees_figure),
+    ('durees-projets', _durees_projets, _durees_projets_figure),
+    ('calendrier', _calendrier, _calendrier_figure),
+    ('calendrier-lot', _calendrier_lot, _calendrier_lot_figure),
+    ('sequences', _sequences, _sequences_figure),
+    ('alertes', _alertes, _alertes_figure),
+    ('visas', _visas, _visas_figure)
+]
+
+# Fonction pour mesurer une étape : durée, puis pic mémoire lors d'une exécution supplémentaire
+def mesurer(mesures, etape, memoire, fonction, *arguments):
+    resultat, duree = chronometrer(fonction, *arguments)
+    mesure = {'etape': etape, 'secondes': round(duree, 4)}
+    if memoire:
+        mesure['pic_mo'] = round(pic_memoire(fonction, *arguments), 1)
+    mesures.append(mesure)
+    print(f"  {etape:<28} {duree:9.3f} s" + (f" {mesure['pic_mo']:10.1f} Mo" if memoire else ''), flush=True)
+    return resultat
+
+# Fonction pour mesurer une fois toutes les étapes sur un export GED
+def mesurer_fichier(jeu, chemin, memoire=True):
+    print(f"{jeu} ({chemin})")
+    mesures = []
+    brutes = mesurer(mesures, 'charger_donnees', memoire, charger_donnees, chemin)
+    donnees = mesurer(mesures, 'pretraiter_donnees', memoire, pretraiter_donnees, brutes, True)
+    lignes = len(brutes)
+    del brutes
+    for nom, agregation, figure in ONGLETS:
+        resultat = mesurer(mesures, f'{nom}.agregation', memoire, agregation, donnees)
+        mesurer(mesures, f'{nom}.figure', memoire, figure, resultat)
+    return {'jeu': jeu, 'lignes': lignes, 'mesures': mesures}
+
+# Fonction pour générer (une seule fois) l'export synthétique de la taille donnée et renvoyer son chemin
+def export_synthetique(taille, dossier, graine=0):
+    n_lignes = nombre_de_lignes(taille)
+    chemin = os.path.join(dossier, f'ged_synthetique_{taille}_{graine}.csv')
+    if not os.path.exists(chemin):
+        print(f"Génération de {chemin} ({n_lignes} lignes)...", flush=True)
+        ecrire_export(chemin + '.tmp', n_lignes, graine)
+        os.replace(chemin + '.tmp', chemin)
+    return chemin
+
+# Fonction pour mesurer une charge de calcul fixe, qui sert à comparer des mesures prises sur des machines différentes
+def calibrer(repetitions=3):
+    rng = np.random.default_rng(0)
+    tableau = pd.DataFrame({'cle': rng.integers(0, 1000, size=1_000_000), 'valeur': rng.random(1_000_000)})
+    def charge():
+        tableau.groupby('cle')['valeur'].agg(['mean', 'max'])
+        tableau.sort_values('valeur')
+    return min(chronometrer(charge)[1] for _ in range(repetitions))
+
+# Fonction pour mesurer tous les jeux en plusieurs tours. Les tours sont entrelacés plutôt que de répéter
+# chaque étape d'affilée, pour que les échantillons d'une étape soient répartis sur toute la durée de la
+# mesure ; chaque étape (et la calibration) est résumée par sa meilleure durée. Le pic mémoire n'est mesuré qu'au premier tour.
+def mesurer_jeux(jeux, tours, memoire=True):
+    calibrations = []
+    resultats = {}
+    for tour in range(tours):
+        for jeu, chemin in jeux:
+            calibrations.append(calibrer())
+            passe = mesurer_fichier(jeu, chemin, memoire and tour == 0)
+            if jeu not in resultats:
+                resultats[jeu] = {'jeu': jeu, 'lignes': passe['lignes'], 'mesures': [dict(mesure, echantillons=[]) for mesure in passe['mesures']]}
+            for cumul, mesure in zip(resultats[jeu]['mesures'], passe['mesures']):
+                cumul['echantillons'].append(mesure['secondes'])
+                cumul['secondes'] = min(cumul['echantillons'])
+    return {'calibration': min(calibrations), 'tours': tours, 'jeux': list(resultats.values())}
+
+# Fonction pour calculer le seuil de régression d'une étape à partir de ses mesures de référence
+def seuil_regression(reference, facteur_machine):
+    echantillons = np.asarray(reference['echantillons'])
+    ecart_absolu = float(np.median(np.abs(echantillons - np.median(echantillons)))) * facteur_machine
+    attendu = reference['secondes'] * facteur_machine
+    return max(attendu * (1 + TOLERANCE_RELATIVE), attendu + SIGMAS_MAD * 1.4826 * ecart_absolu, attendu + PLANCHER_SECONDES)
+
+# Fonction pour comparer des mesures à la référence et renvoyer le rapport par étape. Les étapes de la référence
+# absentes des mesures (étape supprimée ou jeu non mesuré) sont signalées comme manquantes
+def comparer(resultats, reference):
+    facteur_machine = resultats['calibration'] / reference['calibration']
+    references = {(jeu['jeu'], mesure['etape']): mesure for jeu in reference['jeux'] for mesure in jeu['mesures']}
+    mesurees = {(jeu['jeu'], mesure['etape']) for jeu in resultats['jeux'] for mesure in jeu['mesures']}
+    rapport = []
+    for jeu in resultats['jeux']:
+        for mesure in jeu['mesures']:
+            ref = references.get((jeu['jeu'], mesure['etape']))
+            ligne = {'jeu': jeu['jeu'], 'etape': mesure['etape'], 'actuel': mesure['secondes'], 'reference': None, 'seuil': None, 'ecart': None, 'statut': 'nouveau'}
+            if ref is not None:
+                attendu = ref['secondes'] * facteur_machine
+                ligne.update({
+                    'reference': attendu,
+                    'seuil': seuil_regression(ref, facteur_machine),
+                    'ecart': (mesure['secondes'] - attendu) / attendu if attendu else 0.0
+                })
+                ligne['statut'] = 'REGRESSION' if mesure['secondes'] > ligne['seuil'] else 'ok'
+            rapport.append(ligne)
+    for (jeu, etape), ref in references.items():
+        if (jeu, etape) not in mesurees:
+            rapport.append({'jeu': jeu, 'etape': etape, 'actuel': None, 'reference': ref['secondes'] * facteur_machine, 'seuil': None, 'ecart': None, 'statut': 'MANQUANTE'})
+    return facteur_machine, rapport
+
+# Fonction pour afficher le rapport de comparaison étape par étape et renvoyer les étapes en échec : régressions,
+# et étapes manquantes sauf si elles sont permises
+def afficher_rapport(facteur_machine, rapport, manquantes_permises=False):
+    print(f"\nFacteur machine (calibration actuelle / référence) : {facteur_machine:.2f}")
+    print(f"{'jeu':<12} {'étape':<28} {'référence':>10} {'actuel':>10} {'écart':>8} {'seuil':>10}  statut")
+    for ligne in rapport:
+        if ligne['reference'] is None:
+            print(f"{ligne['jeu']:<12} {ligne['etape']:<28} {'-':>10} {ligne['actuel']:10.4f} {'-':>8} {'-':>10}  {ligne['statut']}")
+        elif ligne['actuel'] is None:
+            print(f"{ligne['jeu']:<12} {ligne['etape']:<28} {ligne['reference']:10.4f} {'-':>10} {'-':>8} {'-':>10}  {ligne['statut']}")
+        else:
+            print(f"{ligne['jeu']:<12} {ligne['etape']:<28} {ligne['reference']:10.4f} {ligne['actuel']:10.4f} {ligne['ecart']:+8.1%} {ligne['seuil']:10.4f}  {ligne['statut']}")
+    regressions = [ligne for ligne in rapport if ligne['statut'] == 'REGRESSION']
+    manquantes = [ligne for ligne in rapport if ligne['statut'] == 'MANQUANTE']
+    print(f"\n{len(regressions)} régression(s) sur {len(rapport) - len(manquantes)} étapes, {len(manquantes)} étape(s) de la référence non mesurée(s)"
+          + (" (permises)" if manquantes and manquantes_permises else ""))
+    return regressions + ([] if manquantes_permises else manquantes)
+
+# Programme exécuté dans un nouveau processus pour chaque mesure du démarrage à froid
+PROGRAMME_DEMARRAGE = '''
+import json, os, sys, time
+debut = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+AppTest.from_file(sys.argv[1], default_timeout=600).run()
+with open(os.environ['GED_JOURNAL_PROFILAGE'], encoding='utf-8') as journal:
+    profil = json.loads(journal.readlines()[-1])
+delais = {'script': profil['horloge'] - debut}
+delais.update({nom: profil['horloge'] + jalon['secondes'] - debut for nom, jalon in profil['jalons'].items()})
+print(json.dumps({'delais': delais, 'modules_menu': profil['jalons']['menu']['modules']}))
+'''
+
+# Fonction pour mesurer le démarrage à froid de l'application sur plusieurs processus neufs
+def mesurer_demarrage(tours):
+    application = os.path.join(DOSSIER_APPLICATION, 'app.py')
+    mesures = []
+    with tempfile.TemporaryDirectory() as dossier:
+        for tour in range(tours):
+            environnement = dict(os.environ, GED_PROFILAGE='1', GED_JOURNAL_PROFILAGE=os.path.join(dossier, f'profilage_{tour}.jsonl'))
+            sortie = subprocess.run([sys.executable, '-c', PROGRAMME_DEMARRAGE, application], env=environnement,
+                                    cwd=DOSSIER_APPLICATION, capture_output=True, text=True, check=True)
+            mesures.append(json.loads(sortie.stdout.strip().splitlines()[-1]))
+            print(f"  tour {tour + 1} : " + ", ".join(f"{nom} {delai:.2f} s" for nom, delai in mesures[-1]['delais'].items()), flush=True)
+    delais = pd.DataFrame([mesure['delais'] for mesure in mesures])
+    modules_menu = sorted({module for mesure in mesures for module in mesure['modules_menu']})
+    print("Démarrage à froid (médiane) : " + ", ".join(f"{nom} {delai:.2f} s" for nom, delai in delais.median().items()))
+    print(f"Modules lourds importés à l'envoi du menu (sur {tours} tours) : {', '.join(modules_menu) or 'aucun'}")
+    return {'tours': tours, 'delais': delais.median().round(3).to_dict(), 'modules_menu': modules_menu, 'mesures': mesures}
+
+def main():
+    parser = argparse.ArgumentParser(description="Mesure des tableaux de bord GED sur des exports synthétiques ou sur les projets configurés")
+    parser.add_argument('--tailles', nargs='+', default=TAILLES_DEFAUT, help="tailles des exports (ex. 10k 100k 1M 5M)")
+    parser.add_argument('--projets', action='store_true', help="mesurer les projets configurés présents sur disque au lieu des exports synthétiques")
+    parser.add_argument('--demarrage', action='store_true', help="mesurer le démarrage à froid de l'application (un nouveau processus par tour)")
+    parser.add_argument('--dossier', default=os.path.join(tempfile.gettempdir(), 'ged_benchmark'), help="dossier des exports générés")
+    parser.add_argument('--tours', type=int, default=1, help="nombre de mesures de chaque étape (la meilleure est retenue)")
+    parser.add_argument('--sortie', help="fichier JSON où enregistrer les mesures")
+    parser.add_argument('--reference', help="fichier de référence : échoue si une étape a régressé au-delà de la tolérance")
+    parser.add_argument('--enregistrer-reference', help="enregistrer les mesures comme nouvelle référence")
+    parser.add_argument('--manquantes-permises', action='store_true', help="ne pas échouer si des étapes de la référence n'ont pas été mesurées")
+    parser.add_argument('--sans-memoire', action='store_true', help="ne pas mesurer le pic mémoire")
+    parser.add_argument('--graine', type=int, default=0, help="graine du générateur")
+    arguments = parser.parse_args()
+
+    if arguments.demarrage:
+        resultats = mesurer_demarrage(arguments.tours)
+        if arguments.sortie:
+            with open(arguments.sortie, 'w', encoding='utf-8') as fichier:
+                json.dump(resultats, fichier, indent=2, ensure_ascii=False)
+        # Aucun module lourd ne doit être importé avant l'envoi du menu
+        if resultats['modules_menu']:
+            sys.exit(1)
+        return
+
+    if arguments.projets:
+        jeux = [(nom, os.path.join(DOSSIER_APPLICATION, chemin)) for nom, chemin in PROJETS.items()]
+        jeux = [(nom, chemin) for nom, chemin in jeux if os.path.exists(chemin)]
+        if not jeux:
+            parser.error(f"aucun des projets configurés n'est présent dans {DOSSIER_APPLICATION}")
+    else:
+        os.makedirs(arguments.dossier, exist_ok=True)
+        jeux = [(taille, export_synthetique(taille, arguments.dossier, arguments.graine)) for taille in arguments.tailles]
+    resultats = mesurer_jeux(jeux, arguments.tours, not arguments.sans_memoire)
+
+    for chemin in (arguments.sortie, arguments.enregistrer_reference):
+        if chemin:
+            with open(chemin, 'w', encoding='utf-8') as fichier:
+                json.dump(resultats, fichier, indent=2, ensure_ascii=False)
+
+    if arguments.reference:
+        with open(arguments.reference, encoding='utf-8') as fichier:
+            reference = json.load(fichier)
+        if afficher_rapport(*comparer(resultats, reference), arguments.manquantes_permises):
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+# Test de charge : des sessions simulées parcourent l'application en parallèle, sans navigateur.
+#
+#   python charge.py --sessions 20 --interactions 30 --sortie charge.json
+#
+# Chaque session exécute app.py avec l'API de test de Streamlit (AppTest) dans son propre thread, comme le
+# serveur le fait pour chaque onglet de navigateur : les caches et l'entrepôt de projets sont donc partagés
+# entre les sessions. Une session ouvre l'application puis enchaîne au hasard changements de page,
+# manipulations des widgets de la page et changements de projet. Le rapport donne les percentiles de
+# latence par interaction, le débit et la mémoire du processus au cours du temps.
+import argparse
+import json
+import os
+import random
+import resource
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+APPLICATION = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+
+# Version de Streamlit avec laquelle le test de charge est vérifié. AppTest.switch_page ne connaît que les pages
+# définies par un fichier : la navigation entre les pages de app.py, qui sont des fonctions, passe par des
+# attributs internes d'AppTest propres à cette version
+VERSION_STREAMLIT = '1.66'
+
+# Poids des interactions simulées après l'ouverture
+INTERACTIONS = {'page': 0.5, 'widget': 0.35, 'projet': 0.15}
+
+# Période d'échantillonnage de la mémoire du processus (en secondes)
+PERIODE_MEMOIRE = 0.5
+
+PERCENTILES = [50, 90, 95, 99]
+
+# Fonction pour lire la mémoire résidente du processus en Mo
+def memoire_residente():
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except OSError:
+        # Hors Linux : pic de mémoire résidente (en Ko sous Linux, en octets sous macOS)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+
+# Échantillonner la mémoire du processus en tâche de fond jusqu'à l'arrêt
+class SuiviMemoire(threading.Thread):
+    def __init__(self, debut):
+        super().__init__(daemon=True)
+        self.debut = debut
+        self.echantillons = []  # (secondes depuis le début, Mo)
+        self._arret = threading.Event()
+
+    def run(self):
+        while not self._arret.is_set():
+            self.echantillons.append((round(time.perf_counter() - self.debut, 2), round(memoire_residente(), 1)))
+            self._arret.wait(PERIODE_MEMOIRE)
+
+    def arreter(self):
+        self._arret.set()
+        self.join()
+
+# Session simulée : une instance AppTest et l'historique de ses interactions
+class Session:
+    def __init__(self, numero, graine, delai, pause):
+        self.numero = numero
+        self.rng = random.Random(graine + numero)
+        self.delai = delai
+        self.pause = pause
+        self.app = AppTest.from_file(APPLICATION, default_timeout=delai)
+        self.mesures = []
+
+    # Titre de la page affichée
+    def page_courante(self):
+        pages = self.app._registered_pages
+        return pages.get(self.app._finished_page_script_hash, {}).get('page_name', '')
+
+    # Exécuter une interaction et enregistrer sa latence
+    def executer(self, interaction, debut_test):
+        debut = time.perf_counter()
+        erreur = None
+        try:
+            self.app.run()
+            if self.app.exception:
+                erreur = self.app.exception[0].message
+        except Exception as exception:
+            erreur = repr(exception)
+        fin = time.perf_counter()
+        self.mesures.append({
+            'session': self.numero,
+            'interaction': interaction,
+            'page': self.page_courante(),
+            'debut': round(debut - debut_test, 3),
+            'secondes': round(fin - debut, 4),
+            'erreur': erreur
+        })
+
+    # Aller sur une autre page de la navigation, désignée par son hash (voir VERSION_STREAMLIT). Aucune page
+    # n'est enregistrée si l'ouverture de l'application a échoué
+    def changer_de_page(self):
+        pages = [page for page in self.app._registered_pages if page != self.app._finished_page_script_hash]
+        if not pages:
+            return None
+        self.app._page_hash = self.rng.choice(pages)
+        return 'page'
+
+    # Modifier au hasard un widget de la page courante
+    def manipuler_widget(self):
+        widgets = [w for w in list(self.app.selectbox) + list(self.app.radio) if w.key != 'projet_global' and len(w.options) > 1]
+        widgets += [w for w in self.app.multiselect if w.options]
+        if not widgets:
+            return None
+        widget = self.rng.choice(widgets)
+        if widget.type == 'multiselect':
+            widget.set_value(self.rng.sample(widget.options, self.rng.randint(1, min(3, len(widget.options)))))
+        else:
+            widget.set_value(self.rng.choice([option for option in widget.options if option != widget.value] or widget.options))
+        return 'widget'
+
+    # Sélectionner un autre projet dans la barre latérale
+    def changer_de_projet(self):
+        selection = [w for w in self.app.selectbox if w.key == 'projet_global']
+        if not selection or len(selection[0].options) < 2:
+            return None
+        selection[0].set_value(self.rng.choice([option for option in selection[0].options if option != selection[0].value]))
+        return 'projet'
+
+    # Ouvrir l'application puis enchaîner les interactions
+    def parcourir(self, n_interactions, debut_test):
+        self.executer('ouverture', debut_test)
+        actions = {'page': self.changer_de_page, 'widget': self.manipuler_widget, 'projet': self.changer_de_projet}
+        for _ in range(n_interactions):
+            if self.pause:
+                time.sleep(self.rng.uniform(0, self.pause))
+            interaction = actions[self.rng.choices(list(INTERACTIONS), weights=list(INTERACTIONS.values()))[0]]()
+            self.executer(interaction or 'rafraichissement', debut_test)
+        return self.mesures
+
+# Fonction pour résumer les latences par interaction et par page
+def resumer_latences(mesures):
+    lignes = []
+    for (interaction, page), groupe in mesures.groupby(['interaction', 'page']):
+        ligne = {'interaction': interaction, 'page': page, 'nombre': len(groupe), 'erreurs': int(groupe['erreur'].notna().sum())}
+        ligne.update({f'p{p}': round(float(np.percentile(groupe['secondes'], p)), 3) for p in PERCENTILES})
+        ligne['max'] = round(float(groupe['secondes'].max()), 3)
+        lignes.append(ligne)
+    return pd.DataFrame(lignes).sort_values(['interaction', 'p95'], ascending=[True, False])
+
+def main():
+    parser = argparse.ArgumentParser(description="Test de charge de l'application avec des sessions simulées")
+    parser.add_argument('--sessions', type=int, default=10, help="nombre de sessions simultanées")
+    parser.add_argument('--interactions', type=int, default=20, help="nombre d'interactions par session après l'ouverture")
+    parser.add_argument('--montee', type=float, default=0.0, help="durée (s) sur laquelle les sessions démarrent progressivement")
+    parser.add_argument('--pause', type=float, default=0.0, help="pause maximale (s) entre deux interactions d'une session")
+    parser.add_argument('--delai', type=float, default=300.0, help="délai maximal (s) d'une exécution de l'application")
+    parser.add_argument('--graine', type=int, default=0, help="graine des parcours simulés")
+    parser.add_argument('--sortie', help="fichier JSON où enregistrer les mesures détaillées")
+    arguments = parser.parse_args()
+    if not streamlit.__version__.startswith(VERSION_STREAMLIT + '.'):
+        parser.error(f"le test de charge est vérifié avec Streamlit {VERSION_STREAMLIT}, installé : {streamlit.__version__}")
+
+    # Les chemins des projets et du logo sont relatifs au dossier de l'application, comme avec streamlit run
+    sortie = os.path.abspath(arguments.sortie) if arguments.sortie else None
+    os.chdir(os.path.dirname(APPLICATION))
+
+    debut_test = time.perf_counter()
+    suivi = SuiviMemoire(debut_test)
+    suivi.start()
+
+    def lancer(numero):
+        time.sleep(arguments.montee * numero / max(arguments.sessions, 1))
+        return Session(numero, arguments.graine, arguments.delai, arguments.pause).parcourir(arguments.interactions, debut_test)
+
+    with ThreadPoolExecutor(max_workers=arguments.sessions, thread_name_prefix='session') as executeur:
+        resultats = list(executeur.map(lancer, range(arguments.sessions)))
+    duree = time.perf_counter() - debut_test
+    suivi.arreter()
+
+    mesures = pd.DataFrame([mesure for session in resultats for mesure in session])
+    latences = resumer_latences(mesures)
+    memoire = pd.DataFrame(suivi.echantillons, columns=['secondes', 'mo'])
+
+    pd.set_option('display.width', 200)
+    pd.set_option('display.max_colwidth', 45)
+    print(latences.to_string(index=False))
+    print(f"\n{arguments.sessions} sessions, {len(mesures)} interactions en {duree:.1f} s : {len(mesures) / duree:.2f} interactions/s, "
+          f"{int(mesures['erreur'].notna().sum())} erreurs")
+    print("Latence globale : " + ", ".join(f"p{p} {np.percentile(mesures['secondes'], p):.3f} s" for p in PERCENTILES))
+    print(f"Mémoire du processus : début {memoire['mo'].iloc[0]:.0f} Mo, pic {memoire['mo'].max():.0f} Mo, fin {memoire['mo'].iloc[-1]:.0f} Mo")
+
+    if sortie:
+        with open(sortie, 'w', encoding='utf-8') as fichier:
+            json.dump({
+                'sessions': arguments.sessions,
+                'interactions_par_session': arguments.interactions,
+                'duree': round(duree, 2),
+                'debit': round(len(mesures) / duree, 3),
+                'latences': latences.to_dict(orient='records'),
+                'memoire': suivi.echantillons,
+                'mesures': mesures.to_dict(orient='records')
+            }, fichier, indent=2, ensure_ascii=False)
+
+if __name__ == '__main__':
+    main()
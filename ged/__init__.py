@@ -0,0 +1,15 @@
+# Noyau partagé des tableaux de bord GED : chargement, prétraitement et agrégations
+import importlib
+
+# Raccourcis vers les fonctions principales du noyau. Ils sont résolus au premier accès : importer
+# le paquet (par exemple pour l'interface) ne doit pas importer pandas
+_RACCOURCIS = {
+    'charger_donnees': 'ged.chargement',
+    'pretraiter_donnees': 'ged.pretraitement',
+    'DonneesProjet': 'ged.projet'
+}
+
+def __getattr__(nom):
+    if nom in _RACCOURCIS:
+        return getattr(importlib.import_module(_RACCOURCIS[nom]), nom)
+    raise AttributeError(f"module 'ged' has no attribute {nom!r}")
@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+
+from ged.identite import COLONNE_ID
+from ged.jours_ouvres import duree_en_jours
+from ged.profilage import mesure
+
+# Nombre de jours couverts par chaque période d'analyse
+PERIODES = {'6m': 180, '12m': 365, 'all': None}
+
+EPOCH = pd.Timestamp('1970-01-01')
+
+# Nombre maximal de points aberrants envoyés par catégorie dans une boîte à moustaches (les plus éloignés de la médiane)
+POINTS_ABERRANTS_MAX = 30
+
+# Quantiles proposés à côté de la moyenne et du maximum
+QUANTILES = {'median': 0.5, 'p90': 0.9}
+
+# Fonction pour calculer les noeuds et les liens du diagramme Sankey
+@mesure('agregation')
+def flux_documents(donnees):
+    pourcentages = donnees['INDICE'].value_counts(normalize=True) * 100
+    map_pourcentage_indice = {indice: f"{indice} ({pourcentage:.2f}%)" for indice, pourcentage in pourcentages.items()}
+    etapes = [donnees['PROJET'], donnees['EMET'], donnees['TYPE DE DOCUMENT'], donnees['INDICE'].map(map_pourcentage_indice)]
+
+    tous_les_noeuds = pd.concat(etapes).unique()
+    index_noeuds = pd.Series(index=tous_les_noeuds, data=range(len(tous_les_noeuds)))
+
+    # Un lien par couple (source, cible) pondéré par le nombre de documents, plutôt qu'un lien par ligne
+    paires = pd.concat([pd.DataFrame({'source': amont.to_numpy(), 'cible': aval.to_numpy()}) for amont, aval in zip(etapes, etapes[1:])])
+    liens = paires.groupby(['source', 'cible'], sort=False).size().reset_index(name='valeur')
+    liens['source'] = index_noeuds[liens['source']].to_numpy()
+    liens['cible'] = index_noeuds[liens['cible']].to_numpy()
+    return tous_les_noeuds.tolist(), liens
+
+# Fonction pour compter les documents déposés par mois et par type
+@mesure('agregation')
+def evolution_types(donnees, mois=None):
+    if mois is None:
+        mois = donnees['Date dépôt GED'].dt.to_period("M")
+    donnees_groupees = donnees.groupby([mois.rename('Date dépôt GED'), 'TYPE DE DOCUMENT']).size().reset_index(name='Nombre de documents')
+    donnees_groupees['Date dépôt GED'] = donnees_groupees['Date dépôt GED'].dt.to_timestamp()
+    return donnees_groupees
+
+# Fonction pour compter les documents selon une ou plusieurs colonnes
+@mesure('agregation')
+def repartition(donnees, colonnes):
+    return donnees.groupby(colonnes).size().reset_index(name='Nombre de documents')
+
+# Fonction pour calculer la masse de documents de chaque projet sur la période choisie, à partir de l'index
+# des jours de dépôt triés de chaque projet : deux recherches dichotomiques par projet
+@mesure('agregation')
+def masse_documents(jours_par_projet, periode):
+    donnees_barre = []
+    for projet, jours in jours_par_projet.items():
+        jours = jours.to_numpy()
+        if len(jours) == 0:
+            continue
+        jour_debut = jours[0]
+        jour_fin = jour_debut + PERIODES[periode] if PERIODES[periode] is not None else jours[-1]  # Toute la période
+        total_documents = int(np.searchsorted(jours, jour_fin, side='right') - np.searchsorted(jours, jour_debut, side='left'))
+        donnees_barre.append(ligne_masse(projet, jour_debut, jour_fin, total_documents))
+    return tableau_masse(donnees_barre)
+
+# Fonction pour décrire la masse d'un projet à partir des jours (depuis 1970) de début et de fin de la période
+def ligne_masse(projet, jour_debut, jour_fin, total_documents):
+    return {
+        'Chantier': projet,
+        'Masse de documents': total_documents,
+        'Date début': (EPOCH + pd.Timedelta(days=int(jour_debut))).strftime('%d %b %Y'),
+        'Date fin': (EPOCH + pd.Timedelta(days=int(jour_fin))).strftime('%d %b %Y')
+    }
+
+# Fonction pour mettre en forme la masse de documents par projet, triée, avec la médiane des projets
+def tableau_masse(donnees_barre):
+    df_barre = pd.DataFrame(donnees_barre, columns=['Chantier', 'Masse de documents', 'Date début', 'Date fin'])
+    df_barre = df_barre.sort_values(by='Masse de documents', ascending=False)
+    df_barre['mediane'] = df_barre['Masse de documents'].median()
+    return df_barre
+
+# Fonction pour calculer la moyenne, le maximum, la médiane ou le p90 d'une colonne par catégorie
+@mesure('agregation')
+def statistique_par_categorie(donnees, categorie, colonne, type_calcul):
+    groupes = donnees.groupby(categorie)[colonne]
+    resultats = (groupes.quantile(QUANTILES[type_calcul]) if type_calcul in QUANTILES else groupes.agg(type_calcul)).reset_index()
+    return resultats.sort_values(by=colonne, ascending=False)
+
+# Fonction pour calculer les boîtes à moustaches d'une colonne par catégorie : quartiles, moustaches à 1,5 écart
+# interquartile (ramenées à la valeur la plus extrême comprise dans cet intervalle, comme Plotly) et points
+# aberrants, limités aux POINTS_ABERRANTS_MAX plus éloignés de la médiane dans chaque catégorie
+@mesure('agregation')
+def statistiques_boites(donnees, categorie, colonne):
+    valeurs = donnees[[categorie, colonne]].dropna()
+    groupes = valeurs.groupby(categorie, observed=True)[colonne]
+    boites = groupes.quantile([0.25, 0.5, 0.75]).unstack()
+    boites.columns = ['q1', 'mediane', 'q3']
+    boites['moyenne'] = groupes.mean()
+    boites['effectif'] = groupes.size()
+    ecart = 1.5 * (boites['q3'] - boites['q1'])
+
+    # Moustaches : valeurs extrêmes comprises entre q1 - 1,5 EI et q3 + 1,5 EI
+    par_ligne = pd.DataFrame({'basse': boites['q1'] - ecart, 'haute': boites['q3'] + ecart, 'mediane': boites['mediane']}).loc[valeurs[categorie]]
+    y = valeurs[colonne].to_numpy()
+    dans_bornes = (y >= par_ligne['basse'].to_numpy()) & (y <= par_ligne['haute'].to_numpy())
+    moustaches = valeurs[dans_bornes].groupby(categorie, observed=True)[colonne].agg(['min', 'max'])
+    boites['moustache_basse'], boites['moustache_haute'] = moustaches['min'], moustaches['max']
+
+    aberrants = valeurs[~dans_bornes].assign(distance=np.abs(y - par_ligne['mediane'].to_numpy())[~dans_bornes])
+    boites['aberrants'] = aberrants.groupby(categorie, observed=True).size().reindex(boites.index, fill_value=0)
+    aberrants = aberrants.sort_values('distance', ascending=False, kind='stable').groupby(categorie, observed=True).head(POINTS_ABERRANTS_MAX)
+    return boites.reset_index(), aberrants[[categorie, colonne]].reset_index(drop=True)
+
+# Fonction pour calculer les durées entre indices successifs de chaque document, en jours calendaires ou
+# en jours ouvrés du calendrier donné
+@mesure('agregation')
+def durees_entre_indices(donnees, calendrier=None):
+    ordonnees = donnees.sort_values(by=['TYPE DE DOCUMENT', COLONNE_ID, 'INDICE'])
+    groupe = ordonnees.groupby(COLONNE_ID)
+    durees = pd.DataFrame({
+        'Type de Document': ordonnees['TYPE DE DOCUMENT'],
+        'Document': ordonnees['Libellé du document'],
+        'Passage indice': groupe['INDICE'].shift(1) + ' à ' + ordonnees['INDICE'],
+        'Durée entre indices (jours)': duree_depuis_indice_precedent(ordonnees, calendrier)
+    })
+    return durees[durees['Durée entre indices (jours)'].notna()].reset_index(drop=True)
+
+# Fonction pour calculer la durée de chaque ligne depuis l'indice précédent du même document (NaN pour le premier indice)
+def duree_depuis_indice_precedent(donnees, calendrier=None):
+    ordonnees = donnees.sort_values(by=[COLONNE_ID, 'INDICE'])
+    precedent = ordonnees.groupby(COLONNE_ID)['Date dépôt GED'].shift(1)
+    return duree_en_jours(precedent, ordonnees['Date dépôt GED'], calendrier).reindex(donnees.index)
+
+# Fonction pour préparer les données du diagramme de Gantt, avec la durée de chaque catégorie en jours
+# calendaires ou en jours ouvrés du calendrier donné
+@mesure('agregation')
+def calendrier(donnees, categorie, calendrier_ouvre=None):
+    donnees_gantt = donnees.groupby(categorie).agg({
+        'Date dépôt GED': ['min', 'max'],
+        'Libellé du document': 'count'
+    }).reset_index()
+    donnees_gantt.columns = [categorie, 'Date début', 'Date fin', 'Nombre de documents']
+    donnees_gantt['Durée en jours'] = duree_en_jours(donnees_gantt['Date début'], donnees_gantt['Date fin'], calendrier_ouvre)
+
+    # Ajouter les types de documents utilisés pour chaque catégorie dans l'ordre d'apparition
+    colonnes = list(dict.fromkeys([categorie, 'TYPE DE DOCUMENT']))
+    premieres_apparitions = donnees.sort_values(by='Date dépôt GED', kind='stable')[colonnes].drop_duplicates()
+    types_documents = premieres_apparitions.groupby(categorie)['TYPE DE DOCUMENT'].agg(', '.join)
+    donnees_gantt['Types de documents'] = donnees_gantt[categorie].map(types_documents)
+
+    # Trier les catégories par date de début
+    donnees_gantt = donnees_gantt.sort_values('Date début')
+
+    # S'assurer que les barres sont affichées même si la durée est nulle
+    donnees_gantt['Date fin'] = donnees_gantt['Date fin'].where(donnees_gantt['Date fin'] > donnees_gantt['Date début'], donnees_gantt['Date début'] + pd.Timedelta(days=1))
+    return donnees_gantt
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from ged.profilage import mesure
+
+# Niveaux d'alerte : le code de sévérité sert d'indice dans les listes de libellés et de couleurs
+LIBELLES_ALERTE_1 = ["Tout va bien", "Attention ! Des indices à surveiller", "Alerte !!! Trop d’indice à haut risque !!!"]
+COULEURS_ALERTE_1 = ["lightgreen", "yellow", "red"]
+LIBELLES_ALERTE_2 = ["Tout va bien !", "Attention ! Des indices à surveiller"]
+COULEURS_ALERTE_2 = ["lightgreen", "orange"]
+
+# Styles CSS correspondant à chaque code d'alerte
+STYLES_ALERTE_1 = np.array([f'background-color: {couleur}' for couleur in COULEURS_ALERTE_1])
+STYLES_ALERTE_2 = np.array([f'background-color: {couleur}' for couleur in COULEURS_ALERTE_2])
+
+# Seuils : moins de 3 indices -> code 0, de 3 à 6 -> code 1, au-delà -> code 2
+SEUILS_ALERTE_1 = [3, 7]
+# Seuil minimal (en %) pour la somme des deux principales proportions
+SEUIL_ALERTE_2 = 80
+
+# Fonction pour déterminer les codes d'alerte en fonction du nombre d'indices
+def determiner_codes_alerte(comptes):
+    return np.digitize(comptes, SEUILS_ALERTE_1).astype('int8')
+
+# Fonction pour construire la colonne catégorielle des libellés à partir des codes
+def libelles_depuis_codes(codes, libelles):
+    return pd.Categorical.from_codes(codes, categories=libelles)
+
+# Fonction pour calculer le récapitulatif d'alerte par LOT ou par TYPE DE DOCUMENT
+@mesure('agregation')
+def calculer_alertes(df, group_column):
+    total_indices = df.groupby(group_column).size().rename(f"Total Indices par {group_column}")
+    indices_groupes = df.groupby([group_column, 'INDICE']).size().reset_index(name="Nombre de documents")
+    indices_groupes = indices_groupes.merge(total_indices, on=group_column)
+    indices_groupes['Proportion'] = (indices_groupes['Nombre de documents'] / indices_groupes[f"Total Indices par {group_column}"] * 100).round(2)
+
+    top_deux_indices = indices_groupes.sort_values(by=[group_column, 'Proportion'], ascending=[True, False]).groupby(group_column).head(2)
+    somme_proportions_top_deux = top_deux_indices.groupby(group_column)['Proportion'].sum().reset_index(name='Somme des deux principales proportions')
+    somme_arrondie = somme_proportions_top_deux['Somme des deux principales proportions'].round(0).astype(int)
+    somme_proportions_top_deux['Somme des deux principales proportions'] = somme_arrondie.astype(str) + '%'
+    somme_proportions_top_deux['Code Alerte 2'] = (somme_arrondie < SEUIL_ALERTE_2).astype('int8')
+
+    indices_uniques = df.groupby(group_column)['INDICE'].nunique().reset_index(name='Compteur Indice')
+    dernier_indice = df.sort_values(by=[group_column, 'INDICE'], ascending=[True, False]).drop_duplicates(subset=group_column, keep='first')[[group_column, 'INDICE']].rename(columns={'INDICE': 'Dernier Indice'})
+
+    donnees_finales = somme_proportions_top_deux.merge(indices_uniques, on=group_column)
+    donnees_finales = donnees_finales.merge(dernier_indice, on=group_column)
+    donnees_finales['Code Alerte 1'] = determiner_codes_alerte(donnees_finales['Compteur Indice'].to_numpy())
+    donnees_finales['Alerte 1'] = libelles_depuis_codes(donnees_finales['Code Alerte 1'], LIBELLES_ALERTE_1)
+    donnees_finales['Alerte 2'] = libelles_depuis_codes(donnees_finales['Code Alerte 2'], LIBELLES_ALERTE_2)
+
+    colonnes_ordonnees = [group_column, 'Compteur Indice', 'Dernier Indice', 'Alerte 1', 'Somme des deux principales proportions', 'Alerte 2', 'Code Alerte 1', 'Code Alerte 2']
+    return donnees_finales[colonnes_ordonnees]
+
+# Fonction pour compter les lignes par niveau d'alerte
+def comptes_par_niveau(codes, libelles):
+    return np.bincount(codes, minlength=len(libelles))
@@ -0,0 +1,124 @@
+# Base analytique optionnelle (GED_BASE_ANALYTIQUE=chemin du fichier SQLite).
+# Chaque projet y est copié une seule fois, à son premier chargement, puis recopié seulement si son export
+# change. Les questions qui portent sur plusieurs projets sont posées en SQL sur la table des documents,
+# indexée par projet puis par date, et sur la table des esquisses de durées (voir quantiles), indexée par
+# projet puis par durée, sans charger le tableau pandas de chaque projet sélectionné.
+import os
+import sqlite3
+import threading
+from contextlib import closing
+
+from ged.config import BASE_ANALYTIQUE
+from ged.profilage import mesure
+
+# Version du schéma : une base d'une version antérieure est vidée, ses projets y sont recopiés au premier chargement
+VERSION_SCHEMA = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projets (cle TEXT PRIMARY KEY, nom TEXT, signature TEXT, lignes INTEGER);
+CREATE TABLE IF NOT EXISTS documents (cle TEXT NOT NULL, jour INTEGER, lot TEXT, type_document TEXT);
+CREATE INDEX IF NOT EXISTS documents_cle_jour ON documents (cle, jour);
+CREATE TABLE IF NOT EXISTS esquisses (cle TEXT NOT NULL, ouvres INTEGER, duree TEXT, type_document TEXT, lot TEXT, jours INTEGER, effectif INTEGER);
+CREATE INDEX IF NOT EXISTS esquisses_cle_duree ON esquisses (cle, ouvres, duree);
+"""
+
+# Colonnes de la base pour les catégories des esquisses
+COLONNES_CATEGORIE = {'TYPE DE DOCUMENT': 'type_document', 'LOT': 'lot'}
+
+# Une seule écriture à la fois dans la base pour tout le processus. Le schéma est créé sous un verrou à part,
+# à la première connexion, qui peut être ouverte par une écriture qui tient déjà _verrou
+_verrou = threading.Lock()
+_verrou_schema = threading.Lock()
+_schema_cree = False
+
+# La base analytique est-elle configurée ?
+def active():
+    return BASE_ANALYTIQUE is not None
+
+# Ouvrir une connexion à la base (une par opération : les connexions SQLite ne se partagent pas entre threads)
+def connexion():
+    global _schema_cree
+    base = sqlite3.connect(BASE_ANALYTIQUE, timeout=60)
+    if not _schema_cree:
+        with _verrou_schema:
+            if not _schema_cree:
+                if base.execute('PRAGMA user_version').fetchone()[0] < VERSION_SCHEMA:
+                    base.executescript('DROP TABLE IF EXISTS projets; DROP TABLE IF EXISTS documents; DROP TABLE IF EXISTS esquisses;')
+                    base.execute(f'PRAGMA user_version = {VERSION_SCHEMA}')
+                base.executescript(SCHEMA)
+                _schema_cree = True
+    return base
+
+# Signature d'une source : taille et date de modification d'un fichier configuré. Un fichier téléchargé
+# est déjà identifié par son contenu dans sa clé
+def signature(source):
+    if isinstance(source, str):
+        etat = os.stat(source)
+        return f'{etat.st_size}:{etat.st_mtime_ns}'
+    return 'contenu'
+
+# Le projet est-il dans la base avec cette signature ?
+def a_jour(cle, signature_source):
+    with closing(connexion()) as base:
+        ligne = base.execute('SELECT signature FROM projets WHERE cle = ?', (cle,)).fetchone()
+    return ligne is not None and ligne[0] == signature_source
+
+# Fonction pour convertir un tableau en tuples de valeurs Python, les valeurs manquantes devenant NULL
+def lignes_sql(tableau):
+    return tableau.astype(object).where(tableau.notna(), None).itertuples(index=False, name=None)
+
+# Copier (ou remplacer) les documents d'un projet prétraité et ses esquisses de durées ({ouvres: esquisses}) dans la base
+@mesure('base analytique')
+def ingerer(cle, nom, signature_source, donnees, esquisses):
+    import pandas as pd
+    jours = (donnees['Date dépôt GED'] - pd.Timestamp('1970-01-01')).dt.days
+    colonnes = pd.DataFrame({'jour': jours.astype('Int64'), 'lot': donnees['LOT'], 'type_document': donnees['TYPE DE DOCUMENT']})
+    with _verrou, closing(connexion()) as base, base:
+        base.execute('DELETE FROM documents WHERE cle = ?', (cle,))
+        base.executemany('INSERT INTO documents VALUES (?, ?, ?, ?)', ((cle,) + ligne for ligne in lignes_sql(colonnes)))
+        base.execute('DELETE FROM esquisses WHERE cle = ?', (cle,))
+        for ouvres, esquisse in esquisses.items():
+            lignes = lignes_sql(esquisse[['Durée', 'TYPE DE DOCUMENT', 'LOT', 'Jours', 'Effectif']])
+            base.executemany('INSERT INTO esquisses VALUES (?, ?, ?, ?, ?, ?, ?)', ((cle, int(ouvres)) + ligne for ligne in lignes))
+        base.execute('INSERT OR REPLACE INTO projets VALUES (?, ?, ?, ?)', (cle, nom, signature_source, len(donnees)))
+
+# Fonction pour calculer la masse de documents de chaque projet sur la période choisie, en une requête
+@mesure('base analytique')
+def masse_documents(cles_par_projet, periode):
+    from ged.agregations import PERIODES, ligne_masse, tableau_masse
+    cles = sorted(set(cles_par_projet.values()))
+    requete = f"""
+        WITH bornes AS (
+            SELECT cle, MIN(jour) AS debut, MAX(jour) AS fin FROM documents
+            WHERE cle IN ({', '.join('?' * len(cles))}) GROUP BY cle
+        )
+        SELECT cle, debut, COALESCE(debut + ?, fin) AS fin_periode,
+            (SELECT COUNT(*) FROM documents
+             WHERE documents.cle = bornes.cle AND jour BETWEEN debut AND COALESCE(debut + ?, fin)) AS masse
+        FROM bornes WHERE debut IS NOT NULL
+    """
+    with closing(connexion()) as base:
+        parametres = cles + [PERIODES[periode]] * 2
+        resultats = {cle: (debut, fin, masse) for cle, debut, fin, masse in base.execute(requete, parametres)}
+    return tableau_masse([ligne_masse(projet, *resultats[cle]) for projet, cle in cles_par_projet.items() if cle in resultats])
+
+# Fonction pour comparer une durée entre projets à partir des esquisses de la base : les histogrammes par catégorie
+# de chaque projet et de leur ensemble sont fusionnés en une requête, les statistiques sont lues sur ces histogrammes
+@mesure('base analytique')
+def durees_par_projet(cles_par_projet, duree, categorie, type_calcul, ouvres=False):
+    import pandas as pd
+    from ged.quantiles import statistique_esquisse, tableau_durees
+    cles = sorted(set(cles_par_projet.values()))
+    colonne = COLONNES_CATEGORIE[categorie]
+    selection = f"FROM esquisses WHERE cle IN ({', '.join('?' * len(cles))}) AND ouvres = ? AND duree = ?"
+    requete = f"""
+        SELECT cle, {colonne}, jours, SUM(effectif) {selection} GROUP BY cle, {colonne}, jours
+        UNION ALL
+        SELECT NULL, {colonne}, jours, SUM(effectif) {selection} GROUP BY {colonne}, jours
+    """
+    with closing(connexion()) as base:
+        parametres = (cles + [int(ouvres), duree]) * 2
+        histogrammes = pd.DataFrame(base.execute(requete, parametres).fetchall(), columns=['cle', categorie, 'Jours', 'Effectif'])
+    ensemble = statistique_esquisse(histogrammes[histogrammes['cle'].isna()], categorie, type_calcul)
+    statistiques = {projet: statistique_esquisse(histogrammes[histogrammes['cle'] == cle], categorie, type_calcul) for projet, cle in cles_par_projet.items()}
+    return ensemble, tableau_durees(ensemble, statistiques, categorie)
@@ -0,0 +1,102 @@
+import hashlib
+import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from ged import base_analytique
+from ged.config import BUDGET_MEMOIRE_MO, PRECHARGEMENT_THREADS
+from ged.entrepot import EntrepotProjets
+from ged.projet import DonneesProjet
+
+# Vérifier qu'une session Streamlit est toujours ouverte
+def session_active(session_id):
+    return runtime.exists() and runtime.get_instance().is_active_session(session_id)
+
+# Entrepôt unique pour tout le processus, partagé par toutes les sessions
+@st.cache_resource(show_spinner=False)
+def entrepot():
+    return EntrepotProjets(BUDGET_MEMOIRE_MO * 2**20, session_active=session_active)
+
+# Taille des blocs lus pour calculer l'empreinte d'un fichier téléchargé
+TAILLE_BLOC_EMPREINTE = 2**20
+
+# Empreinte SHA-256 du contenu d'un fichier téléchargé, calculée bloc par bloc une seule fois par téléchargement
+@st.cache_resource(show_spinner=False, max_entries=256)
+def empreinte_telechargement(file_id, _file):
+    empreinte = hashlib.sha256()
+    _file.seek(0)
+    for bloc in iter(lambda: _file.read(TAILLE_BLOC_EMPREINTE), b''):
+        empreinte.update(bloc)
+    _file.seek(0)
+    return empreinte.hexdigest()
+
+# Clé de l'entrepôt correspondant à une source de projet. Les fichiers téléchargés sont identifiés par
+# leur contenu : un même export téléchargé sous un autre nom ou par une autre session n'est chargé qu'une fois
+def cle_source(source):
+    if isinstance(source, str):
+        return ('fichier', source)
+    return ('contenu', empreinte_telechargement(source.file_id, source))
+
+# Charger et prétraiter un export. pandas n'est importé qu'au premier chargement, le plus souvent
+# dans un thread de préchargement, pour ne pas retarder l'affichage du menu au démarrage
+def construire_projet(nom, source):
+    from ged.chargement import charger_donnees
+    from ged.pretraitement import pretraiter_donnees
+    from ged.quantiles import esquisses_projet
+    from ged.recherche import index_texte
+    from ged.visas import indexer_visas
+    projet = DonneesProjet(nom, pretraiter_donnees(charger_donnees(source)))
+    indexer_visas(projet)
+    index_texte(projet)
+    esquisses_projet(projet)
+    projet.index_filtres()
+    if base_analytique.active():
+        projet_dans_base(nom, source, projet)
+    return projet
+
+# Fonction pour copier un projet dans la base analytique s'il n'y est pas à jour, et renvoyer sa clé dans la base.
+# Le projet n'est chargé que s'il doit être copié
+def projet_dans_base(nom, source, projet=None):
+    cle = '/'.join(cle_source(source))
+    signature = base_analytique.signature(source)
+    if not base_analytique.a_jour(cle, signature):
+        from ged.quantiles import esquisses_projet
+        if projet is None:
+            projet = obtenir_projet(source)
+        esquisses = {ouvres: esquisses_projet(projet, ouvres) for ouvres in (False, True)}
+        base_analytique.ingerer(cle, nom, signature, projet.donnees, esquisses)
+    return cle
+
+# Charger et prétraiter un projet configuré : une seule copie par fichier pour tout le processus
+def charger_projet(chemin_fichier):
+    return entrepot().obtenir(cle_source(chemin_fichier), chemin_fichier, lambda: construire_projet(chemin_fichier, chemin_fichier))
+
+# Charger et prétraiter un projet depuis un fichier téléchargé
+def charger_projet_uploaded(file):
+    def charger():
+        file.seek(0)
+        return construire_projet(file.name, file)
+    return entrepot().obtenir(cle_source(file), file.name, charger)
+
+# Lancer, une seule fois par processus, le chargement de tous les projets configurés en arrière-plan
+@st.cache_resource(show_spinner=False)
+def demarrer_prechargement(projets):
+    executeur = ThreadPoolExecutor(max_workers=PRECHARGEMENT_THREADS, thread_name_prefix='prechargement')
+    taches = {nom: executeur.submit(charger_projet, chemin) for nom, chemin in projets}
+    executeur.shutdown(wait=False)
+    return taches
+
+# Fonction pour obtenir le projet prétraité (DonneesProjet), quelle que soit sa source
+def obtenir_projet(source):
+    with st.spinner("Chargement du projet..."):
+        if isinstance(source, str):
+            return charger_projet(source)
+        return charger_projet_uploaded(source)
+
+# Fonction pour obtenir le projet sélectionné par la session et le protéger de l'éviction
+def obtenir_projet_session(source):
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        entrepot().attacher(ctx.session_id, cle_source(source))
+    return obtenir_projet(source)
@@ -0,0 +1,56 @@
+import gzip
+import zipfile
+
+import pandas as pd
+
+from ged.config import ENCODAGE, SEPARATEUR, SPEC_TYPES, FORMAT_DATE
+from ged.profilage import mesure
+
+# Les vues des projets partagés reposent sur le mode copy-on-write de pandas
+pd.set_option('mode.copy_on_write', True)
+
+# Fonction pour obtenir le nom d'une source (chemin ou fichier téléchargé)
+def nom_source(source):
+    return source if isinstance(source, str) else source.name
+
+# Fonction pour ouvrir un fichier zstd en flux. Le module zstandard n'est requis que pour ces exports
+def flux_zstd(fichier):
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("Le module zstandard est nécessaire pour lire les exports .zst (pip install zstandard)") from None
+    return zstandard.ZstdDecompressor().stream_reader(fichier, closefd=False)
+
+# Fonction pour parcourir les flux CSV d'une source. Les exports compressés sont décompressés au fil de la
+# lecture par le parseur, sans copie intermédiaire du contenu décompressé. Une archive zip peut contenir plusieurs CSV
+def flux_csv(source):
+    extension = nom_source(source).lower().rsplit('.', 1)[-1]
+    if extension == 'gz':
+        with gzip.open(source) as flux:
+            yield flux
+    elif extension == 'zst':
+        if isinstance(source, str):
+            with open(source, 'rb') as fichier, flux_zstd(fichier) as flux:
+                yield flux
+        else:
+            with flux_zstd(source) as flux:
+                yield flux
+    elif extension == 'zip':
+        with zipfile.ZipFile(source) as archive:
+            membres = sorted(membre for membre in archive.namelist() if membre.lower().endswith('.csv'))
+            if not membres:
+                raise ValueError(f"L'archive {nom_source(source)} ne contient aucun fichier CSV")
+            for membre in membres:
+                with archive.open(membre) as flux:
+                    yield flux
+    else:
+        yield source
+
+# Fonction pour charger les données depuis un fichier (chemin ou fichier téléchargé, CSV brut ou compressé)
+@mesure('chargement')
+def charger_donnees(source):
+    parties = [pd.read_csv(flux, encoding=ENCODAGE, sep=SEPARATEUR, dtype=SPEC_TYPES, low_memory=False) for flux in flux_csv(source)]
+    donnees = parties[0] if len(parties) == 1 else pd.concat(parties, ignore_index=True)
+    donnees['Date dépôt GED'] = pd.to_datetime(donnees['Date dépôt GED'], format=FORMAT_DATE, errors='coerce')
+    # En mode copy-on-write, read_csv renvoie un bloc par colonne : les regrouper une fois pour toutes
+    return donnees.copy()
@@ -0,0 +1,55 @@
+# Paramètres communs aux tableaux de bord GED
+import os
+
+# Les noms des projets et le chemin des fichiers.
+PROJETS = {
+    '40_LAFFITE': '40_LAFFITE.csv',
+    'LIGTHWELL': 'LIGTHWELL.csv',
+    'MDLF': 'MDLF.csv',
+    'GOODLIFE': 'GOODLIFE.csv',
+    'AXA_MAT': 'AXA_MAT.csv',
+    'LEDGER': 'LEDGER.csv',
+    'PECM': 'PECM.csv'
+}
+
+# Format des exports GED
+ENCODAGE = 'iso-8859-1'
+SEPARATEUR = ';'
+FORMAT_DATE = '%d/%m/%Y'
+
+# Extensions acceptées pour les exports téléchargés : CSV brut, gzip, archive zip d'un ou plusieurs CSV, zstd
+EXTENSIONS_EXPORT = ['csv', 'gz', 'zip', 'zst']
+
+# Spécification des types de données pour chaque colonne.
+SPEC_TYPES = {
+    'Date dépôt GED': str,
+    'TYPE DE DOCUMENT': str,
+    'PROJET': str,
+    'EMET': str,
+    'LOT': str,
+    'INDICE': str,
+    'Libellé du document': str
+}
+
+# Jours fériés exclus des durées en jours ouvrés : 'france' ou 'alsace-moselle' (Vendredi saint et 26 décembre en plus)
+CALENDRIER_FERIES = os.environ.get('GED_CALENDRIER_FERIES', 'france')
+
+# Fermetures de chantier exclues des durées en jours ouvrés, répétées chaque année : périodes ('MM-JJ', 'MM-JJ')
+# incluses, par nom de projet de PROJETS ou '*' pour tous les projets, par exemple {'*': [('08-01', '08-21')]}
+FERMETURES = {}
+
+# Nombre de projets chargés en parallèle au démarrage du serveur
+PRECHARGEMENT_THREADS = 4
+
+# Budget mémoire (en Mo) de l'entrepôt de projets partagé entre les sessions
+BUDGET_MEMOIRE_MO = int(os.environ.get('GED_BUDGET_MEMOIRE_MO', 2048))
+
+# Base analytique SQLite où chaque projet est copié une fois pour les comparaisons entre projets (désactivée si absente)
+BASE_ANALYTIQUE = os.environ.get('GED_BASE_ANALYTIQUE') or None
+
+# Profilage des exécutions (panneau dans la barre latérale et journal JSONL), désactivé par défaut
+PROFILAGE = os.environ.get('GED_PROFILAGE', '0') == '1'
+JOURNAL_PROFILAGE = os.environ.get('GED_JOURNAL_PROFILAGE', 'profilage.jsonl')
+
+# Logo affiché dans la barre latérale
+CHEMIN_LOGO = 'logo1.jpeg'
@@ -0,0 +1,43 @@
+import pandas as pd
+
+from ged.profilage import mesure
+
+COLONNE_CHEMIN = 'Chemin vers le fichier'
+SANS_DOSSIER = '(sans dossier)'
+
+# Fonction pour construire l'arbre des dossiers GED d'un projet : un arbre préfixe sur les chemins distincts,
+# puis, pour chaque dossier, le nombre de documents, le nombre d'indices distincts et les dates de dépôt
+# extrêmes de tout ce qu'il contient. Les lignes ne sont parcourues qu'une fois, par chemin distinct
+@mesure('pretraitement')
+def arbre_dossiers(donnees):
+    codes, chemins = pd.factorize(donnees[COLONNE_CHEMIN].fillna(SANS_DOSSIER))
+
+    # Arbre préfixe : chaque dossier reçoit un numéro de noeud, et chaque chemin la liste de ses dossiers
+    racine = {}
+    noeuds = []  # (chemin du dossier, nom, chemin du parent, profondeur)
+    paires = []  # (code du chemin, noeud d'un de ses dossiers)
+    for code, chemin in enumerate(chemins):
+        enfants, parent = racine, ''
+        for profondeur, dossier in enumerate([segment for segment in chemin.split('/') if segment] or [SANS_DOSSIER]):
+            if dossier not in enfants:
+                enfants[dossier] = (len(noeuds), {})
+                noeuds.append((f'{parent}/{dossier}', dossier, parent, profondeur))
+            numero, enfants = enfants[dossier]
+            parent = noeuds[numero][0]
+            paires.append((code, numero))
+    paires = pd.DataFrame(paires, columns=['code', 'noeud'])
+
+    # Statistiques par chemin distinct, cumulées ensuite sur tous les dossiers qui le contiennent
+    par_chemin = donnees.groupby(codes).agg(**{
+        'Documents': ('Date dépôt GED', 'size'),
+        'Date début': ('Date dépôt GED', 'min'),
+        'Date fin': ('Date dépôt GED', 'max')
+    })
+    par_noeud = paires.join(par_chemin, on='code').groupby('noeud').agg({'Documents': 'sum', 'Date début': 'min', 'Date fin': 'max'})
+    indices = pd.DataFrame({'code': codes, 'INDICE': donnees['INDICE'].to_numpy()}).drop_duplicates()
+    par_noeud['Indices'] = paires.merge(indices, on='code').groupby('noeud')['INDICE'].nunique()
+
+    arbre = pd.DataFrame(noeuds, columns=['Chemin', 'Dossier', 'Parent', 'Profondeur'])
+    arbre = arbre.join(par_noeud)
+    arbre['Indices'] = arbre['Indices'].fillna(0).astype('int64')
+    return arbre[['Chemin', 'Dossier', 'Parent', 'Profondeur', 'Documents', 'Indices', 'Date début', 'Date fin']]
@@ -0,0 +1,155 @@
+# Détection des documents déposés plusieurs fois sous des libellés presque identiques.
+# Comparer tous les libellés deux à deux est quadratique : chaque libellé normalisé reçoit une signature
+# MinHash calculée sur ses trigrammes de caractères, découpée en bandes. Deux documents ne sont comparés
+# que s'ils partagent une bande (LSH), puis retenus si leurs trigrammes sont assez proches et si leurs
+# libellés ne diffèrent que par des mots de bruit ajoutés (indice, copie, extension) ou mal orthographiés, pas
+# par un mot distinctif (« zone a » / « zone b », « poutres » / « poteaux », « paliers asc » en plus).
+import difflib
+import itertools
+import re
+
+import numpy as np
+import pandas as pd
+
+from ged.identite import COLONNE_ID, COLONNES_EMPLACEMENT, EXTENSIONS_FICHIER, normaliser_libelles
+from ged.profilage import mesure
+
+TAILLE_SHINGLE = 3
+
+# Signature MinHash : BANDES bandes de LIGNES_PAR_BANDE valeurs. Deux libellés de similarité s partagent
+# au moins une bande avec une probabilité 1 - (1 - s^4)^16, soit 50 % vers s = 0,5 et 99 % à s = 0,8
+BANDES = 16
+LIGNES_PAR_BANDE = 4
+PREMIER = 2**31 - 1
+GRAINE = 0
+
+# Similarité de Jaccard minimale entre les trigrammes de deux libellés
+SEUIL_SIMILARITE = 0.7
+
+# Similarité minimale entre un mot propre à un libellé et un mot de l'autre pour y voir une faute de frappe ou un pluriel
+SEUIL_SIMILARITE_MOT = 0.8
+
+# Nombre maximal de documents d'un même seau comparés deux à deux (au-delà, comparés au premier du seau)
+TAILLE_SEAU_MAX = 50
+
+MOT = re.compile(r'\w+')
+CHIFFRES = re.compile(r'\d+')
+
+# Mots qui ne distinguent pas deux documents : lettre d'indice, mention de révision, de copie ou de version
+# provisoire, extension de fichier
+MOTS_BRUIT = re.compile(r'[a-z]|ind|indice|rev|revision|v|version|bis|copie|copy|maj|provisoire|def|definitif|final|vf|' + '|'.join(EXTENSIONS_FICHIER))
+
+# Fonction pour découper un libellé normalisé en trigrammes de caractères
+def shingles(libelle):
+    return {libelle[i:i + TAILLE_SHINGLE] for i in range(max(len(libelle) - TAILLE_SHINGLE + 1, 1))}
+
+# Fonction pour calculer les signatures MinHash d'une liste d'ensembles de trigrammes. Les trigrammes sont
+# numérotés une fois, puis chaque fonction de hachage (a * x + b) mod p est appliquée à tous les trigrammes
+# d'une bande à la fois, le minimum étant pris par libellé
+def signatures_minhash(ensembles):
+    longueurs = np.array([len(ensemble) for ensemble in ensembles])
+    numeros, _ = pd.factorize(pd.Series([shingle for ensemble in ensembles for shingle in ensemble], dtype=object))
+    numeros = numeros.astype(np.int64)
+    debuts = np.concatenate([[0], np.cumsum(longueurs)[:-1]])
+    generateur = np.random.default_rng(GRAINE)
+    a = generateur.integers(1, PREMIER, (BANDES, LIGNES_PAR_BANDE))
+    b = generateur.integers(0, PREMIER, (BANDES, LIGNES_PAR_BANDE))
+    return np.stack([np.minimum.reduceat((numeros[:, None] * a[bande] + b[bande]) % PREMIER, debuts, axis=0) for bande in range(BANDES)], axis=1)
+
+# Fonction pour lister les paires de libellés d'un même bloc qui partagent au moins une bande de leur signature
+def paires_candidates(signatures, blocs):
+    paires = set()
+    for bande in range(signatures.shape[1]):
+        _, seaux = np.unique(np.column_stack([blocs, signatures[:, bande]]), axis=0, return_inverse=True)
+        # Seaux de plusieurs libellés : plages consécutives des libellés triés par seau
+        ordre = np.argsort(seaux.ravel(), kind='stable')
+        tries = seaux.ravel()[ordre]
+        debuts = np.flatnonzero(np.r_[True, tries[1:] != tries[:-1]])
+        fins = np.r_[debuts[1:], len(tries)]
+        for debut, fin in zip(debuts[fins - debuts > 1], fins[fins - debuts > 1]):
+            seau = ordre[debut:fin].tolist()
+            if len(seau) > TAILLE_SEAU_MAX:
+                paires.update((seau[0], autre) for autre in seau[1:])
+            else:
+                paires.update(itertools.combinations(seau, 2))
+    return paires
+
+# Fonction pour vérifier qu'une paire candidate désigne bien deux variantes d'un même libellé
+def variantes(libelle_a, libelle_b, shingles_a, shingles_b):
+    if len(shingles_a & shingles_b) < SEUIL_SIMILARITE * len(shingles_a | shingles_b):
+        return False
+    if CHIFFRES.findall(libelle_a) != CHIFFRES.findall(libelle_b):
+        return False
+    mots_a, mots_b = set(MOT.findall(libelle_a)), set(MOT.findall(libelle_b))
+    propres_a, propres_b = mots_a - mots_b, mots_b - mots_a
+    # Un libellé qui contient tous les mots de l'autre n'en est une variante que si ses mots en plus ne sont
+    # que du bruit (« plafond r+8 » et « plafond r+8 paliers asc » sont deux documents) ; sinon, chaque mot
+    # propre à l'un doit être une autre orthographe d'un mot propre à l'autre
+    if not propres_a or not propres_b:
+        return all(MOTS_BRUIT.fullmatch(mot) for mot in propres_a | propres_b)
+    return all(any(mot_similaire(mot, autre) for autre in autres) for mots, autres in [(propres_a, propres_b), (propres_b, propres_a)] for mot in mots)
+
+# Fonction pour reconnaître deux orthographes d'un même mot
+def mot_similaire(mot_a, mot_b):
+    return difflib.SequenceMatcher(None, mot_a, mot_b).ratio() >= SEUIL_SIMILARITE_MOT
+
+# Fonction pour regrouper les indices de paires liées en groupes (union-find)
+def composantes(nombre, paires):
+    parents = list(range(nombre))
+
+    def racine(i):
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    for i, j in paires:
+        parents[racine(i)] = racine(j)
+    return np.array([racine(i) for i in range(nombre)])
+
+# Fonction pour construire les groupes de doublons probables d'un projet : une ligne par document (identifiant
+# de document) appartenant à un groupe, décrit par sa dernière révision. Seuls les documents d'un même bloc
+# (type, lot, niveau et zone) sont comparés. Les groupes sont numérotés du plus grand au plus petit
+@mesure('pretraitement')
+def groupes_doublons(donnees):
+    colonnes_bloc = ['TYPE DE DOCUMENT', 'LOT'] + [colonne for colonne in COLONNES_EMPLACEMENT if colonne in donnees.columns]
+    documents = donnees.sort_values('Date dépôt GED').groupby(COLONNE_ID).agg(**{colonne: (colonne, 'last') for colonne in colonnes_bloc}, **{
+        'Libellé du document': ('Libellé du document', 'last'),
+        'Révisions': ('Date dépôt GED', 'size'),
+        'Indices': ('INDICE', 'nunique'),
+        'Premier dépôt': ('Date dépôt GED', 'min'),
+        'Dernier dépôt': ('Date dépôt GED', 'max')
+    })
+    documents = documents[documents['Libellé du document'].notna()]
+
+    # Les documents d'un bloc de même libellé normalisé sont déjà des doublons : seuls les couples
+    # (bloc, libellé) distincts sont comparés, chaque libellé distinct n'étant haché qu'une fois
+    libelles_normalises = normaliser_libelles(documents['Libellé du document'])
+    blocs = documents.groupby(colonnes_bloc, sort=False, dropna=False).ngroup().to_numpy()
+    codes_libelles, libelles = pd.factorize(libelles_normalises)
+    libelles = list(libelles)
+    codes = pd.DataFrame({'bloc': blocs, 'libelle': codes_libelles}).groupby(['bloc', 'libelle'], sort=False).ngroup().to_numpy()
+    premieres = np.unique(codes, return_index=True)[1]
+    blocs_unites, libelles_unites = blocs[premieres], codes_libelles[premieres]
+    ensembles = [shingles(libelle) for libelle in libelles]
+    paires = []
+    if len(premieres) > 1:
+        signatures = signatures_minhash(ensembles)[libelles_unites]
+        paires = [(i, j) for i, j in paires_candidates(signatures, blocs_unites) if variantes(libelles[libelles_unites[i]], libelles[libelles_unites[j]], ensembles[libelles_unites[i]], ensembles[libelles_unites[j]])]
+
+    groupes = pd.Series(composantes(len(premieres), paires)[codes], index=documents.index)[libelles_normalises != '']
+    groupes = groupes[groupes.map(groupes.value_counts()) > 1]
+    numeros = pd.Series(np.arange(1, groupes.nunique() + 1), index=groupes.value_counts().index)
+    documents = documents.loc[groupes.index, ['TYPE DE DOCUMENT', 'LOT', 'Libellé du document', 'Révisions', 'Indices', 'Premier dépôt', 'Dernier dépôt']]
+    documents.insert(0, 'Groupe', groupes.map(numeros))
+    return documents.sort_values(['Groupe', 'Premier dépôt'], ignore_index=True)
+
+# Fonction pour compter par LOT les groupes de doublons probables et les documents en trop
+def doublons_par_lot(groupes):
+    par_lot = groupes.groupby('LOT').agg(**{'Groupes': ('Groupe', 'nunique'), 'Documents': ('Groupe', 'size')})
+    par_lot['Documents en trop'] = par_lot['Documents'] - par_lot['Groupes']
+    return par_lot.reset_index().sort_values('Documents en trop', ascending=False, ignore_index=True)
+
+# Fonction pour obtenir les groupes de doublons probables d'un projet, calculés une seule fois par projet
+def doublons_probables(projet):
+    return projet.derivee('Doublons probables', groupes_doublons)
@@ -0,0 +1,126 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from ged import profilage
+
+# Entrepôt de projets partagé par toutes les sessions du processus.
+# Les projets (DonneesProjet) sont renvoyés sans copie : leurs données de base ne sont jamais modifiées.
+# Les projets sont évincés du moins récemment utilisé au plus récent dès que le budget
+# mémoire est dépassé, sauf ceux qui sont sélectionnés par une session active. Le budget est vérifié
+# à chaque chargement et chaque fois qu'un projet grandit (valeurs dérivées, projets filtrés).
+class EntrepotProjets:
+    def __init__(self, budget_octets, session_active=None):
+        self.budget_octets = budget_octets
+        self._session_active = session_active
+        self._verrou = threading.Lock()
+        self._projets = OrderedDict()  # clé -> {'nom', 'donnees', 'acces'}
+        self._en_cours = {}  # clé -> Future des chargements en cours
+        self._sessions = {}  # identifiant de session -> clé du projet sélectionné
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # Renvoyer le projet depuis l'entrepôt, ou le charger une seule fois même si plusieurs sessions le demandent
+    def obtenir(self, cle, nom, charger):
+        with self._verrou:
+            entree = self._projets.get(cle)
+            if entree is not None:
+                self._projets.move_to_end(cle)
+                entree['acces'] += 1
+                self.hits += 1
+                profilage.acces_cache('entrepot', nom, True)
+                return entree['donnees']
+            futur = self._en_cours.get(cle)
+            proprietaire = futur is None
+            if proprietaire:
+                self.misses += 1
+                futur = self._en_cours[cle] = Future()
+            else:
+                self.hits += 1
+            profilage.acces_cache('entrepot', nom, not proprietaire)
+
+        if not proprietaire:
+            return futur.result()
+
+        try:
+            donnees = charger()
+        except BaseException as erreur:
+            with self._verrou:
+                del self._en_cours[cle]
+            futur.set_exception(erreur)
+            raise
+
+        with self._verrou:
+            self._projets[cle] = {'nom': nom, 'donnees': donnees, 'acces': 1}
+            del self._en_cours[cle]
+        futur.set_result(donnees)
+        donnees.surveiller(lambda: self._evincer(cle))
+        self._evincer(cle)
+        return donnees
+
+    # Enregistrer le projet sélectionné par une session pour le protéger de l'éviction
+    def attacher(self, session_id, cle):
+        with self._verrou:
+            self._sessions[session_id] = cle
+
+    # Oublier les sessions fermées puis compter les sessions qui utilisent chaque projet
+    def _references(self):
+        if self._session_active is not None:
+            for session_id in [s for s in self._sessions if not self._session_active(s)]:
+                del self._sessions[session_id]
+        references = {}
+        for cle in self._sessions.values():
+            references[cle] = references.get(cle, 0) + 1
+        return references
+
+    # Photographie des projets (du moins récemment utilisé au plus récent) et de leur taille. Les tailles sont
+    # lues hors du verrou de l'entrepôt, qui n'attend jamais le verrou d'un projet
+    def _tailles(self):
+        with self._verrou:
+            entrees = list(self._projets.items())
+            references = self._references()
+        return [(cle, entree, entree['donnees'].octets()) for cle, entree in entrees], references
+
+    # Libérer d'abord les projets filtrés anciens (de simples sous-ensembles, vite reconstruits), puis évincer
+    # les projets les moins récemment utilisés tant que le budget est dépassé
+    def _evincer(self, cle_protegee):
+        tailles, references = self._tailles()
+        total = sum(octets for _, _, octets in tailles)
+        if total <= self.budget_octets:
+            return
+        for _, entree, _ in tailles:
+            entree['donnees'].alleger()
+        tailles, references = self._tailles()
+        total = sum(octets for _, _, octets in tailles)
+        if total <= self.budget_octets:
+            return
+        with self._verrou:
+            for cle, entree, octets in tailles:
+                if total <= self.budget_octets:
+                    break
+                if cle == cle_protegee or references.get(cle, 0) > 0 or self._projets.get(cle) is not entree:
+                    continue
+                del self._projets[cle]
+                total -= octets
+                self.evictions += 1
+
+    # Métriques de l'entrepôt : une ligne par projet, du plus récemment utilisé au plus ancien
+    def metriques(self):
+        import pandas as pd
+        tailles, references = self._tailles()
+        lignes = [{
+            'Projet': entree['nom'],
+            'Mémoire (Mo)': round(octets / 2**20, 2),
+            'Lignes': len(entree['donnees']),
+            'Accès': entree['acces'],
+            'Sessions': references.get(cle, 0)
+        } for cle, entree, octets in reversed(tailles)]
+        return {
+            'projets': pd.DataFrame(lignes, columns=['Projet', 'Mémoire (Mo)', 'Lignes', 'Accès', 'Sessions']),
+            'octets': sum(octets for _, _, octets in tailles),
+            'budget': self.budget_octets,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+from ged.profilage import mesure
+
+# Colonnes proposées dans les filtres, dans l'ordre de la barre latérale
+COLONNES_FILTRE = ['LOT', 'TYPE DE DOCUMENT', 'INDICE', 'EMET', 'Ajouté par', 'PHASE', 'ZONE']
+
+# Index bitmap d'un projet : pour chaque colonne filtrable, un bitmap par valeur (un bit par ligne, empaqueté
+# par octets). Une sélection de valeurs dans une colonne est un OU de leurs bitmaps, une combinaison de
+# colonnes un ET des résultats : aucun filtre ne reparcourt les colonnes de texte.
+class IndexBitmap:
+    def __init__(self, donnees):
+        self.nombre_lignes = len(donnees)
+        self.valeurs = {}  # colonne -> valeurs triées
+        self._bitmaps = {}  # colonne -> tableau (nombre de valeurs, octets par bitmap)
+        for colonne in COLONNES_FILTRE:
+            if colonne not in donnees.columns:
+                continue
+            codes, valeurs = pd.factorize(donnees[colonne], sort=True)
+            self.valeurs[colonne] = valeurs
+            self._bitmaps[colonne] = np.stack([np.packbits(codes == code) for code in range(len(valeurs))]) if len(valeurs) else self._vide()[None, :]
+
+    # Bitmap sans aucune ligne
+    def _vide(self):
+        return np.zeros((self.nombre_lignes + 7) // 8, dtype=np.uint8)
+
+    # Bitmap des lignes qui ont l'une des valeurs sélectionnées dans la colonne
+    def bitmap(self, colonne, selection):
+        positions = self.valeurs[colonne].get_indexer(list(selection))
+        positions = positions[positions >= 0]
+        if not len(positions):
+            return self._vide()
+        return np.bitwise_or.reduce(self._bitmaps[colonne][positions], axis=0)
+
+    # Masque booléen des lignes qui vérifient tous les filtres ({colonne: valeurs}), ou None sans filtre
+    def masque(self, filtres):
+        resultat = None
+        for colonne, selection in filtres.items():
+            if len(selection):
+                bitmap = self.bitmap(colonne, selection)
+                resultat = bitmap if resultat is None else resultat & bitmap
+        if resultat is None:
+            return None
+        return np.unpackbits(resultat, count=self.nombre_lignes).astype(bool)
+
+    # Mémoire occupée par les bitmaps et les valeurs
+    def octets(self):
+        return int(sum(bitmaps.nbytes for bitmaps in self._bitmaps.values()) + sum(valeurs.memory_usage(deep=True) for valeurs in self.valeurs.values()))
+
+# Fonction pour construire l'index bitmap des filtres d'un projet
+@mesure('pretraitement')
+def indexer_filtres(donnees):
+    return IndexBitmap(donnees)
@@ -0,0 +1,250 @@
+import plotly.express as px
+import plotly.graph_objects as go
+
+from ged.profilage import mesure
+
+# Fonction pour générer des couleurs dynamiques
+def generate_dynamic_colors(n):
+    return px.colors.qualitative.Plotly * (n // len(px.colors.qualitative.Plotly) + 1)
+
+# Fonction pour construire le diagramme Sankey du flux des documents
+@mesure('figure')
+def figure_sankey(etiquettes_noeuds, liens):
+    fig = go.Figure(data=[go.Sankey(
+        node=dict(pad=15, thickness=20, line=dict(color='black', width=0.5), label=etiquettes_noeuds),
+        link=dict(source=liens['source'], target=liens['cible'], value=liens['valeur'])
+    )])
+    fig.add_annotation(x=0.1, y=1.1, text="Projet", showarrow=False, font=dict(size=12, color="blue"))
+    fig.add_annotation(x=0.35, y=1.1, text="Émetteur", showarrow=False, font=dict(size=12, color="blue"))
+    fig.add_annotation(x=0.6, y=1.1, text="Type de Document", showarrow=False, font=dict(size=12, color="blue"))
+    fig.add_annotation(x=0.9, y=1.1, text="Indice", showarrow=False, font=dict(size=12, color="blue"))
+    fig.update_layout(title_text="", font_size=10, margin=dict(l=0, r=0, t=40, b=0))
+    return fig
+
+# Fonction pour tracer l'évolution mensuelle (cumulée et brute) des types sélectionnés
+@mesure('figure')
+def figure_evolution(donnees_groupees, types_selectionnes, projet_selectionne):
+    fig = go.Figure()
+    for t in types_selectionnes:
+        donnees_filtrees = donnees_groupees[donnees_groupees['TYPE DE DOCUMENT'] == t]
+        fig.add_trace(go.Scatter(x=donnees_filtrees['Date dépôt GED'], y=donnees_filtrees['Nombre de documents'].cumsum(), mode='lines+markers', name=f'Cumulé - {t}'))
+        fig.add_trace(go.Scatter(x=donnees_filtrees['Date dépôt GED'], y=donnees_filtrees['Nombre de documents'], mode='lines+markers', name=t, visible='legendonly'))
+    fig.update_layout(
+        title=f'Évolution du nombre de documents pour {projet_selectionne}',
+        xaxis_title='Date de Dépôt',
+        yaxis_title='Nombre de Documents',
+        legend_title='Type de Documents',
+        height=500, width=1200
+    )
+    return fig
+
+# Fonction pour construire un treemap à partir de comptes déjà agrégés
+@mesure('figure')
+def figure_treemap(comptes, path, title, height):
+    fig = px.treemap(comptes, path=path, values='Nombre de documents', title=title)
+    fig.update_layout(margin=dict(l=20, r=20, t=40, b=20), height=height, width=1200)
+    return fig
+
+# Fonction pour construire un diagramme en barres horizontales du nombre de documents
+@mesure('figure')
+def figure_barres_horizontales(comptes, colonne, libelle, title, width):
+    fig = px.bar(
+        comptes,
+        y=colonne,
+        x='Nombre de documents',
+        orientation='h',
+        title=title,
+        labels={colonne: libelle, "Nombre de documents": "Nombre de documents"},
+        color='Nombre de documents',
+        color_continuous_scale=px.colors.sequential.Viridis
+    )
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'}, height=850, width=width)
+    return fig
+
+# Fonction pour comparer la masse de documents entre projets
+@mesure('figure')
+def figure_masse_documents(df_barre):
+    fig_barre = go.Figure()
+    fig_barre.add_trace(go.Bar(
+        x=df_barre['Chantier'], y=df_barre['Masse de documents'],
+        text=df_barre['Masse de documents'], textposition='auto',
+        name='Masse de documents',
+        marker_color=generate_dynamic_colors(len(df_barre))
+    ))
+    fig_barre.add_trace(go.Scatter(
+        x=df_barre['Chantier'], y=df_barre['mediane'],
+        mode='lines', name='Médiane',
+        line=dict(color='blue', dash='dash')
+    ))
+    for chantier, masse in zip(df_barre['Chantier'], df_barre['Masse de documents']):
+        fig_barre.add_annotation(x=chantier, y=masse, text=f"{masse}", showarrow=True, arrowhead=2)
+    fig_barre.update_layout(
+        title='Comparaison de la masse de documents entre les chantiers',
+        xaxis_title='Chantier', yaxis_title='Masse de documents',
+        font=dict(size=15),
+        height=450,
+        width=1200,
+        yaxis=dict(title='Masse de documents', showgrid=True, zeroline=True, showline=True, showticklabels=True),
+        xaxis=dict(title='Chantier', showgrid=True, zeroline=True, showline=True, showticklabels=True)
+    )
+    return fig_barre
+
+# Fonction pour construire un diagramme en barres coloré par catégorie
+@mesure('figure')
+def figure_barres_categorie(resultats, categorie, title, legend_title):
+    fig = px.bar(resultats, x=categorie, y=resultats.columns[1], title=title, color=categorie, color_discrete_sequence=generate_dynamic_colors(len(resultats)))
+    fig.update_layout(showlegend=True, legend_title_text=legend_title)
+    fig.update_traces(texttemplate='%{y:.2f}', textposition='outside')
+    return fig
+
+# Fonction pour construire une boîte à moustaches par catégorie à partir des statistiques calculées côté serveur
+# (agregations.statistiques_boites) : la figure ne transporte que les quartiles et les points aberrants retenus
+@mesure('figure')
+def figure_boxplot(boites, aberrants, categorie, y_column, title):
+    couleur = px.colors.qualitative.Plotly[0]
+    fig = go.Figure(go.Box(
+        x=boites[categorie],
+        q1=boites['q1'], median=boites['mediane'], q3=boites['q3'], mean=boites['moyenne'],
+        lowerfence=boites['moustache_basse'], upperfence=boites['moustache_haute'],
+        boxpoints=False, marker_color=couleur, name=y_column
+    ))
+    fig.add_trace(go.Scatter(
+        x=aberrants[categorie], y=aberrants[y_column],
+        mode='markers', marker=dict(color=couleur, size=5), name='Points aberrants'
+    ))
+    fig.update_layout(title=title, xaxis_title=categorie, yaxis_title=y_column, showlegend=False)
+    return fig
+
+# Fonction pour construire le diagramme de Gantt, avec des durées comptées dans l'unité donnée (jours ou jours ouvrés)
+@mesure('figure')
+def figure_gantt(donnees_gantt, categorie, title, libelle, unite='jours'):
+    fig_gantt = px.timeline(
+        donnees_gantt,
+        x_start='Date début',
+        x_end='Date fin',
+        y=categorie,
+        color=categorie,
+        hover_data=['Durée en jours', 'Nombre de documents', 'Types de documents'],
+        color_discrete_sequence=generate_dynamic_colors(len(donnees_gantt)),
+        title=title
+    )
+    fig_gantt.update_layout(xaxis_title='Date', yaxis_title=categorie, height=600, width=1000)
+    fig_gantt.update_traces(
+        hovertemplate=f'<b>{libelle}:</b> %{{y}}<br><b>Début:</b> %{{base|%d %b %Y}}<br><b>Fin:</b> %{{x|%d %b %Y}}<br><b>Durée:</b> %{{customdata[0]}} {unite}<br><b>Nombre de documents:</b> %{{customdata[1]}}<br><b>Types de documents:</b> %{{customdata[2]}}'
+    )
+    return fig_gantt
+
+# Fonction pour créer un graphique circulaire à partir des comptes par niveau d'alerte
+@mesure('figure')
+def figure_camembert_alerte(comptes, libelles, couleurs, title):
+    presents = [i for i, compte in enumerate(comptes) if compte > 0]
+    trace = go.Pie(labels=[libelles[i] for i in presents], values=[int(comptes[i]) for i in presents], hole=0.3,
+                   marker=dict(colors=[couleurs[i] for i in presents]),
+                   textinfo='percent',
+                   insidetextorientation='horizontal')
+    layout = go.Layout(
+        title=title,
+        margin=dict(l=20, r=20, t=30, b=20),
+        legend=dict(orientation='h', xanchor='center', x=0.5, y=-0.1),
+        annotations=[dict(text=title, x=0.5, y=0.5, font_size=20, showarrow=False)]
+    )
+    return go.Figure(data=[trace], layout=layout)
+
+# Fonction pour construire la distribution des types de documents d'un lot
+@mesure('figure')
+def figure_distribution_types(distribution_types):
+    return px.bar(distribution_types, x='Type de Document', y='Nombre de Documents', title='Distribution des types de documents')
+
+# Fonction pour tracer la séquence de diffusion des documents, colorée par type, cluster ou anomalie
+@mesure('figure')
+def figure_sequence(donnees_lot, couleur, title):
+    return px.scatter(donnees_lot, x='Date dépôt GED', y='TYPE DE DOCUMENT', color=couleur, title=title, hover_data=['Libellé du document'])
+
+# Fonction pour tracer la séquence moyenne de diffusion des documents
+@mesure('figure')
+def figure_sequence_moyenne(moyenne_dates):
+    return px.scatter(moyenne_dates, x='Date Moyenne de Dépôt GED', y='Type de Document', title='Séquence moyenne de diffusion des documents')
+
+# Fonction pour afficher une matrice de corrélation
+@mesure('figure')
+def figure_correlation(correlation):
+    return px.imshow(correlation.corr(), text_auto=True, title='Matrice de corrélation')
+
+# Fonction pour comparer les retards cumulés des relecteurs, avec les visas en attente et en retard au survol
+@mesure('figure')
+def figure_retards_relecteurs(delais):
+    fig = px.bar(
+        delais,
+        y='Relecteur',
+        x='Jours de retard',
+        orientation='h',
+        color='En retard',
+        hover_data=['Demandes', 'En attente', 'En retard'],
+        title='Jours de retard cumulés par relecteur',
+        color_continuous_scale=px.colors.sequential.Reds
+    )
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'}, height=max(400, 30 * len(delais)))
+    return fig
+
+# Fonction pour comparer le délai médian et le 90e centile de réponse des relecteurs
+@mesure('figure')
+def figure_delais_relecteurs(delais):
+    fig = go.Figure()
+    fig.add_trace(go.Bar(y=delais['Relecteur'], x=delais['Délai médian'], orientation='h', name='Délai médian'))
+    fig.add_trace(go.Bar(y=delais['Relecteur'], x=delais['Délai p90'], orientation='h', name='Délai p90'))
+    fig.update_layout(
+        title='Délai de réponse des relecteurs (jours)',
+        barmode='group',
+        xaxis_title='Jours entre la demande et le visa',
+        height=max(400, 40 * len(delais))
+    )
+    return fig
+
+# Fonction pour tracer, jour par jour, les visas en attente empilés par relecteur ou par lot
+@mesure('figure')
+def figure_visas_en_attente(attente, title, legend_title):
+    fig = go.Figure()
+    for colonne in attente.columns:
+        fig.add_trace(go.Scatter(x=attente.index, y=attente[colonne], mode='lines', stackgroup='attente', name=str(colonne)))
+    fig.update_layout(
+        title=title,
+        xaxis_title='Date',
+        yaxis_title='Visas en attente',
+        legend_title=legend_title,
+        height=550
+    )
+    return fig
+
+# Fonction pour représenter l'arbre des dossiers en icicle ou en treemap, à partir des totaux déjà cumulés par dossier
+@mesure('figure')
+def figure_dossiers(arbre, forme, profondeur):
+    trace = go.Icicle if forme == 'Icicle' else go.Treemap
+    fig = go.Figure(trace(
+        ids=arbre['Chemin'],
+        labels=arbre['Dossier'],
+        parents=arbre['Parent'],
+        values=arbre['Documents'],
+        branchvalues='total',
+        maxdepth=profondeur,
+        customdata=arbre[['Indices', 'Date début', 'Date fin']].assign(**{
+            'Date début': arbre['Date début'].dt.strftime('%d/%m/%Y'),
+            'Date fin': arbre['Date fin'].dt.strftime('%d/%m/%Y')
+        }),
+        hovertemplate='<b>%{label}</b><br>Documents : %{value}<br>Indices : %{customdata[0]}<br>Dépôts : du %{customdata[1]} au %{customdata[2]}<extra></extra>'
+    ))
+    fig.update_layout(title='Documents par dossier GED', margin=dict(l=20, r=20, t=40, b=20), height=700)
+    return fig
+
+# Fonction pour comparer par LOT les documents en trop dans les groupes de doublons probables
+@mesure('figure')
+def figure_doublons_par_lot(par_lot):
+    fig = px.bar(
+        par_lot,
+        y='LOT',
+        x='Documents en trop',
+        orientation='h',
+        hover_data=['Groupes', 'Documents'],
+        title='Documents en trop par LOT dans les doublons probables'
+    )
+    fig.update_layout(yaxis={'categoryorder': 'total ascending', 'type': 'category'}, height=max(400, 30 * len(par_lot)))
+    return fig
@@ -0,0 +1,129 @@
+# Identification des documents d'une révision à l'autre.
+# Le libellé d'un document change souvent entre deux indices (extension, majuscules, accents, espaces) alors
+# que son numéro, avec son niveau et sa zone, reste le même. Chaque ligne reçoit un identifiant entier de
+# document : le numéro quand l'export en a un et qu'il distingue les documents, complété ou remplacé sinon
+# par le libellé normalisé. Un identifiant ne contient jamais deux fois le même INDICE. Les calculs de
+# versions et de durées regroupent les lignes sur cet identifiant plutôt que sur de longues chaînes.
+import logging
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from ged.profilage import mesure
+
+COLONNE_ID = 'Id document'
+
+journal = logging.getLogger(__name__)
+
+# Colonnes du numéro de document, selon les exports (la première présente est utilisée)
+COLONNES_NUMERO = ['Numéro', 'Numéro de document', '4 numéros', '3 caractère compris entre 0 & 9']
+
+# Colonnes qui complètent le numéro pour identifier un document
+COLONNES_EMPLACEMENT = ['NIVEAU', 'ZONE']
+
+# Extensions des fichiers déposés en GED. Seule une extension connue est retirée : les points d'un libellé
+# comme « TD.IRVE.PK » en font partie
+EXTENSIONS_FICHIER = ['pdf', 'dwg', 'dxf', 'zip', 'rar', 'zed', 'xls', 'xlsx', 'xlsm', 'doc', 'docx', 'csv', 'txt', 'jpg', 'jpeg', 'png', 'tif', 'tiff', 'rvt', 'ifc', 'ppt', 'pptx']
+
+# Extension de fichier en fin de libellé, éventuellement répétée ou précédée de plusieurs points (« -B..pdf »)
+EXTENSION = re.compile(r'(?:\.+(?:' + '|'.join(EXTENSIONS_FICHIER) + r'))+$')
+ESPACES = re.compile(r'\s+')
+
+# Numéros de remplissage, qui ne désignent aucun document
+NUMERO_REMPLISSAGE = re.compile(r'0+(?:\.0+)?|x+|-+|_+|\.+|nc|na|so|sans')
+
+# Fonction pour normaliser un libellé : sans extension, sans accents ni majuscules, espaces regroupés
+def normaliser_libelle(libelle):
+    libelle = unicodedata.normalize('NFKD', libelle.casefold())
+    libelle = ''.join(caractere for caractere in libelle if not unicodedata.combining(caractere))
+    return ESPACES.sub(' ', EXTENSION.sub('', libelle.strip())).strip()
+
+# Fonction pour normaliser les libellés d'un export. Un libellé revient à chaque révision : chaque libellé
+# distinct n'est normalisé qu'une fois
+def normaliser_libelles(libelles):
+    codes, distincts = pd.factorize(libelles)
+    normalises = np.array([normaliser_libelle(libelle) for libelle in distincts] + [''], dtype=object)
+    return pd.Series(normalises[codes], index=libelles.index)  # code -1 (libellé manquant) : ''
+
+# Fonction pour obtenir le numéro de document d'un export, ou None s'il n'en a pas. Les numéros lus comme
+# texte perdent leurs espaces et leurs zéros en tête, pour que « 0120 » et « 120 » désignent le même document.
+# Les numéros de remplissage (0, « X », « - », « NC »...) ne désignent aucun document et sont vidés
+def numero_document(donnees):
+    colonne = next((colonne for colonne in COLONNES_NUMERO if colonne in donnees.columns), None)
+    if colonne is None:
+        return None
+    numero = donnees[colonne]
+    if numero.dtype == object:
+        numero = numero.str.strip().replace('', np.nan).str.lstrip('0').replace('', '0')
+    remplissage = [valeur for valeur in numero.dropna().unique() if NUMERO_REMPLISSAGE.fullmatch(str(valeur).casefold())]
+    return numero.mask(numero.isin(remplissage))
+
+# Fonction pour numéroter les combinaisons d'un identifiant et d'un code entier (-1 pour une valeur absente)
+def combiner(identifiants, codes):
+    return pd.factorize(identifiants.astype(np.int64) * (int(codes.max(initial=0)) + 2) + codes + 1)[0]
+
+# Fonction pour repérer les lignes dont l'identifiant de document contient plusieurs fois le même INDICE
+# (codes entiers des INDICE)
+def indices_repetes(identifiants, codes_indices):
+    identifiants = pd.Series(identifiants)
+    repetes = pd.Series(combiner(identifiants.to_numpy(), codes_indices)).duplicated().to_numpy()
+    return identifiants.isin(identifiants[repetes]).to_numpy()
+
+# Fonction pour compter les identifiants de document qui répètent un INDICE
+def identifiants_incoherents(identifiants, indices):
+    return pd.Series(identifiants)[indices_repetes(identifiants, pd.factorize(indices)[0])].nunique()
+
+# Fonction pour vérifier qu'aucun identifiant de document ne répète un INDICE
+def verifier_identifiants(identifiants, indices):
+    repetes = identifiants_incoherents(identifiants, indices)
+    if repetes:
+        raise ValueError(f"{repetes} identifiants de document répètent un INDICE")
+
+# Fonction pour identifier les documents par type, lot et libellé normalisé seulement
+def identifiants_par_libelle(donnees):
+    cle = pd.DataFrame({'TYPE DE DOCUMENT': donnees['TYPE DE DOCUMENT'], 'LOT': donnees['LOT'], 'Libellé': normaliser_libelles(donnees['Libellé du document'])})
+    return cle.groupby(list(cle), sort=False, dropna=False).ngroup().to_numpy()
+
+# Fonction pour attribuer à chaque ligne l'identifiant entier de son document. Le numéro, avec le niveau et la
+# zone, identifie un document quand il en distingue les révisions : un numéro de remplissage, ou un numéro
+# sous lequel un même INDICE revient (compteur propre à un dossier, repris par plusieurs documents), est
+# complété par le libellé normalisé. Les lignes sans numéro sont identifiées par type, lot et libellé. Un
+# INDICE encore répété sous un identifiant (même document déposé deux fois) ouvre un nouveau document à
+# chaque nouveau dépôt. Seuls les libellés des lignes qui en ont besoin sont normalisés. Si un identifiant répète
+# malgré tout un INDICE (export incohérent), le projet est identifié sur ses seuls libellés, avec un avertissement,
+# pour qu'il reste consultable ; en mode strict (tests, banc de mesure), l'incohérence lève une ValueError
+@mesure('pretraitement')
+def identifier_documents(donnees, strict=False):
+    codes_indices = pd.factorize(donnees['INDICE'])[0]
+    cle = {'TYPE DE DOCUMENT': donnees['TYPE DE DOCUMENT'], 'LOT': donnees['LOT']}
+    sans_numero = np.ones(len(donnees), dtype=bool)
+    numero = numero_document(donnees)
+    if numero is not None:
+        sans_numero = numero.isna().to_numpy()
+        cle['Numéro'] = numero
+        cle.update({colonne: donnees[colonne].where(~sans_numero) for colonne in COLONNES_EMPLACEMENT if colonne in donnees.columns})
+    identifiants = pd.DataFrame(cle).groupby(list(cle), sort=False, dropna=False).ngroup().to_numpy()
+
+    # Numéros absents, de remplissage ou ambigus : le libellé normalisé complète la clé
+    avec_libelle = sans_numero | indices_repetes(identifiants, codes_indices)
+    libelles = normaliser_libelles(donnees.loc[avec_libelle, 'Libellé du document'])
+    codes_libelles = np.full(len(donnees), -1)
+    codes_libelles[avec_libelle] = pd.factorize(libelles)[0]
+    identifiants = combiner(identifiants, codes_libelles)
+
+    # Dépôts répétés d'un même INDICE : rang du dépôt, dans l'ordre des dates, parmi ceux de cet INDICE
+    repetes = indices_repetes(identifiants, codes_indices)
+    if repetes.any():
+        depots = pd.DataFrame({'id': identifiants, 'indice': codes_indices, 'date': donnees['Date dépôt GED'].to_numpy()})[repetes]
+        rangs = np.zeros(len(donnees), dtype=np.int64)
+        rangs[np.flatnonzero(repetes)] = depots.sort_values('date', kind='stable').groupby(['id', 'indice'], sort=False).cumcount().sort_index().to_numpy()
+        identifiants = combiner(identifiants, rangs)
+    if strict:
+        verifier_identifiants(identifiants, donnees['INDICE'])
+    incoherents = 0 if strict else identifiants_incoherents(identifiants, donnees['INDICE'])
+    if incoherents:
+        journal.warning("%d identifiants de document répètent un INDICE : documents identifiés sur leur seul libellé", incoherents)
+        identifiants = identifiants_par_libelle(donnees)
+    return pd.Series(identifiants, index=donnees.index, dtype='int32')
@@ -0,0 +1,166 @@
+import functools
+import os
+import time
+import streamlit as st
+
+from ged import profilage
+from ged.config import PROJETS, CHEMIN_LOGO, EXTENSIONS_EXPORT, PROFILAGE
+
+# Configurer le thème Streamlit
+def configurer_page():
+    st.set_page_config(page_title="Suivi et Analyse des Documents GED", layout="wide")
+    st.markdown("""
+        <style>
+        .css-18e3th9 {
+            background-color: #FFFFFF;
+        }
+        .css-1d391kg {
+            color: #343641;
+        }
+        .css-1v3fvcr {
+            background-color: #17D0B1;
+        }
+        .css-12ttj6m {
+            background-color: #FFFFFF;
+        }
+        </style>
+    """, unsafe_allow_html=True)
+
+# Fonction pour styliser l'en-tête
+def style_entete():
+    st.markdown(f"""
+        <style>
+        .entete {{
+            background-color: #004080;
+            color: white;
+            font-weight: bold;
+            text-align: center;
+            padding: 20px;
+            font-size: 24px;
+        }}
+        .main .block-container {{
+            padding-top: 1rem;
+        }}
+        </style>
+        <div class="entete">
+            Suivi et Analyse des Documents GED
+        </div>
+        """, unsafe_allow_html=True)
+
+# Lire le logo une seule fois par processus. Un fichier absent lève une exception, qui n'est pas mise en cache
+@st.cache_resource(show_spinner=False)
+def lire_logo(chemin_logo):
+    with open(chemin_logo, 'rb') as fichier:
+        return fichier.read()
+
+# Fonction pour afficher le logo dans la barre latérale
+def afficher_logo_sidebar():
+    chemin_logo = os.path.join(CHEMIN_LOGO)
+    try:
+        logo = lire_logo(chemin_logo)
+        with st.sidebar:
+            st.image(logo, width=95)
+    except FileNotFoundError:
+        st.sidebar.error(f"Le fichier logo n'a pas été trouvé à l'emplacement : {chemin_logo}")
+
+# Fonction pour gérer le téléchargement de fichiers
+def gerer_telechargement():
+    uploaded_files = st.sidebar.file_uploader("Téléchargez vos fichiers CSV (.csv, .csv.gz, .zip, .csv.zst)", type=EXTENSIONS_EXPORT, accept_multiple_files=True, key='fichiers_telecharges')
+    return {uploaded_file.name: uploaded_file for uploaded_file in uploaded_files or []}
+
+# Fonction pour lister les projets configurés présents sur disque
+def projets_configures():
+    return {nom: chemin for nom, chemin in PROJETS.items() if os.path.exists(chemin)}
+
+# Fonction pour lister les projets disponibles : projets configurés puis fichiers téléchargés
+def sources_projets(projets):
+    sources = dict(projets)
+    sources.update(gerer_telechargement())
+    return sources
+
+# Fonction pour afficher l'état du préchargement des projets configurés, dans le conteneur donné (par défaut la barre latérale)
+def afficher_etat_prechargement(taches, conteneur=None):
+    en_cours = not all(tache.done() for tache in taches.values())
+
+    # Rafraîchir l'indicateur toutes les secondes tant que des projets sont en cours de chargement. La fréquence
+    # est fixée à chaque exécution complète : quand le dernier projet est chargé, une exécution complète
+    # redéfinit le fragment sans rafraîchissement
+    @st.fragment(run_every=1 if en_cours else None)
+    def etat():
+        termines = [nom for nom, tache in taches.items() if tache.done()]
+        if len(termines) < len(taches):
+            st.progress(len(termines) / len(taches), text=f"Préchargement des projets : {len(termines)}/{len(taches)}")
+        else:
+            st.caption(f"{len(taches)} projets préchargés")
+        for nom in termines:
+            if taches[nom].exception() is not None:
+                st.warning(f"Le préchargement du projet {nom} a échoué : {taches[nom].exception()}")
+        if en_cours and len(termines) == len(taches):
+            st.rerun(scope='app')
+
+    with conteneur or st.sidebar:
+        etat()
+
+# Fonction pour synchroniser le projet sélectionné entre les pages
+def synchroniser_filtres(sources):
+    return st.sidebar.selectbox('Sélectionnez un projet', list(sources.keys()), key='projet_global')
+
+# Fonction pour afficher les filtres communs à toutes les pages dans la barre latérale et renvoyer
+# les valeurs choisies pour chaque colonne
+def choisir_filtres(index_filtres):
+    with st.sidebar.expander("Filtres", expanded=False):
+        return {colonne: st.multiselect(colonne, valeurs, key=f'filtre_{colonne}') for colonne, valeurs in index_filtres.valeurs.items()}
+
+# Fonction pour choisir le décompte des durées d'une page : renvoie True pour les jours ouvrés
+def choisir_jours_ouvres(cle):
+    return st.radio('Durées en', ['Jours calendaires', 'Jours ouvrés'], horizontal=True, key=cle) == 'Jours ouvrés'
+
+# Fonction pour afficher une figure Plotly, en mesurant sa sérialisation et sa taille si le profilage est actif
+def afficher_graphique(figure, **options):
+    if profilage.profil_courant() is None:
+        st.plotly_chart(figure, **options)
+        return
+    debut = time.perf_counter()
+    st.plotly_chart(figure, **options)
+    secondes = time.perf_counter() - debut
+    import plotly.io as pio
+    profilage.envoi_graphique((figure.layout.title.text or figure.data[0].type) if figure.data else 'figure', secondes, len(pio.to_json(figure, validate=False).encode()))
+
+# Décorateur des pages (ou parties de page) exécutées en fragment. Une réexécution du seul fragment ne passe pas
+# par app.py : elle est profilée ici comme une exécution à part entière, et son profil est affiché sous le fragment
+# (un fragment ne peut pas écrire dans la barre latérale)
+def fragment(fonction):
+    @functools.wraps(fonction)
+    def execution(*args, **kwargs):
+        if not PROFILAGE or profilage.profil_courant() is not None:
+            return fonction(*args, **kwargs)
+        profil = profilage.demarrer()
+        profil.page, profil.projet = f"{fonction.__name__} (fragment)", st.session_state.get('projet_global')
+        try:
+            return fonction(*args, **kwargs)
+        finally:
+            profilage.terminer(profil)
+            afficher_profilage(profil, st.expander("Profilage de la dernière exécution du fragment", expanded=False))
+    return st.fragment(execution)
+
+# Fonction pour afficher le profil de la dernière exécution, par défaut dans la barre latérale
+def afficher_profilage(profil, conteneur=None):
+    import pandas as pd
+    with conteneur or st.sidebar.expander("Profilage de la dernière exécution", expanded=False):
+        etapes = pd.DataFrame(profil.etapes, columns=['categorie', 'fonction', 'niveau', 'secondes', 'lignes'])
+        graphiques = pd.DataFrame(profil.graphiques, columns=['graphique', 'secondes', 'octets'])
+        col1, col2 = st.columns(2)
+        col1.metric("Durée totale", f"{profil.duree:.3f} s")
+        col2.metric("Lignes traitées", f"{profil.lignes():,}".replace(',', ' '))
+
+        st.caption("Durée par étape")
+        par_categorie = etapes[etapes['niveau'] == 0].groupby('categorie')['secondes'].sum()
+        par_categorie['envoi des graphiques'] = graphiques['secondes'].sum()
+        st.dataframe(par_categorie.rename('secondes').sort_values(ascending=False), use_container_width=True)
+        st.dataframe(etapes, hide_index=True, use_container_width=True)
+
+        st.caption("Graphiques envoyés")
+        st.dataframe(graphiques.assign(Ko=(graphiques['octets'] / 1024).round(1)).drop(columns='octets'), hide_index=True, use_container_width=True)
+
+        st.caption("Accès aux caches")
+        st.dataframe(pd.DataFrame(profil.caches, columns=['cache', 'cle', 'resultat']), hide_index=True, use_container_width=True)
@@ -0,0 +1,79 @@
+# Durées en jours calendaires ou en jours ouvrés.
+# Les jours ouvrés sont comptés sur des colonnes entières avec numpy.busday_count, sans boucle par ligne :
+# les week-ends, les jours fériés du calendrier configuré et les fermetures de chantier du projet sont exclus.
+# Comme .dt.days, une durée compte les jours du début (inclus) à la fin (exclue).
+import datetime
+import functools
+
+import numpy as np
+import pandas as pd
+
+from ged.config import CALENDRIER_FERIES, FERMETURES, PROJETS
+
+# Années couvertes par le calendrier des jours non ouvrés
+ANNEES = range(1990, 2061)
+
+SEMAINE_OUVREE = '1111100'
+
+# Jours fériés à date fixe ('MM-JJ') et jours fériés mobiles (décalage en jours depuis le dimanche de Pâques)
+FERIES_FIXES = {
+    'france': ['01-01', '05-01', '05-08', '07-14', '08-15', '11-01', '11-11', '12-25'],
+    'alsace-moselle': ['01-01', '05-01', '05-08', '07-14', '08-15', '11-01', '11-11', '12-25', '12-26']
+}
+FERIES_PAQUES = {
+    'france': [1, 39, 50],  # lundi de Pâques, Ascension, lundi de Pentecôte
+    'alsace-moselle': [-2, 1, 39, 50]  # et Vendredi saint
+}
+
+# Fonction pour calculer la date du dimanche de Pâques (calendrier grégorien, algorithme de Meeus)
+def paques(annee):
+    a, b, c = annee % 19, annee // 100, annee % 100
+    d, e = b // 4, b % 4
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    mois, jour = divmod(h + l - 7 * m + 114, 31)
+    return datetime.date(annee, mois, jour + 1)
+
+# Fonction pour lister les jours fériés d'une année
+def jours_feries(annee, calendrier=CALENDRIER_FERIES):
+    fixes = [datetime.date.fromisoformat(f'{annee}-{jour}') for jour in FERIES_FIXES[calendrier]]
+    mobiles = [paques(annee) + datetime.timedelta(days=decalage) for decalage in FERIES_PAQUES[calendrier]]
+    return fixes + mobiles
+
+# Fonction pour lister les jours d'une fermeture ('MM-JJ', 'MM-JJ') une année donnée. Une fermeture dont
+# la fin précède le début se termine l'année suivante
+def jours_fermeture(annee, debut, fin):
+    premier = datetime.date.fromisoformat(f'{annee}-{debut}')
+    dernier = datetime.date.fromisoformat(f'{annee}-{fin}')
+    if dernier < premier:
+        dernier = dernier.replace(year=annee + 1)
+    return [premier + datetime.timedelta(days=n) for n in range((dernier - premier).days + 1)]
+
+# Fonction pour obtenir les fermetures de chantier d'un projet, désigné par son nom ou par le chemin de son export
+def fermetures_projet(nom):
+    noms = {chemin: projet for projet, chemin in PROJETS.items()}
+    return FERMETURES.get('*', []) + FERMETURES.get(noms.get(nom, nom), [])
+
+# Fonction pour construire le calendrier des jours ouvrés d'un projet, une seule fois par projet
+@functools.lru_cache(maxsize=None)
+def calendrier_ouvre(nom=None):
+    jours = [jour for annee in ANNEES for jour in jours_feries(annee)]
+    jours += [jour for annee in ANNEES for debut, fin in fermetures_projet(nom) for jour in jours_fermeture(annee, debut, fin)]
+    return np.busdaycalendar(weekmask=SEMAINE_OUVREE, holidays=np.array(sorted(set(jours)), dtype='datetime64[D]'))
+
+# Fonction pour calculer la durée en jours entre deux colonnes de dates : jours calendaires sans calendrier,
+# jours ouvrés du calendrier donné sinon. Les durées dont une date manque restent vides
+def duree_en_jours(debut, fin, calendrier=None):
+    if calendrier is None:
+        return (fin - debut).dt.days
+    valides = (debut.notna() & fin.notna()).to_numpy()
+    durees = np.full(len(debut), np.nan)
+    durees[valides] = np.busday_count(
+        debut.to_numpy()[valides].astype('datetime64[D]'),
+        fin.to_numpy()[valides].astype('datetime64[D]'),
+        busdaycal=calendrier
+    )
+    return pd.Series(durees, index=debut.index)
@@ -0,0 +1,40 @@
+import pandas as pd
+
+from ged.identite import COLONNE_ID, identifier_documents
+from ged.jours_ouvres import duree_en_jours
+from ged.profilage import mesure
+
+# Fonction pour prétraiter les données (strict : l'identification des documents échoue sur un export incohérent)
+@mesure('pretraitement')
+def pretraiter_donnees(donnees, strict=False):
+    donnees[COLONNE_ID] = identifier_documents(donnees, strict)
+    donnees = donnees.sort_values(by=['TYPE DE DOCUMENT', 'Date dépôt GED'])
+    group = donnees.groupby(COLONNE_ID)
+    donnees['Date première version'] = group['Date dépôt GED'].transform('min')
+    donnees['Date dernière version'] = group['Date dépôt GED'].transform('max')
+    donnees['Différence en jours'] = duree_en_jours(donnees['Date première version'], donnees['Date dernière version'])
+    donnees['Nombre d\'indices'] = group['INDICE'].transform('nunique')
+
+    # Remplir les valeurs manquantes avant la transformation
+    donnees['INDICE'] = donnees['INDICE'].fillna('')
+    indices_utilises = group['INDICE'].agg(lambda x: ', '.join(sorted(set(x)))).rename('Indices utilisés')
+    donnees = donnees.join(indices_utilises, on=COLONNE_ID)
+
+    # Ajouter les colonnes Date début et Date fin pour chaque LOT
+    donnees['Date début'] = donnees.groupby('LOT')['Date dépôt GED'].transform('min')
+    donnees['Date fin'] = donnees.groupby('LOT')['Date dépôt GED'].transform('max')
+
+    # Calculer les durées entre chaque version pour chaque document
+    donnees = donnees.sort_values(by=[COLONNE_ID, 'Date dépôt GED'])
+    donnees['Durée entre versions'] = duree_en_jours(donnees.groupby(COLONNE_ID)['Date dépôt GED'].shift(1), donnees['Date dépôt GED'])
+
+    return donnees
+
+# Fonction pour recalculer en jours ouvrés les colonnes de durée du prétraitement
+@mesure('pretraitement')
+def durees_jours_ouvres(donnees, calendrier):
+    version_precedente = donnees.groupby(COLONNE_ID)['Date dépôt GED'].shift(1)
+    return pd.DataFrame({
+        'Différence en jours': duree_en_jours(donnees['Date première version'], donnees['Date dernière version'], calendrier),
+        'Durée entre versions': duree_en_jours(version_precedente, donnees['Date dépôt GED'], calendrier)
+    })
@@ -0,0 +1,126 @@
+# Profilage optionnel des exécutions de l'application (GED_PROFILAGE=1).
+# Chaque exécution du script enregistre la durée des étapes (chargement, prétraitement, agrégations,
+# figures), les accès aux caches, la taille des graphiques envoyés au navigateur et le nombre de lignes
+# traitées. Hors profilage, les fonctions instrumentées ne font qu'une lecture de variable de contexte.
+import contextvars
+import functools
+import json
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from ged.config import PROFILAGE, JOURNAL_PROFILAGE
+
+# Modules coûteux à importer, dont on suit le chargement au fil des jalons
+MODULES_LOURDS = ['pandas', 'plotly.express', 'sklearn']
+
+# Profil de l'exécution en cours dans le thread du script (None hors profilage ou dans les threads de préchargement)
+_profil = contextvars.ContextVar('profil', default=None)
+
+# Mesures d'une exécution du script
+class Profil:
+    def __init__(self):
+        self.debut = time.perf_counter()
+        self.horodatage = datetime.now().isoformat(timespec='seconds')
+        self.page = None
+        self.projet = None
+        self.duree = None
+        self.etapes = []  # {'categorie', 'fonction', 'niveau', 'secondes', 'lignes'}
+        self.caches = []  # {'cache', 'cle', 'resultat'}
+        self.graphiques = []  # {'graphique', 'secondes', 'octets'}
+        self.niveau = 0  # profondeur des étapes imbriquées en cours
+        self.jalons = {}  # nom -> {'secondes' depuis le début, 'modules' lourds déjà importés}
+
+    # Nombre de lignes traitées par les étapes de plus haut niveau
+    def lignes(self):
+        return sum(etape['lignes'] or 0 for etape in self.etapes if etape['niveau'] == 0)
+
+    def en_dict(self):
+        return {
+            'horodatage': self.horodatage,
+            'horloge': self.debut,
+            'page': self.page,
+            'projet': self.projet,
+            'secondes': self.duree,
+            'lignes': self.lignes(),
+            'etapes': self.etapes,
+            'caches': self.caches,
+            'graphiques': self.graphiques,
+            'jalons': self.jalons
+        }
+
+# Commencer le profilage de l'exécution en cours, si le profilage est activé
+def demarrer():
+    if not PROFILAGE:
+        return None
+    profil = Profil()
+    _profil.set(profil)
+    return profil
+
+# Profil de l'exécution en cours, ou None
+def profil_courant():
+    return _profil.get()
+
+# Enregistrer un jalon de l'exécution (par exemple l'affichage du menu)
+def jalon(nom):
+    profil = _profil.get()
+    if profil is not None:
+        profil.jalons[nom] = {
+            'secondes': round(time.perf_counter() - profil.debut, 4),
+            'modules': [module for module in MODULES_LOURDS if module in sys.modules]
+        }
+
+# Terminer le profilage de l'exécution et l'ajouter au journal JSONL
+def terminer(profil):
+    profil.duree = round(time.perf_counter() - profil.debut, 4)
+    _profil.set(None)
+    with open(JOURNAL_PROFILAGE, 'a', encoding='utf-8') as journal:
+        journal.write(json.dumps(profil.en_dict(), ensure_ascii=False, default=str) + '\n')
+
+# Nombre de lignes du tableau passé en premier argument d'une étape
+def _lignes(arguments):
+    import pandas as pd
+    if arguments and isinstance(arguments[0], (pd.DataFrame, pd.Series)):
+        return len(arguments[0])
+    return None
+
+# Mesurer un bloc de code comme une étape de l'exécution
+@contextmanager
+def etape(categorie, fonction, lignes=None):
+    profil = _profil.get()
+    if profil is None:
+        yield
+        return
+    niveau = profil.niveau
+    profil.niveau += 1
+    debut = time.perf_counter()
+    try:
+        yield
+    finally:
+        profil.niveau = niveau
+        profil.etapes.append({'categorie': categorie, 'fonction': fonction, 'niveau': niveau, 'secondes': round(time.perf_counter() - debut, 4), 'lignes': lignes})
+
+# Décorateur pour mesurer chaque appel d'une fonction comme une étape de la catégorie donnée
+def mesure(categorie):
+    def decorateur(fonction):
+        @functools.wraps(fonction)
+        def enveloppe(*args, **kwargs):
+            if _profil.get() is None:
+                return fonction(*args, **kwargs)
+            with etape(categorie, fonction.__name__, _lignes(args)):
+                return fonction(*args, **kwargs)
+        return enveloppe
+    return decorateur
+
+# Enregistrer un accès à un cache ('hit' ou 'miss')
+def acces_cache(cache, cle, trouve):
+    profil = _profil.get()
+    if profil is not None:
+        profil.caches.append({'cache': cache, 'cle': str(cle), 'resultat': 'hit' if trouve else 'miss'})
+
+# Enregistrer l'envoi d'un graphique : durée de sérialisation et taille transmise
+def envoi_graphique(graphique, secondes, octets):
+    profil = _profil.get()
+    if profil is not None:
+        profil.graphiques.append({'graphique': graphique, 'secondes': round(secondes, 4), 'octets': octets})
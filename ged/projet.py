@@ -0,0 +1,157 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from ged import profilage
+
+# Nombre de combinaisons de filtres dont le projet filtré est gardé en mémoire
+FILTRES_EN_CACHE = 4
+
+# Données prétraitées d'un projet, partagées telles quelles entre toutes les sessions.
+# Le tableau de base n'est jamais exposé directement : chaque page reçoit une vue
+# (copie superficielle en mode copy-on-write) qu'elle peut filtrer ou compléter sans
+# modifier les données partagées, et sans copie profonde à chaque exécution.
+class DonneesProjet:
+    def __init__(self, nom, donnees):
+        self.nom = nom
+        self._base = donnees
+        self._octets_base = int(donnees.memory_usage(index=True, deep=True).sum())
+        self._derivees = {}
+        self._octets_derivees = 0  # taille des valeurs dérivées, mesurée une fois à leur calcul
+        self._en_cours = {}  # nom -> Future des valeurs dérivées en cours de calcul
+        self._filtres = OrderedDict()  # combinaison de filtres -> DonneesProjet restreint
+        self._verrou = threading.Lock()
+        self._sur_croissance = None  # fonction appelée quand le projet occupe plus de mémoire
+
+    # Enregistrer la fonction à appeler chaque fois que le projet grandit (valeur dérivée ou projet filtré ajouté),
+    # pour que l'entrepôt vérifie son budget mémoire
+    def surveiller(self, sur_croissance):
+        self._sur_croissance = sur_croissance
+
+    def _signaler_croissance(self):
+        if self._sur_croissance is not None:
+            self._sur_croissance()
+
+    def __len__(self):
+        return len(self._base)
+
+    # Vue du tableau de base, éventuellement complétée de colonnes supplémentaires
+    def vue(self, **colonnes):
+        vue = self._base.copy(deep=False)
+        for nom, valeurs in colonnes.items():
+            vue[nom] = valeurs
+        return vue
+
+    @property
+    def donnees(self):
+        return self.vue()
+
+    # Colonne (ou tableau) calculée une seule fois à partir du tableau de base puis partagée par toutes les pages.
+    # Le calcul se fait hors du verrou : les autres valeurs du projet restent accessibles pendant un calcul long,
+    # et les sessions qui demandent la même valeur attendent le calcul en cours au lieu de le refaire
+    def derivee(self, nom, calcul):
+        with self._verrou:
+            if nom in self._derivees:
+                profilage.acces_cache('derivee', f'{self.nom}:{nom}', True)
+                return self._derivees[nom]
+            futur = self._en_cours.get(nom)
+            proprietaire = futur is None
+            if proprietaire:
+                futur = self._en_cours[nom] = Future()
+            profilage.acces_cache('derivee', f'{self.nom}:{nom}', not proprietaire)
+
+        if not proprietaire:
+            return futur.result()
+
+        try:
+            valeur = calcul(self._base)
+            octets = octets_derivee(valeur)
+        except BaseException as erreur:
+            with self._verrou:
+                del self._en_cours[nom]
+            futur.set_exception(erreur)
+            raise
+
+        with self._verrou:
+            self._derivees[nom] = valeur
+            self._octets_derivees += octets
+            del self._en_cours[nom]
+        futur.set_result(valeur)
+        self._signaler_croissance()
+        return valeur
+
+    # Calendrier des jours ouvrés du projet : jours fériés et fermetures de chantier exclus
+    def calendrier_ouvre(self):
+        from ged.jours_ouvres import calendrier_ouvre
+        return calendrier_ouvre(self.nom)
+
+    # Vue du tableau de base dont les colonnes de durée sont comptées en jours ouvrés, calculées une seule fois
+    def vue_jours_ouvres(self):
+        from ged.pretraitement import durees_jours_ouvres
+        calendrier = self.calendrier_ouvre()
+        durees = self.derivee('Durées en jours ouvrés', lambda base: durees_jours_ouvres(base, calendrier))
+        return self.vue(**dict(durees.items()))
+
+    # Index bitmap des colonnes filtrables, construit une seule fois
+    def index_filtres(self):
+        from ged.filtres import indexer_filtres
+        return self.derivee('Index des filtres', indexer_filtres)
+
+    # Projet restreint aux lignes qui vérifient les filtres ({colonne: valeurs}). Les projets filtrés
+    # gardent leurs propres valeurs dérivées et sont conservés pour les dernières combinaisons de filtres.
+    # Ils comptent dans la taille du projet : l'entrepôt les libère (alleger) avant d'évincer des projets
+    def filtrer(self, filtres):
+        cle = tuple(sorted((colonne, tuple(sorted(valeurs))) for colonne, valeurs in filtres.items() if len(valeurs)))
+        if not cle:
+            return self
+        with self._verrou:
+            projet = self._filtres.get(cle)
+            profilage.acces_cache('filtres', f'{self.nom}:{cle}', projet is not None)
+            if projet is not None:
+                self._filtres.move_to_end(cle)
+                return projet
+        projet = DonneesProjet(self.nom, self._base[self.index_filtres().masque(dict(cle))])
+        projet.surveiller(self._signaler_croissance)
+        with self._verrou:
+            self._filtres[cle] = projet
+            while len(self._filtres) > FILTRES_EN_CACHE:
+                self._filtres.popitem(last=False)
+        self._signaler_croissance()
+        return projet
+
+    # Libérer les projets filtrés, sauf le plus récemment utilisé, et renvoyer la mémoire libérée
+    def alleger(self):
+        with self._verrou:
+            anciens = list(self._filtres)[:-1]
+            liberes = [self._filtres.pop(cle) for cle in anciens]
+        return sum(projet.octets() for projet in liberes)
+
+    # Mémoire occupée par le tableau de base, les valeurs dérivées et les projets filtrés
+    def octets(self):
+        with self._verrou:
+            derivees = self._octets_derivees
+            filtres = list(self._filtres.values())
+        return self._octets_base + derivees + sum(projet.octets() for projet in filtres)
+
+# Mémoire occupée par une valeur dérivée : colonne, tableau, index qui mesure lui-même sa taille, ou n-uplet
+# de ces valeurs (boîtes à moustaches et points aberrants)
+def octets_derivee(valeur):
+    if hasattr(valeur, 'octets'):
+        return valeur.octets()
+    if isinstance(valeur, tuple):
+        return sum(octets_derivee(element) for element in valeur)
+    octets = valeur.memory_usage(index=False, deep=True)
+    return int(octets.sum()) if hasattr(valeur, 'columns') else int(octets)
+
+# Colonnes dérivées courantes
+def mois_depot(donnees):
+    return donnees['Date dépôt GED'].dt.to_period("M")
+
+def jours_depot(donnees):
+    import pandas as pd
+    return (donnees['Date dépôt GED'] - pd.Timestamp('1970-01-01')).dt.days
+
+# Index des dates de dépôt : jours (depuis 1970) triés, sans les dates manquantes
+def jours_depot_tries(donnees):
+    import pandas as pd
+    return pd.Series(jours_depot(donnees).dropna().astype('int64').sort_values(ignore_index=True).to_numpy(), name='Jours dépôt')
@@ -0,0 +1,101 @@
+# Quantiles des durées fusionnables entre projets.
+# Toutes les durées de l'application sont des nombres entiers de jours : l'esquisse d'une durée est son
+# histogramme creux par (TYPE DE DOCUMENT, LOT), un effectif par nombre de jours. Deux esquisses se fusionnent
+# en additionnant leurs effectifs, et les quantiles lus sur une esquisse fusionnée sont exacts (aucune erreur
+# de rang, à la différence d'un t-digest ou d'un KLL) : la médiane ou le p90 d'un ensemble de projets se
+# calculent sans concaténer leurs lignes. Une esquisse a au plus une ligne par nombre de jours distinct de
+# chaque (type, lot), quelques milliers de lignes pour un projet.
+import numpy as np
+import pandas as pd
+
+from ged.agregations import QUANTILES, duree_depuis_indice_precedent
+from ged.identite import COLONNE_ID
+from ged.jours_ouvres import duree_en_jours
+from ged.profilage import mesure
+from ged.visas import demandes_visa_projet
+
+# Colonnes qui découpent chaque esquisse
+COLONNES_ESQUISSE = ['TYPE DE DOCUMENT', 'LOT']
+
+# Durées suivies par les esquisses d'un projet : une valeur par version, par indice, par document
+# (de la première à la dernière version), par (type, lot) du calendrier, et par demande de visa
+DUREES = ['Durée entre versions', 'Durée entre indices', 'Différence en jours', 'Durée en jours (calendrier)', 'Délai de visa', 'Jours de retard']
+
+# Libellés des types de calcul dans les titres
+LIBELLES_CALCUL = {'mean': 'moyenne', 'max': 'maximum', 'median': 'médiane', 'p90': 'p90'}
+
+# Fonction pour construire l'esquisse d'une colonne de durées : effectif de chaque nombre de jours par (type, lot)
+def esquisse(donnees, colonne):
+    valeurs = donnees[COLONNES_ESQUISSE + [colonne]].dropna(subset=[colonne])
+    valeurs = valeurs.assign(Jours=valeurs[colonne].astype('int64'))
+    return valeurs.groupby(COLONNES_ESQUISSE + ['Jours'], observed=True, dropna=False).size().reset_index(name='Effectif')
+
+# Fonction pour construire les esquisses de toutes les durées d'un projet, à partir de ses données et de ses demandes
+# de visa. Les durées entre indices et du calendrier sont comptées en jours ouvrés du calendrier donné, s'il y en a un
+@mesure('pretraitement')
+def esquisses_durees(donnees, demandes, calendrier=None):
+    indices = donnees[COLONNES_ESQUISSE].assign(**{'Durée entre indices': duree_depuis_indice_precedent(donnees, calendrier)})
+    bornes = donnees.groupby(COLONNES_ESQUISSE, observed=True, dropna=False)['Date dépôt GED'].agg(['min', 'max'])
+    gantt = bornes.reset_index().assign(**{'Durée en jours': duree_en_jours(bornes['min'], bornes['max'], calendrier).to_numpy()})
+    parties = [
+        esquisse(donnees, 'Durée entre versions').assign(Durée='Durée entre versions'),
+        esquisse(indices, 'Durée entre indices').assign(Durée='Durée entre indices'),
+        esquisse(donnees.drop_duplicates(COLONNE_ID), 'Différence en jours').assign(Durée='Différence en jours'),
+        esquisse(gantt, 'Durée en jours').assign(Durée='Durée en jours (calendrier)'),
+        esquisse(demandes, 'Délai (jours)').assign(Durée='Délai de visa'),
+        esquisse(demandes, 'Jours de retard').assign(Durée='Jours de retard')
+    ]
+    return pd.concat(parties, ignore_index=True)[['Durée'] + COLONNES_ESQUISSE + ['Jours', 'Effectif']]
+
+# Fonction pour fusionner les esquisses de plusieurs projets en additionnant leurs effectifs
+def fusionner_esquisses(esquisses):
+    esquisses = pd.concat(esquisses, ignore_index=True)
+    return esquisses.groupby(['Durée'] + COLONNES_ESQUISSE + ['Jours'], observed=True, dropna=False)['Effectif'].sum().reset_index()
+
+# Fonction pour calculer la moyenne, le maximum, la médiane ou le p90 des durées d'une esquisse par catégorie.
+# Les quantiles sont interpolés entre les deux valeurs qui encadrent leur rang, comme pandas sur les lignes
+def statistique_esquisse(esquisse, categorie, type_calcul):
+    histogramme = esquisse.groupby([categorie, 'Jours'], observed=True)['Effectif'].sum()
+    histogramme = histogramme[histogramme > 0]
+    jours = pd.Series(histogramme.index.get_level_values('Jours').to_numpy(dtype=float), index=histogramme.index)
+    effectif = histogramme.groupby(level=categorie, observed=True).sum()
+    if type_calcul == 'mean':
+        valeurs = (jours * histogramme).groupby(level=categorie, observed=True).sum() / effectif
+    elif type_calcul == 'max':
+        valeurs = jours.groupby(level=categorie, observed=True).max()
+    else:
+        # Rang (à partir de 0) du quantile dans chaque catégorie, puis valeurs de rang inférieur et supérieur
+        # retrouvées par recherche dichotomique dans les effectifs cumulés de toutes les catégories
+        rang = (effectif.to_numpy() - 1) * QUANTILES[type_calcul]
+        debuts = np.cumsum(effectif.to_numpy()) - effectif.to_numpy()
+        cumul = np.cumsum(histogramme.to_numpy())
+        bas = jours.to_numpy()[np.searchsorted(cumul, debuts + np.floor(rang), side='right')]
+        haut = jours.to_numpy()[np.searchsorted(cumul, debuts + np.ceil(rang), side='right')]
+        valeurs = pd.Series(bas + (rang - np.floor(rang)) * (haut - bas), index=effectif.index)
+    resultats = pd.DataFrame({categorie: effectif.index, 'Jours': valeurs.round(1).to_numpy(), 'Effectif': effectif.to_numpy()})
+    return resultats.sort_values(by='Jours', ascending=False, ignore_index=True)
+
+# Fonction pour comparer une durée entre projets à partir de leurs seules esquisses : statistique de l'ensemble
+# des projets par catégorie, et tableau avec une colonne par projet
+@mesure('agregation')
+def durees_par_projet(esquisses_par_projet, duree, categorie, type_calcul):
+    esquisses = {nom: esquisse[esquisse['Durée'] == duree] for nom, esquisse in esquisses_par_projet.items()}
+    ensemble = statistique_esquisse(fusionner_esquisses(list(esquisses.values())), categorie, type_calcul)
+    return ensemble, tableau_durees(ensemble, {nom: statistique_esquisse(esquisse, categorie, type_calcul) for nom, esquisse in esquisses.items()}, categorie)
+
+# Fonction pour assembler le tableau de comparaison : statistique de l'ensemble des projets, nombre de durées
+# et une colonne par projet ({projet: statistique par catégorie})
+def tableau_durees(ensemble, statistiques_par_projet, categorie):
+    tableau = ensemble.rename(columns={'Jours': 'Ensemble des projets', 'Effectif': 'Durées'}).set_index(categorie)
+    for nom, statistiques in statistiques_par_projet.items():
+        tableau[nom] = statistiques.set_index(categorie)['Jours']
+    return tableau.reset_index()
+
+# Fonction pour obtenir les esquisses des durées d'un projet (DonneesProjet), en jours calendaires ou ouvrés,
+# calculées une seule fois par projet
+def esquisses_projet(projet, ouvres=False):
+    donnees = projet.vue_jours_ouvres() if ouvres else projet.donnees
+    demandes = demandes_visa_projet(projet, ouvres)
+    calendrier = projet.calendrier_ouvre() if ouvres else None
+    nom = 'Esquisses des durées en jours ouvrés' if ouvres else 'Esquisses des durées'
+    return projet.derivee(nom, lambda _: esquisses_durees(donnees, demandes, calendrier))
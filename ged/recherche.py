@@ -0,0 +1,155 @@
+# Recherche plein texte dans les libellés, les chemins et les commentaires des documents d'un projet.
+# L'index inversé est construit au chargement du projet : chaque mot, sans accents ni majuscules, renvoie
+# aux lignes qui le contiennent, et un index de trigrammes sur le vocabulaire retrouve les mots qui
+# contiennent un fragment saisi. Une recherche ne parcourt que les lignes des mots trouvés.
+import bisect
+import functools
+import math
+import re
+import sys
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from ged.identite import COLONNE_ID
+from ged.profilage import mesure
+
+# Champs indexés et poids de leurs mots dans le score
+CHAMP_LIBELLE = 'Libellé du document'
+CHAMP_CHEMIN = 'Chemin vers le fichier'
+POIDS_LIBELLE = 3.0
+POIDS_CHEMIN = 1.0
+POIDS_COMMENTAIRE = 1.0
+
+# Poids d'un mot qui contient seulement le fragment recherché
+POIDS_PARTIEL = 0.5
+
+# Colonnes qui décrivent un document dans les résultats, d'après sa dernière révision
+COLONNES_DOCUMENT = ['TYPE DE DOCUMENT', 'LOT', 'Libellé du document']
+
+MOT = re.compile(r'\w+')
+
+# Fonction pour retirer les accents d'un mot. Les mots reviennent sans cesse d'une ligne à l'autre : le résultat est mis en cache
+@functools.lru_cache(maxsize=2**16)
+def sans_accents(mot):
+    if mot.isascii():
+        return mot
+    return ''.join(caractere for caractere in unicodedata.normalize('NFKD', mot) if not unicodedata.combining(caractere))
+
+# Fonction pour ramener un texte à ses mots sans accents ni majuscules
+def mots(texte):
+    return [sans_accents(mot) for mot in MOT.findall(str(texte).casefold())]
+
+# Fonction pour lister les trigrammes d'un mot
+def trigrammes(mot):
+    return {mot[i:i + 3] for i in range(len(mot) - 2)}
+
+# Fonction pour lister les champs indexés d'un export et leur poids : libellé, chemin et tous les commentaires
+def champs_indexes(colonnes):
+    champs = {CHAMP_LIBELLE: POIDS_LIBELLE, CHAMP_CHEMIN: POIDS_CHEMIN}
+    champs.update({colonne: POIDS_COMMENTAIRE for colonne in colonnes if colonne.startswith(('Commentaire', 'Réponse commentaire'))})
+    return {colonne: poids for colonne, poids in champs.items() if colonne in colonnes}
+
+# Index inversé d'un projet : pour chaque mot, les lignes qui le contiennent (triées) et le poids du mot dans chaque ligne
+class IndexTexte:
+    def __init__(self, postings, nombre_lignes):
+        self.nombre_lignes = nombre_lignes
+        self.vocabulaire = postings.index.get_level_values('mot').unique()
+        bornes = np.searchsorted(postings.index.get_level_values('mot'), self.vocabulaire)
+        self._bornes = dict(zip(self.vocabulaire, zip(bornes, np.append(bornes[1:], len(postings)))))
+        self._lignes = postings.index.get_level_values('ligne').to_numpy()
+        self._poids = postings.to_numpy()
+        self._trigrammes = {}
+        for mot in self.vocabulaire:
+            for trigramme in trigrammes(mot):
+                self._trigrammes.setdefault(trigramme, []).append(mot)
+        self._tries = sorted(self.vocabulaire)
+
+    # Mémoire occupée par l'index (tableaux des lignes et des poids, vocabulaire et trigrammes)
+    def octets(self):
+        dictionnaires = sys.getsizeof(self._bornes) + sys.getsizeof(self._trigrammes) + sum(sys.getsizeof(mots) for mots in self._trigrammes.values())
+        return int(self._lignes.nbytes + self._poids.nbytes + self.vocabulaire.memory_usage(deep=True) + dictionnaires)
+
+    # Lignes et poids d'un mot du vocabulaire, pondérés par sa rareté dans le projet
+    def postings(self, mot):
+        debut, fin = self._bornes[mot]
+        rarete = math.log(1 + self.nombre_lignes / (fin - debut))
+        return self._lignes[debut:fin], self._poids[debut:fin] * rarete
+
+    # Mots du vocabulaire qui contiennent un fragment (qui commencent par lui s'il fait deux caractères,
+    # le mot exact seulement pour un caractère)
+    def mots_contenant(self, fragment):
+        if len(fragment) == 1:
+            return [fragment] if fragment in self._bornes else []
+        if len(fragment) == 2:
+            debut = bisect.bisect_left(self._tries, fragment)
+            fin = bisect.bisect_left(self._tries, fragment + '￿')
+            return self._tries[debut:fin]
+        candidats = None
+        for trigramme in trigrammes(fragment):
+            mots_trigramme = set(self._trigrammes.get(trigramme, ()))
+            candidats = mots_trigramme if candidats is None else candidats & mots_trigramme
+            if not candidats:
+                return []
+        return [mot for mot in candidats if fragment in mot]
+
+# Fonction pour construire l'index inversé d'un projet. Chaque valeur distincte d'un champ n'est découpée
+# qu'une fois, puis ses mots sont reportés sur toutes les lignes qui la portent
+@mesure('pretraitement')
+def indexer_textes(donnees):
+    parties = []
+    for colonne, poids in champs_indexes(donnees.columns).items():
+        codes, valeurs = pd.factorize(donnees[colonne])
+        mots_valeurs = pd.Series([mots(valeur) for valeur in valeurs], dtype=object).explode().dropna().rename('mot')
+        lignes = pd.Series(np.arange(len(codes)), index=codes, name='ligne')
+        parties.append(mots_valeurs.to_frame().join(lignes, how='inner').assign(poids=poids))
+    if not parties:
+        return IndexTexte(pd.Series([], dtype=float, index=pd.MultiIndex.from_arrays([[], []], names=['mot', 'ligne'])), len(donnees))
+    # Un mot présent dans plusieurs champs d'une ligne garde le poids du champ le plus important
+    postings = pd.concat(parties, ignore_index=True).groupby(['mot', 'ligne'])['poids'].max()
+    return IndexTexte(postings, len(donnees))
+
+# Fonction pour obtenir l'index inversé d'un projet (DonneesProjet), construit une seule fois par projet
+def index_texte(projet):
+    return projet.derivee('Index texte', indexer_textes)
+
+# Fonction pour rechercher des documents : les lignes qui contiennent le plus de mots de la requête passent
+# en premier, puis celles dont le score (poids des champs, rareté des mots) est le plus élevé
+@mesure('recherche')
+def rechercher(index, requete):
+    termes = list(dict.fromkeys(mots(requete)))
+    lignes, scores, termes_trouves = [], [], []
+    for numero, terme in enumerate(termes):
+        for mot in index.mots_contenant(terme):
+            lignes_mot, poids_mot = index.postings(mot)
+            lignes.append(lignes_mot)
+            scores.append(poids_mot * (1.0 if mot == terme else POIDS_PARTIEL))
+            termes_trouves.append(np.full(len(lignes_mot), numero))
+    if not lignes:
+        return pd.DataFrame({'ligne': pd.Series(dtype='int64'), 'Termes trouvés': pd.Series(dtype='int64'), 'Score': pd.Series(dtype=float)})
+    resultats = pd.DataFrame({'ligne': np.concatenate(lignes), 'terme': np.concatenate(termes_trouves), 'Score': np.concatenate(scores)})
+    # Un terme compte une fois par ligne, avec le meilleur des mots qui le contiennent
+    par_terme = resultats.groupby(['ligne', 'terme'])['Score'].max().reset_index()
+    par_ligne = par_terme.groupby('ligne').agg(**{'Termes trouvés': ('terme', 'size'), 'Score': ('Score', 'sum')}).reset_index()
+    return par_ligne.sort_values(['Termes trouvés', 'Score'], ascending=False, ignore_index=True)
+
+# Fonction pour regrouper les lignes trouvées par document, avec sa dernière révision et son meilleur score.
+# Les documents trouvés sont indexés par leur identifiant
+def documents_trouves(donnees, resultats, limite=100):
+    lignes = donnees.iloc[resultats['ligne']].assign(**{'Termes trouvés': resultats['Termes trouvés'].to_numpy(), 'Score': resultats['Score'].to_numpy()})
+    lignes = lignes.sort_values('Date dépôt GED')
+    documents = lignes.groupby(COLONNE_ID, sort=False).agg(**{colonne: (colonne, 'last') for colonne in COLONNES_DOCUMENT}, **{
+        'Termes trouvés': ('Termes trouvés', 'max'),
+        'Score': ('Score', 'max'),
+        'Dernier indice': ('INDICE', 'last'),
+        'Dernier dépôt': ('Date dépôt GED', 'last'),
+        'Révisions': ('INDICE', 'size'),
+        'Chemin': (CHAMP_CHEMIN, 'last')
+    })
+    documents['Score'] = documents['Score'].round(2)
+    return documents.sort_values(['Termes trouvés', 'Score'], ascending=False, kind='stable').head(limite)
+
+# Fonction pour obtenir toutes les révisions d'un document, de la plus ancienne à la plus récente
+def historique_document(donnees, document):
+    return donnees[donnees[COLONNE_ID].eq(document)].sort_values('Date dépôt GED')
@@ -0,0 +1,58 @@
+import pandas as pd
+from datetime import timedelta
+
+from ged.profilage import mesure
+
+# Origine utilisée pour convertir les dates en nombres
+EPOCH = pd.Timestamp('1970-01-01')
+
+# Filtrer les données par période
+@mesure('agregation')
+def filtrer_donnees_par_periode(donnees, periode):
+    date_debut = donnees['Date dépôt GED'].min()
+    if periode == '6 mois':
+        date_fin = date_debut + timedelta(days=180)
+    elif periode == '1 an':
+        date_fin = date_debut + timedelta(days=365)
+    else:
+        date_fin = donnees['Date dépôt GED'].max()
+
+    return donnees[(donnees['Date dépôt GED'] >= date_debut) & (donnees['Date dépôt GED'] <= date_fin)]
+
+# Calculer la séquence moyenne des documents par type
+@mesure('agregation')
+def calculer_sequence_moyenne(donnees):
+    jours = (donnees['Date dépôt GED'] - EPOCH).dt.days
+    moyenne_jours = jours.groupby(donnees['TYPE DE DOCUMENT']).mean().round()
+    moyenne_dates = (EPOCH + pd.to_timedelta(moyenne_jours, unit='D')).reset_index()
+    moyenne_dates.columns = ['Type de Document', 'Date Moyenne de Dépôt GED']
+    return moyenne_dates
+
+# Convertir les dates de dépôt en secondes pour les modèles
+def horodatages(donnees):
+    return (donnees['Date dépôt GED'] - EPOCH).dt.total_seconds().to_frame('Timestamp')
+
+# Regrouper les documents par date de dépôt
+@mesure('agregation')
+def calculer_clusters(donnees, n_clusters=3):
+    # scikit-learn n'est importé qu'à la première analyse séquentielle (plus d'une seconde au démarrage)
+    from sklearn.cluster import KMeans
+    kmeans = KMeans(n_clusters=min(n_clusters, len(donnees)))
+    return pd.Series(kmeans.fit_predict(horodatages(donnees)), index=donnees.index, name='Cluster')
+
+# Détection des anomalies dans la séquence de diffusion des documents
+@mesure('agregation')
+def detecter_anomalies(donnees):
+    from sklearn.ensemble import IsolationForest
+    model = IsolationForest(contamination=0.05)
+    return pd.Series(model.fit_predict(horodatages(donnees)), index=donnees.index, name='Anomalie')
+
+# Résumé statistique par type de document
+@mesure('agregation')
+def resume_statistique(donnees):
+    resume = donnees.groupby('TYPE DE DOCUMENT').agg({
+        'Date dépôt GED': ['min', 'max'],
+        'Durée entre versions': 'mean'
+    }).reset_index()
+    resume.columns = ['Type de Document', 'Date début', 'Date fin', 'Durée moyenne entre versions (jours)']
+    return resume
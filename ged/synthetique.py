@@ -0,0 +1,214 @@
+# Génération d'exports GED synthétiques pour mesurer le comportement des tableaux de bord sur de gros projets.
+# Les exports reprennent la disposition des exports réels (168 colonnes, blocs de visa par relecteur,
+# encodage latin-1, séparateur ';') et des distributions proches de celles des projets existants.
+import numpy as np
+import pandas as pd
+
+from ged.config import ENCODAGE, SEPARATEUR, FORMAT_DATE
+
+# Colonnes décrivant le document, dans l'ordre de l'export
+COLONNES_DOCUMENT = [
+    'PROJET', 'PHASE', 'EMET', 'LOT', 'NIVEAU', 'ZONE', 'TYPE DE DOCUMENT', 'Numéro', 'INDICE',
+    'Libellé du document', 'Dernier indice', 'Date dépôt GED', 'Date de réception papier', 'Ajouté par',
+    'Chemin vers le fichier', 'Commentaire libre', 'Réponse commentaire libre', 'Délai de Réémission'
+]
+
+# Relecteurs et probabilité qu'un document leur soit soumis pour visa
+RELECTEURS = {
+    'CSSI': 0.34,
+    'MOEX - OMEGA': 0.98,
+    'ARC - ATELIER NORD': 0.95,
+    'DECORATEUR - STUDIO D': 0.30,
+    'PAYSAGISTE - VERT': 0.06,
+    'BET FACADES - FACETTE': 0.14,
+    'BET STRUCTURE - STRUCTA': 0.28,
+    'BET POLLUTION DES SOLS - GEOSOL': 0.01,
+    'BET GEOTECHNIQUE - GEOTEC': 0.01,
+    'BET FLUIDES - FLUIDIS': 0.42,
+    'BET CUISINES - CUISINA': 0.04,
+    'BET ACOUSTIQUE - ACOUSTICA': 0.56,
+    'CONTROLEUR TECHNIQUE - CONTROLA': 0.99,
+    'AMO ENVIRONNEMENT - ECOLOGIA': 0.24,
+    'AMO COMMISSIONNING - ECOLOGIA': 0.01,
+    'CSPS - CONTROLA': 0.01
+}
+
+# Colonnes d'un bloc de visa : préfixe suivi du nom du relecteur
+PREFIXES_VISA = [
+    'Date demande visa', 'Retard visa', 'Date visa', 'Visa', 'Visa prévu',
+    'Numéro chrono visa', 'Numéro interne visa', 'Commentaire visa', 'Réponse commentaire visa'
+]
+
+# Colonnes vides en fin d'export
+COLONNES_VIDES = [f'Column{numero}' for numero in range(163, 169)]
+
+COLONNES = COLONNES_DOCUMENT + [prefixe + relecteur for relecteur in RELECTEURS for prefixe in PREFIXES_VISA] + COLONNES_VIDES
+
+# Lots, intitulés et nombre de documents observés sur un projet réel (utilisé comme poids)
+LOTS = {
+    '01A': ('Gros-oeuvre - Installations de chantier', 1105), '17': ('Electricité courants forts', 544),
+    '3': ('Façades - Verrières', 406), '14': ('Chauffage - Ventilation - Climatisation - Désenfumage', 325),
+    '15': ('Plomberie', 251), '19': ('Electricité courants faibles - SSI', 219), '6': ('Menuiseries intérieures', 127),
+    '22': ('Ascenseurs', 118), '7': ('Serrurerie - Métallerie', 116), '23': ('Aménagements Extérieurs - Espaces verts', 116),
+    '2': ('Charpente - Couverture', 102), '24': ('Cuisines', 98), '16': ('Sprinklage', 86), '5': ('Cloisons - Doublages', 78),
+    '9': ('Faux-plafonds', 76), '20': ('Gestion technique du bâtiment', 68), '21': ('Désamiantage', 66),
+    '10': ('Faux-planchers', 44), '11': ('Revêtements de sols et murs durs', 38), '01B': ('Fondations spéciales', 38),
+    '13': ('Peinture', 37), '4': ('Etanchéité', 17), '12': ('Revêtements de sols souples', 13)
+}
+
+TYPES_DOCUMENT = {
+    'DAF': 971, 'PLN': 625, 'PCO': 528, 'PRE': 304, 'PRX': 281, 'NDC': 267, 'SCH': 216, 'PFE': 210, 'DET': 121,
+    'PDR': 77, 'PTH': 67, 'MTH': 61, 'PMQ': 57, 'PAQ': 46, 'PTB': 35, 'ELV': 34, 'PGX': 32, 'NTE': 26, 'CPE': 24,
+    'SYN': 23, 'PSY': 18, 'PPR': 14, 'LDO': 10, 'PIC': 9, 'PPH': 8, 'PPS': 7, 'ANF': 3, 'FEE': 3, 'MQT': 3,
+    'PLG': 2, 'CRE': 2, 'PVX': 2, 'RBC': 1, 'FAU': 1
+}
+
+NIVEAUX = {
+    'TNX': 1688, 'RDC': 299, 'SS1': 252, 'SS2': 170, 'R+2': 169, 'R+1': 166, '_': 156, 'R+6': 151, 'R+7': 139,
+    'R+3': 139, 'R+4': 136, 'SS5': 134, 'R+5': 127, 'R+8': 125, 'SS3': 120, 'SS4': 90, 'NTT': 27
+}
+
+ZONES = {'TZN': 3198, 'A': 289, 'B': 237, 'C': 227, '_': 137}
+
+EMETTEURS = ['DUM', 'CEG', 'LEF', 'SIM', 'MRG', 'KON']
+
+DOSSIERS = ['Pièces graphiques', 'Fiches Produits (DAF)', 'Documents généraux', 'Pièces écrites hors DAF']
+
+# Vocabulaire des libellés de documents
+OBJETS = [
+    'Plan de cloisonnement', 'Carnet de détails', 'Coupe de principe', 'Note de calcul', 'Fiche technique',
+    'Synoptique', 'Plan de réservations', 'Calepinage', 'Plan de repérage', 'Schéma de principe',
+    'Tableau des portes', 'PV feu', 'Plan de coffrage', 'Plan des faux-plafonds', 'Plan de distribution',
+    'Nomenclature', 'Plan d\'implantation', 'Elévation', 'Notice de fonctionnement', 'Plan de ferraillage'
+]
+OUVRAGES = [
+    'CLOISON VITREE', 'PORTE CF', 'GAINE TECHNIQUE', 'TRÉMIE', 'PALIER', 'TERRASSE', 'LOCAL TECHNIQUE',
+    'CAGE ESCALIER', 'PARKING', 'HALL', 'FACADE NORD', 'FACADE SUD', 'TOITURE', 'SANITAIRES', 'BUREAUX'
+]
+
+PRENOMS = ['Manon', 'Nicolas', 'Julie', 'Thomas', 'Camille', 'Hugo', 'Sarah', 'Lucas', 'Léa', 'Antoine']
+NOMS = ['MARTIN', 'BERNARD', 'PETIT', 'DURAND', 'LEROY', 'MOREAU', 'FOURNIER', 'GIRARD', 'BONNET', 'LAMBERT']
+
+# Avis de visa et fréquence observée
+AVIS_VISA = {'VAO': 0.63, 'VAOB': 0.18, 'VSO': 0.14, 'REF': 0.05}
+
+COMMENTAIRES = [
+    'Prendre en compte le visa du BET',
+    'A présenter et faire valider au contrôleur technique',
+    'Manque le folio montrant la face avant',
+    'Sous réserve de l\'avis du bureau de contrôle',
+    'Nous ne visons pas les autocontrôles',
+    'Compléter les cotes de réservation'
+]
+
+# Nombre maximal d'indices d'un document (A à Z)
+INDICES_MAX = 26
+
+# Paramètres des chaînes de révision : longueur géométrique et délai moyen entre deux indices
+PROBABILITE_FIN_CHAINE = 0.5
+DELAI_MOYEN_JOURS = 35
+
+# Taille des blocs générés puis écrits successivement dans le fichier
+TAILLE_BLOC = 100_000
+
+# Fonction pour convertir des effectifs en probabilités
+def _poids(effectifs):
+    valeurs = np.asarray(list(effectifs), dtype=float)
+    return valeurs / valeurs.sum()
+
+# Fonction pour formater des jours (depuis le début du projet) en dates de l'export
+def _formater_jours(jours, debut, presents=None):
+    jours = np.asarray(jours)
+    calendrier = np.array((debut + pd.to_timedelta(np.arange(jours.max() + 1), unit='D')).strftime(FORMAT_DATE), dtype=object)
+    dates = calendrier[jours]
+    if presents is not None:
+        dates[~presents] = None
+    return dates
+
+# Fonction pour générer un bloc de lignes, chaque document ayant une chaîne de révisions A, B, C...
+def generer_bloc(rng, n_lignes, premier_numero=0, debut=pd.Timestamp('2022-01-03'), duree_jours=900):
+    # Longueur de chaque chaîne de révision, la dernière étant tronquée pour obtenir exactement n_lignes
+    longueurs = np.minimum(rng.geometric(PROBABILITE_FIN_CHAINE, size=n_lignes), INDICES_MAX)
+    cumul = np.cumsum(longueurs)
+    n_documents = int(np.searchsorted(cumul, n_lignes)) + 1
+    longueurs = longueurs[:n_documents]
+    longueurs[-1] -= cumul[n_documents - 1] - n_lignes
+    debuts_chaine = np.concatenate(([0], np.cumsum(longueurs)[:-1]))
+    document = np.repeat(np.arange(n_documents), longueurs)
+    rang = np.arange(n_lignes) - debuts_chaine[document]
+
+    # Attributs de chaque document
+    codes_lot = np.array(list(LOTS), dtype=object)
+    lot = rng.choice(len(LOTS), size=n_documents, p=_poids(effectif for _, effectif in LOTS.values()))
+    type_document = rng.choice(np.array(list(TYPES_DOCUMENT), dtype=object), size=n_documents, p=_poids(TYPES_DOCUMENT.values()))
+    niveau = rng.choice(np.array(list(NIVEAUX), dtype=object), size=n_documents, p=_poids(NIVEAUX.values()))
+    zone = rng.choice(np.array(list(ZONES), dtype=object), size=n_documents, p=_poids(ZONES.values()))
+    numero = np.arange(premier_numero, premier_numero + n_documents)
+    auteurs = np.array([f'{prenom} {nom}' for prenom in PRENOMS for nom in NOMS], dtype=object)
+    auteur = auteurs[(lot * 7 + rng.integers(0, 3, size=n_documents)) % len(auteurs)]
+    chemins = np.array([f"/01 - DOCUMENTS D'EXECUTION/Lot {code.zfill(2)} - {intitule}/{dossier}"
+                        for code, (intitule, _) in LOTS.items() for dossier in DOSSIERS], dtype=object)
+    chemin = chemins[lot * len(DOSSIERS) + rng.integers(0, len(DOSSIERS), size=n_documents)]
+    libelle = (pd.Series(rng.choice(np.array(OBJETS, dtype=object), size=n_documents)) + ' '
+               + pd.Series(rng.choice(np.array(OUVRAGES, dtype=object), size=n_documents)) + ' '
+               + pd.Series(niveau) + ' - ' + pd.Series(type_document) + pd.Series(numero).astype(str).str.zfill(6) + '.pdf').to_numpy()
+
+    # Dates de dépôt : premier dépôt dans la durée du projet puis délais exponentiels entre indices
+    delais = rng.exponential(DELAI_MOYEN_JOURS, size=n_lignes).astype(np.int64) + 1
+    delais[rang == 0] = 0
+    cumul_delais = np.cumsum(delais)
+    jours = rng.integers(0, duree_jours, size=n_documents)[document] + cumul_delais - cumul_delais[debuts_chaine][document]
+
+    colonnes = {
+        'PROJET': np.full(n_lignes, 'SYN', dtype=object),
+        'PHASE': np.full(n_lignes, 'EXE', dtype=object),
+        'EMET': np.array(EMETTEURS, dtype=object)[lot % len(EMETTEURS)][document],
+        'LOT': codes_lot[lot][document],
+        'NIVEAU': niveau[document],
+        'ZONE': zone[document],
+        'TYPE DE DOCUMENT': type_document[document],
+        'Numéro': numero[document],
+        'INDICE': np.array([chr(ord('A') + i) for i in range(INDICES_MAX)], dtype=object)[rang],
+        'Libellé du document': libelle[document],
+        'Dernier indice': np.where(rang == longueurs[document] - 1, 'DI', None),
+        'Date dépôt GED': _formater_jours(jours, debut),
+        'Ajouté par': auteur[document],
+        'Chemin vers le fichier': chemin[document]
+    }
+    commentaire = rng.random(n_lignes) < 0.05
+    colonnes['Commentaire libre'] = np.where(commentaire, rng.choice(np.array(COMMENTAIRES, dtype=object), size=n_lignes), None)
+    colonnes['Réponse commentaire libre'] = np.where(commentaire, 'Aucune réponse au commentaire #1', None)
+    colonnes['Délai de Réémission'] = np.where((rang > 0) & (rng.random(n_lignes) < 0.3), delais.astype(str), None)
+
+    # Blocs de visa : demande le jour du dépôt, avis rendu après un délai exponentiel
+    chrono = 0
+    for relecteur, probabilite in RELECTEURS.items():
+        demande = rng.random(n_lignes) < probabilite
+        rendu = demande & (rng.random(n_lignes) < 0.65)
+        prevu = demande & (rng.random(n_lignes) < 0.4)
+        delai_visa = rng.exponential(12, size=n_lignes).astype(np.int64)
+        retard = np.where(rendu & prevu, (delai_visa - 14).astype(str), None)
+        colonnes['Date demande visa' + relecteur] = _formater_jours(jours, debut, demande)
+        colonnes['Retard visa' + relecteur] = retard
+        colonnes['Date visa' + relecteur] = _formater_jours(jours + delai_visa, debut, rendu)
+        colonnes['Visa' + relecteur] = np.where(rendu, rng.choice(np.array(list(AVIS_VISA), dtype=object), size=n_lignes, p=_poids(AVIS_VISA.values())), None)
+        colonnes['Visa prévu' + relecteur] = _formater_jours(jours + 14, debut, prevu)
+        colonnes['Numéro chrono visa' + relecteur] = np.where(rendu, (chrono + np.cumsum(rendu)).astype(str), None)
+        colonnes['Commentaire visa' + relecteur] = np.where(rendu & (rng.random(n_lignes) < 0.2), rng.choice(np.array(COMMENTAIRES, dtype=object), size=n_lignes), None)
+        chrono += int(rendu.sum())
+
+    return pd.DataFrame(colonnes).reindex(columns=COLONNES)
+
+# Fonction pour écrire un export synthétique de n_lignes, bloc par bloc pour borner la mémoire
+def ecrire_export(chemin, n_lignes, graine=0, taille_bloc=TAILLE_BLOC):
+    rng = np.random.default_rng(graine)
+    premier_numero = 0
+    ecrites = 0
+    with open(chemin, 'w', encoding=ENCODAGE, newline='') as fichier:
+        while ecrites < n_lignes:
+            taille = min(taille_bloc, n_lignes - ecrites)
+            bloc = generer_bloc(rng, taille, premier_numero)
+            bloc.to_csv(fichier, sep=SEPARATEUR, index=False, header=ecrites == 0)
+            premier_numero = int(bloc['Numéro'].iloc[-1]) + 1
+            ecrites += taille
+    return chemin
@@ -0,0 +1,104 @@
+import pandas as pd
+
+from ged.config import FORMAT_DATE
+from ged.jours_ouvres import duree_en_jours
+from ged.profilage import mesure
+
+# Colonnes d'un bloc de visa utilisées pour les délais : préfixe suivi du nom du relecteur
+PREFIXE_DEMANDE = 'Date demande visa'
+COLONNES_VISA = {'Date demande': 'Date demande visa', 'Date visa': 'Date visa', 'Visa prévu': 'Visa prévu'}
+
+# Catégories proposées pour le détail des délais par relecteur
+CATEGORIES = ['LOT', 'TYPE DE DOCUMENT']
+
+# Fonction pour lister les relecteurs d'un export à partir de ses blocs de visa
+def relecteurs(colonnes):
+    return [colonne.removeprefix(PREFIXE_DEMANDE) for colonne in colonnes if colonne.startswith(PREFIXE_DEMANDE)]
+
+# Fonction pour construire l'index des demandes de visa : une ligne par document soumis à un relecteur,
+# avec le délai de réponse et le retard sur la date prévue. Les dates de tous les relecteurs sont
+# converties en une seule fois, sur les seules lignes où un visa a été demandé. Les délais sont comptés en
+# jours calendaires, ou en jours ouvrés du calendrier donné
+@mesure('pretraitement')
+def demandes_visa(donnees, calendrier=None):
+    parties = []
+    for relecteur in relecteurs(donnees.columns):
+        colonnes = {nom: prefixe + relecteur for nom, prefixe in COLONNES_VISA.items() if prefixe + relecteur in donnees.columns}
+        partie = donnees.loc[donnees[PREFIXE_DEMANDE + relecteur].notna(), CATEGORIES + list(colonnes.values())]
+        parties.append(partie.rename(columns={colonne: nom for nom, colonne in colonnes.items()}).assign(Relecteur=relecteur))
+    demandes = pd.concat(parties, ignore_index=True) if parties else pd.DataFrame(columns=CATEGORIES + list(COLONNES_VISA) + ['Relecteur'])
+    demandes = demandes.reindex(columns=CATEGORIES + ['Relecteur'] + list(COLONNES_VISA))
+    for colonne in COLONNES_VISA:
+        demandes[colonne] = pd.to_datetime(demandes[colonne].astype(object), format=FORMAT_DATE, errors='coerce')
+    demandes['Relecteur'] = demandes['Relecteur'].astype('category')
+
+    # Les visas encore attendus sont comptés en retard à partir de la date du dernier dépôt de l'export
+    date_reference = donnees['Date dépôt GED'].max()
+    delai = duree_en_jours(demandes['Date demande'], demandes['Date visa'], calendrier)
+    demandes['Délai (jours)'] = delai.where(delai >= 0)
+    demandes['En attente'] = demandes['Date visa'].isna()
+    retard = duree_en_jours(demandes['Visa prévu'], demandes['Date visa'].fillna(date_reference), calendrier)
+    demandes['Jours de retard'] = retard.clip(lower=0).fillna(0)
+    demandes['En retard'] = demandes['Jours de retard'] > 0
+    return demandes.drop(columns=['Visa prévu'])
+
+# Fonction pour agréger les délais de visa par relecteur, et éventuellement par catégorie
+@mesure('agregation')
+def delais_par_relecteur(demandes, colonnes):
+    groupes = demandes.groupby(colonnes, observed=True)
+    delais = groupes.agg(**{
+        'Demandes': ('Relecteur', 'size'),
+        'Rendus': ('Délai (jours)', 'count'),
+        'En attente': ('En attente', 'sum'),
+        'Délai moyen': ('Délai (jours)', 'mean'),
+        'Délai médian': ('Délai (jours)', 'median'),
+        'En retard': ('En retard', 'sum'),
+        'Jours de retard': ('Jours de retard', 'sum')
+    })
+    delais.insert(5, 'Délai p90', groupes['Délai (jours)'].quantile(0.9))
+    delais[['Délai moyen', 'Délai médian', 'Délai p90']] = delais[['Délai moyen', 'Délai médian', 'Délai p90']].round(1)
+    return delais.reset_index().sort_values(['Jours de retard', 'En attente'], ascending=False, ignore_index=True)
+
+# Fonction pour calculer, jour par jour, le nombre de visas en attente pour chaque relecteur ou chaque lot.
+# Chaque demande ouvre un intervalle du jour de la demande au jour du visa (ou jusqu'à la fin de l'export) :
+# les ouvertures (+1) et fermetures (-1) sont regroupées par jour, puis une somme cumulée donne toute la courbe
+@mesure('agregation')
+def visas_en_attente(demandes, colonne, date_fin):
+    valides = demandes[demandes['Date visa'].isna() | (demandes['Date visa'] >= demandes['Date demande'])]
+    rendus = valides[valides['Date visa'].notna()]
+    evenements = pd.concat([
+        pd.DataFrame({'Jour': valides['Date demande'], colonne: valides[colonne], 'Variation': 1}),
+        pd.DataFrame({'Jour': rendus['Date visa'], colonne: rendus[colonne], 'Variation': -1})
+    ])
+    variations = evenements.groupby(['Jour', colonne], observed=True)['Variation'].sum().unstack(fill_value=0)
+    if variations.empty:
+        return variations
+    jours = pd.date_range(variations.index.min(), max(variations.index.max(), date_fin), name='Jour')
+    return variations.reindex(jours, fill_value=0).cumsum()
+
+# Fonction pour obtenir les demandes de visa d'un projet, avec leurs délais en jours calendaires ou ouvrés
+def demandes_visa_projet(projet, ouvres=False):
+    if not ouvres:
+        return projet.derivee('Demandes de visa', demandes_visa)
+    calendrier = projet.calendrier_ouvre()
+    return projet.derivee('Demandes de visa en jours ouvrés', lambda base: demandes_visa(base, calendrier))
+
+# Fonction pour obtenir les délais de visa d'un projet (DonneesProjet), calculés une seule fois par projet
+def delais_visa(projet, categorie=None, ouvres=False):
+    demandes = demandes_visa_projet(projet, ouvres)
+    suffixe = ' en jours ouvrés' if ouvres else ''
+    if categorie is None:
+        return projet.derivee('Délais de visa' + suffixe, lambda _: delais_par_relecteur(demandes, ['Relecteur']))
+    return projet.derivee(f'Délais de visa par {categorie}{suffixe}', lambda _: delais_par_relecteur(demandes, ['Relecteur', categorie]))
+
+# Fonction pour obtenir les visas en attente jour par jour d'un projet, par relecteur ou par lot, calculés une seule fois
+def attente_visa(projet, colonne):
+    demandes = demandes_visa_projet(projet)
+    return projet.derivee(f'Visas en attente par {colonne}', lambda base: visas_en_attente(demandes, colonne, base['Date dépôt GED'].max()))
+
+# Fonction pour construire tous les délais et visas en attente d'un projet dès son chargement
+def indexer_visas(projet):
+    for categorie in [None] + CATEGORIES:
+        delais_visa(projet, categorie)
+    for colonne in ['Relecteur', 'LOT']:
+        attente_visa(projet, colonne)
@@ -0,0 +1,392 @@
+import pandas as pd
+import streamlit as st
+
+from ged import agregations, alertes, base_analytique, doublons, dossiers, graphiques, interface, quantiles, recherche, sequences, visas
+from ged.cache import entrepot, obtenir_projet, projet_dans_base
+from ged.projet import jours_depot_tries, mois_depot
+
+# Les pages dont les widgets ne modifient que leurs propres graphiques sont des fragments : changer un widget
+# ne réexécute que la page (ou la partie concernée), sans l'en-tête, la barre latérale ni la sélection du projet,
+# et le projet partagé reste celui de la dernière exécution complète
+
+# Page 1: Flux des documents
+def flux_des_documents(projet, projet_selectionne, sources):
+    st.header("Flux des documents")
+    donnees = projet.donnees
+    etiquettes_noeuds, liens = agregations.flux_documents(donnees)
+    interface.afficher_graphique(graphiques.figure_sankey(etiquettes_noeuds, liens), use_container_width=True)
+
+# Page 2: Recherche de documents
+@interface.fragment
+def recherche_de_documents(projet, projet_selectionne, sources):
+    st.header("Recherche de documents")
+    requete = st.text_input("Rechercher dans les libellés, les chemins et les commentaires", key='requete_documents')
+    if not requete.strip():
+        return
+    donnees = projet.donnees
+    resultats = recherche.rechercher(recherche.index_texte(projet), requete)
+    documents = recherche.documents_trouves(donnees, resultats)
+    if documents.empty:
+        st.write("Aucun document trouvé.")
+        return
+    st.caption(f"{len(resultats)} révisions trouvées, {len(documents)} documents affichés")
+    st.dataframe(documents, hide_index=True)
+
+    # Historique complet du document choisi
+    choix = st.selectbox("Historique du document", documents.index, format_func=lambda i: f"{documents.at[i, 'Libellé du document']} ({documents.at[i, 'LOT']}, {documents.at[i, 'TYPE DE DOCUMENT']})", key='document_historique')
+    historique = recherche.historique_document(donnees, choix)
+    st.dataframe(historique[['INDICE', 'Date dépôt GED', 'EMET', 'Ajouté par', recherche.CHAMP_CHEMIN, 'Durée entre versions']], hide_index=True)
+
+# Page 3: Évolution des types de documents
+@interface.fragment
+def evolution_des_types(projet, projet_selectionne, sources):
+    st.header("Évolution des types de documents")
+    donnees = projet.donnees
+    options_type_document = donnees['TYPE DE DOCUMENT'].unique()
+    types_selectionnes = st.multiselect('Sélectionnez les types de document', options_type_document, default=options_type_document[0], key='tab1_types')
+    donnees_groupees = agregations.evolution_types(donnees, projet.derivee('Mois dépôt', mois_depot))
+    interface.afficher_graphique(graphiques.figure_evolution(donnees_groupees, types_selectionnes, projet_selectionne), use_container_width=True)
+
+# Page 4: Visas en attente au fil du temps
+@interface.fragment
+def visas_en_attente(projet, projet_selectionne, sources):
+    st.header("Visas en attente")
+    colonne = st.radio('Regrouper par', ['Relecteur', 'LOT'], horizontal=True, key='attente_par')
+    attente = visas.attente_visa(projet, colonne)
+    if attente.empty:
+        st.write("Aucune demande de visa dans cet export.")
+        return
+    # Les séries sont proposées de la plus chargée à la moins chargée à la dernière date de l'export
+    options = attente.iloc[-1].sort_values(ascending=False).index.tolist()
+    selection = st.multiselect(f'Sélectionnez les {"relecteurs" if colonne == "Relecteur" else "lots"}', options, key=f'attente_{colonne}')
+    if selection:
+        attente = attente[selection]
+    interface.afficher_graphique(graphiques.figure_visas_en_attente(attente, f'Visas en attente par {colonne.lower()} pour {projet_selectionne}', colonne), use_container_width=True)
+
+# Page 5: Analyse des documents par lot et indice
+@interface.fragment
+def analyse_lot_indice(projet, projet_selectionne, sources):
+    st.header("Analyse des documents par lot et indice")
+    donnees = projet.donnees
+    index_filtres = projet.index_filtres()
+    indices_selectionnes = st.multiselect('Sélectionnez un ou plusieurs indices', index_filtres.valeurs['INDICE'], key='tab3_indices')
+    if indices_selectionnes:
+        donnees = donnees[index_filtres.masque({'INDICE': indices_selectionnes})]
+
+    comptes = agregations.repartition(donnees, ['LOT', 'TYPE DE DOCUMENT', 'INDICE'])
+    interface.afficher_graphique(graphiques.figure_treemap(comptes, ['LOT', 'INDICE'], 'Répartition des documents par lot et indice', 500), use_container_width=True)
+    interface.afficher_graphique(graphiques.figure_treemap(comptes, ['TYPE DE DOCUMENT', 'INDICE'], 'Répartition des documents par type de documents et indice', 550), use_container_width=True)
+    interface.afficher_graphique(graphiques.figure_treemap(comptes, ['LOT', 'TYPE DE DOCUMENT', 'INDICE'], 'Répartition des documents par type de documents, lot et indice', 800), use_container_width=True)
+
+    documents_par_lot = comptes.groupby('LOT')['Nombre de documents'].sum().reset_index()
+    interface.afficher_graphique(graphiques.figure_barres_horizontales(documents_par_lot, 'LOT', 'Lot', "Nombre de documents par lot", 1000), use_container_width=True)
+    documents_par_type = comptes.groupby('TYPE DE DOCUMENT')['Nombre de documents'].sum().reset_index()
+    interface.afficher_graphique(graphiques.figure_barres_horizontales(documents_par_type, 'TYPE DE DOCUMENT', 'Type de documents', "Nombre de documents par type de documents", 1200), use_container_width=True)
+
+# Page 6: Identification des acteurs principaux
+def acteurs_principaux(projet, projet_selectionne, sources):
+    st.header("Identification des acteurs principaux")
+    donnees = projet.donnees
+    comptes_emetteur = agregations.repartition(donnees, ['EMET', 'TYPE DE DOCUMENT'])
+    interface.afficher_graphique(graphiques.figure_treemap(comptes_emetteur, ['EMET', 'TYPE DE DOCUMENT'], 'Répartition des types de documents par émetteur', 480), use_container_width=True)
+    comptes_ajoute_par = agregations.repartition(donnees, ['Ajouté par', 'TYPE DE DOCUMENT'])
+    interface.afficher_graphique(graphiques.figure_treemap(comptes_ajoute_par, ['Ajouté par', 'TYPE DE DOCUMENT'], 'Répartition des types de documents par acteur (Ajouté par)', 480), use_container_width=True)
+
+# Page 7: Arborescence des dossiers GED
+@interface.fragment
+def arborescence_des_dossiers(projet, projet_selectionne, sources):
+    st.header("Arborescence des dossiers")
+    arbre = projet.derivee('Arborescence des dossiers', dossiers.arbre_dossiers)
+    niveaux = int(arbre['Profondeur'].max()) + 1
+    col1, col2 = st.columns(2)
+    forme = col1.radio('Représentation', ['Icicle', 'Treemap'], horizontal=True, key='forme_dossiers')
+    profondeur = col2.slider('Niveaux affichés', 1, niveaux, min(3, niveaux), key='profondeur_dossiers') if niveaux > 1 else 1
+    interface.afficher_graphique(graphiques.figure_dossiers(arbre, forme, profondeur), use_container_width=True)
+
+    st.subheader("Détail des dossiers")
+    st.dataframe(arbre[arbre['Profondeur'] < profondeur].drop(columns=['Parent']), hide_index=True)
+
+# Page 8: Comparaison de la masse de documents entre projets
+@interface.fragment
+def masse_de_documents(projet, projet_selectionne, sources):
+    st.header("Comparaison de la masse de documents")
+    periode_selectionnee = st.radio(
+        'Sélectionnez la période',
+        options=['6m', '12m', 'all'],
+        format_func=lambda x: '6 premiers mois' if x == '6m' else '12 premiers mois' if x == '12m' else 'Toute la période',
+        horizontal=True
+    )
+    projets_selectionnes = st.multiselect('Sélectionnez les projets', list(sources.keys()), default=list(sources.keys()))
+    if base_analytique.active():
+        cles_par_projet = {nom: projet_dans_base(nom, sources[nom]) for nom in projets_selectionnes}
+        df_barre = base_analytique.masse_documents(cles_par_projet, periode_selectionnee)
+    else:
+        jours_par_projet = {nom: obtenir_projet(sources[nom]).derivee('Jours dépôt triés', jours_depot_tries) for nom in projets_selectionnes}
+        df_barre = agregations.masse_documents(jours_par_projet, periode_selectionnee)
+    interface.afficher_graphique(graphiques.figure_masse_documents(df_barre), use_container_width=True)
+
+# Fonction pour afficher une statistique par catégorie en tableau, graphique barre ou boxplot. Les statistiques
+# des boîtes à moustaches sont calculées une seule fois par projet et par variante des données (jours ouvrés)
+def afficher_resultats(projet, donnees, categorie, colonne, type_calcul, representation, libelles, cle, variante=''):
+    if representation == "Boxplot":
+        title = f"{libelles['titre'][type_calcul]} par {categorie}"
+        boites, aberrants = projet.derivee(f'Boîtes {colonne} par {categorie}{variante}', lambda _: agregations.statistiques_boites(donnees, categorie, colonne))
+        interface.afficher_graphique(graphiques.figure_boxplot(boites, aberrants, categorie, colonne, title), use_container_width=True, key=cle)
+        return
+    resultats = agregations.statistique_par_categorie(donnees, categorie, colonne, type_calcul)
+    if representation == "Tableau":
+        resultats.columns = [categorie, libelles['colonne'][type_calcul]]
+        st.dataframe(resultats)
+    elif representation == "Graphique barre":
+        title = f"{libelles['titre'][type_calcul]} par {categorie}"
+        interface.afficher_graphique(graphiques.figure_barres_categorie(resultats, categorie, title, categorie), use_container_width=True, key=cle)
+
+# Page 9: Nombre d'indices par type de document
+@interface.fragment
+def indices_par_type(projet, projet_selectionne, sources):
+    st.header("Nombre d'indices par type de document")
+    donnees = projet.donnees
+    type_calcul = st.selectbox('Sélectionnez le type de calcul', ['mean', 'max', 'median', 'p90'], key='calcul_indices_type')
+    representation = st.selectbox('Sélectionnez le type de représentation', ['Graphique barre', 'Tableau', 'Boxplot'], key='rep_indices_type', index=0)
+    libelles = {
+        'colonne': {'mean': 'Nombre moyen d\'indices', 'max': 'Nombre maximum d\'indices', 'median': 'Nombre médian d\'indices', 'p90': 'Nombre d\'indices (p90)'},
+        'titre': {'mean': 'Nombre moyen d\'indices', 'max': 'Nombre maximum d\'indices', 'median': 'Nombre médian d\'indices', 'p90': 'Nombre d\'indices (p90)'}
+    }
+    afficher_resultats(projet, donnees, 'TYPE DE DOCUMENT', 'Nombre d\'indices', type_calcul, representation, libelles, 'graphique_indices_type')
+
+# Page 10: Doublons probables (documents déposés plusieurs fois sous des libellés presque identiques)
+@interface.fragment
+def doublons_probables(projet, projet_selectionne, sources):
+    st.header("Doublons probables")
+    groupes = doublons.doublons_probables(projet)
+    if groupes.empty:
+        st.write("Aucun doublon probable dans cet export.")
+        return
+
+    par_lot = doublons.doublons_par_lot(groupes)
+    col1, col2 = st.columns(2)
+    col1.metric("Groupes de doublons", int(groupes['Groupe'].nunique()))
+    col2.metric("Documents en trop", int(par_lot['Documents en trop'].sum()))
+    interface.afficher_graphique(graphiques.figure_doublons_par_lot(par_lot), use_container_width=True)
+    st.dataframe(par_lot, hide_index=True)
+
+    # Revue des groupes, éventuellement restreints à ceux qui touchent un LOT
+    st.subheader("Groupes à vérifier")
+    lot = st.selectbox('LOT', ['Tous les lots'] + par_lot['LOT'].tolist(), key='lot_doublons')
+    if lot != 'Tous les lots':
+        groupes = groupes[groupes['Groupe'].isin(groupes.loc[groupes['LOT'] == lot, 'Groupe'])]
+    st.dataframe(groupes, hide_index=True)
+
+# Page 11: Durée entre versions de documents
+def duree_entre_versions(projet, projet_selectionne, sources):
+    st.header("Durée entre versions de documents")
+    ouvres = interface.choisir_jours_ouvres('jours_durees')
+    donnees = projet.vue_jours_ouvres() if ouvres else projet.donnees
+    statistique_durees(projet, donnees, 'jours ouvrés' if ouvres else 'jours')
+
+    st.subheader("Durées entre indices par type de document")
+    df_durees_indices = agregations.durees_entre_indices(donnees, projet.calendrier_ouvre() if ouvres else None)
+    if not df_durees_indices.empty:
+        st.dataframe(df_durees_indices)
+    else:
+        st.write("Pas de données disponibles pour les durées entre indices.")
+
+# Statistique des durées entre versions, réexécutée seule quand ses widgets changent
+@interface.fragment
+def statistique_durees(projet, donnees, unite):
+    type_calcul = st.selectbox('Sélectionnez le type de calcul', ['mean', 'max', 'median', 'p90'], key='calcul_duree_versions_type')
+    categorie = st.selectbox('Sélectionnez la catégorie', ['TYPE DE DOCUMENT', 'LOT'], key='categorie_duree_versions_type')
+    representation = st.selectbox('Sélectionnez le type de représentation', ['Graphique barre', 'Tableau', 'Boxplot'], key='rep_duree_versions_type', index=0)
+    libelles = {
+        'colonne': {'mean': f'Durée moyenne entre versions ({unite})', 'max': f'Durée maximum entre versions ({unite})', 'median': f'Durée médiane entre versions ({unite})', 'p90': f'Durée entre versions, p90 ({unite})'},
+        'titre': {'mean': f'Durée moyenne entre versions ({unite})', 'max': f'Durée maximum entre versions ({unite})', 'median': f'Durée médiane entre versions ({unite})', 'p90': f'Durée entre versions, p90 ({unite})'}
+    }
+    afficher_resultats(projet, donnees, categorie, 'Durée entre versions', type_calcul, representation, libelles, 'graphique_duree_versions', f' en {unite}')
+
+# Fonction pour afficher un diagramme de Gantt et son tableau récapitulatif
+def afficher_gantt(donnees_gantt, categorie, title, libelle, sous_titre, unite):
+    interface.afficher_graphique(graphiques.figure_gantt(donnees_gantt, categorie, title, libelle, unite), use_container_width=True)
+    tableau = donnees_gantt.assign(**{
+        'Date début': donnees_gantt['Date début'].dt.strftime('%d %b %Y'),
+        'Date fin': donnees_gantt['Date fin'].dt.strftime('%d %b %Y')
+    }).rename(columns={'Durée en jours': f'Durée en {unite}'})
+    st.subheader(sous_titre)
+    st.dataframe(tableau)
+
+# Page 12: Calendrier des Projets
+@interface.fragment
+def calendrier_des_projets(projet, projet_selectionne, sources):
+    st.header("Calendrier des Projets")
+    donnees = projet.donnees
+    categorie_gantt = st.selectbox('Sélectionnez la catégorie', ['LOT', 'TYPE DE DOCUMENT'], key='categorie_gantt')
+    ouvres = interface.choisir_jours_ouvres('jours_gantt')
+    donnees_gantt = agregations.calendrier(donnees, categorie_gantt, projet.calendrier_ouvre() if ouvres else None)
+    afficher_gantt(donnees_gantt, categorie_gantt, f'Calendrier des Projets par {categorie_gantt}', categorie_gantt, "Détails des projets", 'jours ouvrés' if ouvres else 'jours')
+
+# Page 13: Calendrier par Lot
+@interface.fragment
+def calendrier_par_lot(projet, projet_selectionne, sources):
+    st.header("Calendrier par Lot")
+    donnees = projet.donnees
+    index_filtres = projet.index_filtres()
+    lot_selectionne = st.selectbox('Sélectionnez un Lot', index_filtres.valeurs['LOT'])
+    ouvres = interface.choisir_jours_ouvres('jours_gantt_lot')
+    donnees_gantt = agregations.calendrier(donnees[index_filtres.masque({'LOT': [lot_selectionne]})], 'TYPE DE DOCUMENT', projet.calendrier_ouvre() if ouvres else None)
+    afficher_gantt(donnees_gantt, 'TYPE DE DOCUMENT', f'Calendrier par Lot: {lot_selectionne}', 'Type de Document', "Détails du Lot", 'jours ouvrés' if ouvres else 'jours')
+
+# Page 14: Analyse séquentielle des documents
+@interface.fragment
+def analyse_sequentielle(projet, projet_selectionne, sources):
+    st.header("Analyse séquentielle des documents")
+    donnees = projet.donnees
+
+    # Sélection de la période d'analyse
+    periode = st.radio('Sélectionnez la période d\'analyse', ('6 mois', '1 an', 'Toute la période'), index=0)
+    donnees_filtrees = sequences.filtrer_donnees_par_periode(donnees, periode)
+
+    lot_selectionne = st.selectbox('Sélectionnez un Lot', donnees_filtrees['LOT'].unique(), key='analyse_lot')
+    donnees_lot = donnees_filtrees[donnees_filtrees['LOT'] == lot_selectionne].sort_values(by='Date dépôt GED')
+
+    st.subheader(f"Analyse séquentielle des documents pour le Lot {lot_selectionne} sur {periode}")
+
+    # Distribution des types de documents dans le lot sélectionné
+    distribution_types = donnees_lot['TYPE DE DOCUMENT'].value_counts().reset_index()
+    distribution_types.columns = ['Type de Document', 'Nombre de Documents']
+    interface.afficher_graphique(graphiques.figure_distribution_types(distribution_types), use_container_width=True)
+
+    # Séquence de diffusion des documents
+    interface.afficher_graphique(graphiques.figure_sequence(donnees_lot, 'TYPE DE DOCUMENT', 'Séquence de diffusion des documents'), use_container_width=True)
+
+    # Séquence moyenne de diffusion des documents
+    moyenne_dates = sequences.calculer_sequence_moyenne(donnees_lot)
+    interface.afficher_graphique(graphiques.figure_sequence_moyenne(moyenne_dates), use_container_width=True)
+
+    if donnees_lot.empty:
+        return
+
+    # Analyse par clustering
+    interface.afficher_graphique(graphiques.figure_sequence(donnees_lot, sequences.calculer_clusters(donnees_lot), 'Clustering des documents par date de dépôt'), use_container_width=True)
+
+    # Détection des anomalies
+    interface.afficher_graphique(graphiques.figure_sequence(donnees_lot, sequences.detecter_anomalies(donnees_lot), 'Détection des anomalies dans la séquence de diffusion des documents'), use_container_width=True)
+
+    # Analyse de corrélation
+    st.subheader("Analyse de corrélation")
+    correlation = pd.DataFrame({
+        'Date Ordinale': (donnees_lot['Date dépôt GED'] - sequences.EPOCH).dt.days,
+        'Durée entre versions': donnees_lot['Durée entre versions']
+    })
+    interface.afficher_graphique(graphiques.figure_correlation(correlation), use_container_width=True)
+
+    st.subheader("Résumé statistique")
+    st.dataframe(sequences.resume_statistique(donnees_lot))
+
+# Page 15: Récapitulatif d'alerte
+@interface.fragment
+def recapitulatif_alerte(projet, projet_selectionne, sources):
+    st.header("Indicateur de Récapitulatif d'Alerte")
+    donnees = projet.donnees
+    onglet = st.selectbox("Catégorie", ["Par LOT", "Par TYPE DE DOCUMENT"])
+    group_column = onglet.removeprefix("Par ")
+
+    col3, col4, col5 = st.columns([1, 1, 1])
+    with col3:
+        search_value = st.text_input(f"Rechercher par {onglet.split()[-1]}...")
+    with col4:
+        search_value_alert = st.text_input("Rechercher par Alerte 1...")
+    with col5:
+        search_value_alert2 = st.text_input("Rechercher par Alerte 2...")
+
+    if search_value:
+        donnees = donnees[donnees[group_column].str.contains(search_value, case=False, na=False)]
+    dataframe = alertes.calculer_alertes(donnees, group_column)
+    if search_value_alert:
+        dataframe = dataframe[dataframe['Alerte 1'].str.contains(search_value_alert, case=False)]
+    if search_value_alert2:
+        dataframe = dataframe[dataframe['Alerte 2'].str.contains(search_value_alert2, case=False)]
+
+    # Les styles sont obtenus en une seule indexation des codes, sans appel Python par cellule
+    codes_1 = dataframe['Code Alerte 1'].to_numpy()
+    codes_2 = dataframe['Code Alerte 2'].to_numpy()
+    styles_1 = pd.Series(alertes.STYLES_ALERTE_1[codes_1], index=dataframe.index)
+    styles_2 = pd.Series(alertes.STYLES_ALERTE_2[codes_2], index=dataframe.index)
+    tableau = dataframe.drop(columns=['Code Alerte 1', 'Code Alerte 2'])
+    # Libellés affichés en texte simple : le rendu d'un catégoriel vide échoue en mode copy-on-write
+    tableau = tableau.assign(**{colonne: tableau[colonne].to_numpy(dtype=object) for colonne in ['Alerte 1', 'Alerte 2']})
+    st.dataframe(tableau.style.apply(lambda _: styles_1, subset=['Alerte 1']).apply(lambda _: styles_2, subset=['Alerte 2']), height=600)
+
+    col6, col7 = st.columns(2)
+    with col6:
+        comptes_1 = alertes.comptes_par_niveau(codes_1, alertes.LIBELLES_ALERTE_1)
+        interface.afficher_graphique(graphiques.figure_camembert_alerte(comptes_1, alertes.LIBELLES_ALERTE_1, alertes.COULEURS_ALERTE_1, 'Alerte 1'), use_container_width=True)
+    with col7:
+        comptes_2 = alertes.comptes_par_niveau(codes_2, alertes.LIBELLES_ALERTE_2)
+        interface.afficher_graphique(graphiques.figure_camembert_alerte(comptes_2, alertes.LIBELLES_ALERTE_2, alertes.COULEURS_ALERTE_2, 'Alerte 2'), use_container_width=True)
+
+# Page 16: Délais de visa des relecteurs
+def delais_des_visas(projet, projet_selectionne, sources):
+    st.header("Délais de visa des relecteurs")
+    ouvres = interface.choisir_jours_ouvres('jours_visas')
+    delais = visas.delais_visa(projet, ouvres=ouvres)
+    if delais.empty:
+        st.write("Aucune demande de visa dans cet export.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Demandes de visa", int(delais['Demandes'].sum()))
+    col2.metric("Visas en attente", int(delais['En attente'].sum()))
+    col3.metric("Visas en retard", int(delais['En retard'].sum()))
+    interface.afficher_graphique(graphiques.figure_retards_relecteurs(delais), use_container_width=True)
+    interface.afficher_graphique(graphiques.figure_delais_relecteurs(delais), use_container_width=True)
+    st.dataframe(delais, hide_index=True)
+    detail_delais(projet, delais['Relecteur'].tolist(), ouvres)
+
+# Détail des délais par lot ou type de document, réexécuté seul quand ses widgets changent
+@interface.fragment
+def detail_delais(projet, relecteurs, ouvres):
+    st.subheader("Détail par relecteur")
+    col1, col2 = st.columns(2)
+    categorie = col1.selectbox('Détail par', visas.CATEGORIES, key='categorie_visas')
+    relecteurs_selectionnes = col2.multiselect('Relecteurs', relecteurs, key='relecteurs_visas')
+    detail = visas.delais_visa(projet, categorie, ouvres)
+    if relecteurs_selectionnes:
+        detail = detail[detail['Relecteur'].isin(relecteurs_selectionnes)]
+    st.dataframe(detail, hide_index=True)
+
+# Page 17: Mémoire du cache partagé entre les sessions
+def memoire_du_cache(projet, projet_selectionne, sources):
+    st.header("Mémoire du cache")
+    metriques = entrepot().metriques()
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Mémoire utilisée", f"{metriques['octets'] / 2**20:.1f} Mo", f"budget {metriques['budget'] / 2**20:.0f} Mo", delta_color="off")
+    col2.metric("Hits", metriques['hits'])
+    col3.metric("Misses", metriques['misses'])
+    col4.metric("Évictions", metriques['evictions'])
+    st.dataframe(metriques['projets'], hide_index=True)
+
+# Page 18: Comparaison des durées entre projets, calculée à partir des esquisses de quantiles de chaque projet
+@interface.fragment
+def durees_entre_projets(projet, projet_selectionne, sources):
+    st.header("Comparaison des durées entre projets")
+    projets_selectionnes = st.multiselect('Sélectionnez les projets', list(sources.keys()), default=list(sources.keys()), key='projets_durees')
+    col1, col2, col3 = st.columns(3)
+    duree = col1.selectbox('Sélectionnez la durée', quantiles.DUREES, key='duree_projets')
+    categorie = col2.selectbox('Sélectionnez la catégorie', quantiles.COLONNES_ESQUISSE, key='categorie_durees_projets')
+    type_calcul = col3.selectbox('Sélectionnez le type de calcul', ['median', 'p90', 'mean', 'max'], key='calcul_durees_projets')
+    ouvres = interface.choisir_jours_ouvres('jours_durees_projets')
+    if not projets_selectionnes:
+        st.write("Veuillez sélectionner au moins un projet.")
+        return
+
+    if base_analytique.active():
+        cles_par_projet = {nom: projet_dans_base(nom, sources[nom]) for nom in projets_selectionnes}
+        ensemble, tableau = base_analytique.durees_par_projet(cles_par_projet, duree, categorie, type_calcul, ouvres)
+    else:
+        esquisses = {nom: quantiles.esquisses_projet(obtenir_projet(sources[nom]), ouvres) for nom in projets_selectionnes}
+        ensemble, tableau = quantiles.durees_par_projet(esquisses, duree, categorie, type_calcul)
+    if ensemble.empty:
+        st.write("Pas de données disponibles pour cette durée.")
+        return
+    title = f"{duree}, {quantiles.LIBELLES_CALCUL[type_calcul]} en {'jours ouvrés' if ouvres else 'jours'}, par {categorie} (ensemble des projets)"
+    interface.afficher_graphique(graphiques.figure_barres_categorie(ensemble, categorie, title, categorie), use_container_width=True)
+    st.dataframe(tableau, hide_index=True)
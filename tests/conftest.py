@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Les tests importent le paquet ged depuis la racine du dépôt, quel que soit le dossier de lancement
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RACINE)
@@ -0,0 +1,27 @@
+import os
+import subprocess
+import sys
+
+from conftest import RACINE
+
+# Copie d'un petit projet, sans connexion préalable : ingerer ouvre la première connexion du processus
+# en tenant déjà le verrou d'écriture
+SCRIPT_INGESTION = """
+import pandas as pd
+from ged import base_analytique
+donnees = pd.DataFrame({
+    'Date dépôt GED': pd.to_datetime(['2024-01-02', '2024-01-05', None]),
+    'LOT': ['A', 'B', None],
+    'TYPE DE DOCUMENT': ['PLN', 'NOT', 'PLN']
+})
+esquisses = {False: pd.DataFrame({'Durée': ['Durée entre versions'], 'TYPE DE DOCUMENT': ['PLN'], 'LOT': ['A'], 'Jours': [3], 'Effectif': [2]})}
+base_analytique.ingerer('cle', 'projet', 'signature', donnees, esquisses)
+print(base_analytique.a_jour('cle', 'signature'))
+"""
+
+def test_ingerer_premiere_connexion_du_processus(tmp_path):
+    environnement = dict(os.environ, GED_BASE_ANALYTIQUE=str(tmp_path / 'base.sqlite'))
+    resultat = subprocess.run([sys.executable, '-c', SCRIPT_INGESTION], cwd=RACINE, env=environnement,
+                              capture_output=True, text=True, timeout=60)
+    assert resultat.returncode == 0, resultat.stderr
+    assert resultat.stdout.strip() == 'True'
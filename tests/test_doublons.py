@@ -0,0 +1,66 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from ged import doublons
+from ged.identite import COLONNE_ID
+
+# Échantillon fixe de libellés normalisés : variantes d'un même document (bruit ajouté, faute de frappe, pluriel)
+# et documents distincts aux libellés proches
+LIBELLES = [
+    'plan de masse rdc', 'plan de masse rdc indice b', 'plan de mase rdc', 'plan de masse rdc copie',
+    'plan de masse r+1', 'coupe aa', 'coupe bb', 'coupe aa pdf', 'zone a', 'zone b',
+    'facade nord', 'facades nord', 'facade sud', 'note de calcul poutres', 'note de calcul poteaux',
+    'note de calcul poutre', 'plafond r+8', 'plafond r+8 paliers asc', 'carnet de details menuiseries',
+    'carnet de detail menuiseries', 'carnet de details serrurerie', 'synoptique cvc', 'synoptique cfo',
+    'synoptique cvc v2', 'schema electrique tgbt', 'schema electrique tgbt rev', 'schema electrique tdn'
+]
+
+# Fonction pour calculer la similarité de Jaccard exacte des trigrammes de deux libellés
+def jaccard(libelle_a, libelle_b):
+    a, b = doublons.shingles(libelle_a), doublons.shingles(libelle_b)
+    return len(a & b) / len(a | b)
+
+def test_paires_candidates_contiennent_les_paires_tres_similaires():
+    ensembles = [doublons.shingles(libelle) for libelle in LIBELLES]
+    candidates = doublons.paires_candidates(doublons.signatures_minhash(ensembles), np.zeros(len(LIBELLES), dtype=int))
+    similaires = {(i, j) for i, j in itertools.combinations(range(len(LIBELLES)), 2) if jaccard(LIBELLES[i], LIBELLES[j]) >= 0.8}
+    assert similaires
+    assert similaires <= {tuple(sorted(paire)) for paire in candidates}
+
+def test_paires_candidates_restent_dans_leur_bloc():
+    ensembles = [doublons.shingles(libelle) for libelle in ['coupe aa', 'coupe aa', 'coupe aa']]
+    candidates = doublons.paires_candidates(doublons.signatures_minhash(ensembles), np.array([0, 1, 0]))
+    assert {tuple(sorted(paire)) for paire in candidates} == {(0, 2)}
+
+def test_composantes_comme_parcours_naif():
+    paires = [(0, 3), (3, 5), (1, 2), (6, 6), (7, 4)]
+    racines = doublons.composantes(8, paires)
+    groupes = {frozenset(np.flatnonzero(racines == racine)) for racine in racines}
+    assert groupes == {frozenset({0, 3, 5}), frozenset({1, 2}), frozenset({4, 7}), frozenset({6})}
+
+def test_groupes_comme_la_comparaison_de_toutes_les_paires():
+    documents = pd.DataFrame({
+        COLONNE_ID: range(len(LIBELLES)),
+        'TYPE DE DOCUMENT': 'PLN',
+        'LOT': 'GO',
+        'INDICE': 'A',
+        'Libellé du document': LIBELLES,
+        'Date dépôt GED': pd.date_range('2024-01-01', periods=len(LIBELLES))
+    })
+    groupes = doublons.groupes_doublons(documents)
+    obtenus = {frozenset(groupe['Libellé du document']) for _, groupe in groupes.groupby('Groupe')}
+
+    # Référence naïve : toutes les paires comparées, puis regroupées
+    ensembles = [doublons.shingles(libelle) for libelle in LIBELLES]
+    paires = [(i, j) for i, j in itertools.combinations(range(len(LIBELLES)), 2) if doublons.variantes(LIBELLES[i], LIBELLES[j], ensembles[i], ensembles[j])]
+    racines = doublons.composantes(len(LIBELLES), paires)
+    attendus = {frozenset(np.array(LIBELLES)[racines == racine]) for racine in set(racines) if (racines == racine).sum() > 1}
+    assert obtenus == attendus
+    assert obtenus == {
+        frozenset({'plan de masse rdc', 'plan de mase rdc', 'plan de masse rdc copie'}),
+        frozenset({'note de calcul poutres', 'note de calcul poutre'}),
+        frozenset({'carnet de details menuiseries', 'carnet de detail menuiseries'}),
+        frozenset({'schema electrique tgbt', 'schema electrique tgbt rev'})
+    }
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from ged.filtres import IndexBitmap
+
+# Export aléatoire dont le nombre de lignes n'est pas un multiple de 8, avec des valeurs manquantes
+def export(lignes=1003, graine=0):
+    rng = np.random.default_rng(graine)
+    return pd.DataFrame({
+        'LOT': rng.choice(['GO', 'CVC', 'CFO', None], size=lignes),
+        'TYPE DE DOCUMENT': rng.choice(['PLN', 'NOT', 'SYN'], size=lignes),
+        'INDICE': rng.choice(list('ABCDE'), size=lignes)
+    })
+
+def test_masque_comme_isin():
+    donnees = export()
+    index = IndexBitmap(donnees)
+    rng = np.random.default_rng(1)
+    for _ in range(50):
+        filtres = {colonne: list(rng.choice(index.valeurs[colonne], size=rng.integers(0, 3), replace=False)) for colonne in index.valeurs}
+        attendu = np.ones(len(donnees), dtype=bool)
+        for colonne, selection in filtres.items():
+            if selection:
+                attendu &= donnees[colonne].isin(selection).to_numpy()
+        masque = index.masque(filtres)
+        if not any(filtres.values()):
+            assert masque is None
+        else:
+            assert np.array_equal(masque, attendu)
+
+def test_valeur_inconnue_ou_colonne_absente():
+    donnees = export(lignes=13)
+    index = IndexBitmap(donnees)
+    assert not index.masque({'LOT': ['inconnu']}).any()
+    assert np.array_equal(index.masque({'LOT': ['GO', 'inconnu']}), donnees['LOT'].eq('GO').to_numpy())
+    assert 'EMET' not in index.valeurs and index.masque({}) is None
+
+def test_projet_vide():
+    index = IndexBitmap(export(lignes=0))
+    assert len(index.masque({'LOT': ['GO']})) == 0
@@ -0,0 +1,84 @@
+import logging
+
+import pandas as pd
+import pytest
+
+from ged import identite
+from ged.identite import identifier_documents, verifier_identifiants
+
+# Fonction pour construire un petit export : une ligne par (Numéro, INDICE, Libellé du document, jour de dépôt)
+def export(lignes, **colonnes):
+    donnees = pd.DataFrame(lignes, columns=['Numéro', 'INDICE', 'Libellé du document', 'jour'])
+    donnees['Date dépôt GED'] = pd.Timestamp('2024-01-01') + pd.to_timedelta(donnees.pop('jour'), unit='D')
+    return donnees.assign(**{'TYPE DE DOCUMENT': 'PLN', 'LOT': 'GO'}, **colonnes)
+
+def test_verifier_identifiants_refuse_un_indice_repete():
+    with pytest.raises(ValueError):
+        verifier_identifiants([0, 0, 1], pd.Series(['A', 'A', 'A']))
+    verifier_identifiants([0, 0, 1], pd.Series(['A', 'B', 'A']))
+
+def test_identifiants_incoherents_avertissement_et_libelles(monkeypatch, caplog):
+    donnees = export([('12', 'A', 'Plan RDC.pdf', 0), ('12', 'B', 'Plan RDC', 5), ('13', 'A', 'Coupe', 1)])
+    monkeypatch.setattr(identite, 'identifiants_incoherents', lambda identifiants, indices: 1)
+    with caplog.at_level(logging.WARNING, logger='ged.identite'):
+        identifiants = identifier_documents(donnees)
+    assert 'seul libellé' in caplog.text
+    assert list(identifiants) == list(identite.identifiants_par_libelle(donnees))
+    assert identifiants[0] == identifiants[1] != identifiants[2]
+
+def test_mode_strict_leve_une_erreur(monkeypatch):
+    def refuser(identifiants, indices):
+        raise ValueError('incohérent')
+    donnees = export([('12', 'A', 'Plan', 0), ('13', 'A', 'Coupe', 1)])
+    monkeypatch.setattr(identite, 'verifier_identifiants', refuser)
+    with pytest.raises(ValueError):
+        identifier_documents(donnees, strict=True)
+    assert identifier_documents(donnees).nunique() == 2
+
+def test_numero_stable_malgre_les_variantes_de_libelle():
+    donnees = export([
+        ('0120', 'A', 'Plan de masse RDC.pdf', 0),
+        ('120', 'B', 'PLAN DE MASSE  rdc', 10),
+        (' 120 ', 'C', 'Plan de masse RDC - mise à jour.dwg', 20),
+        ('121', 'A', 'Plan de masse RDC.pdf', 1)
+    ])
+    identifiants = identifier_documents(donnees, strict=True)
+    assert identifiants[0] == identifiants[1] == identifiants[2] != identifiants[3]
+
+def test_libelle_normalise_sans_numero_ou_avec_numero_de_remplissage():
+    donnees = export([
+        ('0', 'A', 'Coupe AA.pdf', 0),
+        ('X', 'B', 'coupe aa', 5),
+        (None, 'C', 'Coupé AA.PDF', 9),
+        ('0', 'A', 'Coupe BB', 1),
+        ('-', 'A', 'Façade nord', 2)
+    ])
+    identifiants = identifier_documents(donnees, strict=True)
+    assert identifiants[0] == identifiants[1] == identifiants[2]
+    assert len({identifiants[0], identifiants[3], identifiants[4]}) == 3
+
+def test_numero_repris_par_plusieurs_documents_complete_par_le_libelle():
+    # Le même INDICE revient sous le numéro 7 : le numéro ne distingue pas ces documents
+    donnees = export([('7', 'A', 'Coupe AA', 0), ('7', 'A', 'Coupe BB', 1), ('7', 'B', 'Coupe AA.pdf', 8)])
+    identifiants = identifier_documents(donnees, strict=True)
+    assert identifiants[0] == identifiants[2] != identifiants[1]
+
+def test_depot_repete_ouvre_un_nouveau_document():
+    donnees = export([('5', 'A', 'Note', 0), ('5', 'A', 'Note', 3), ('5', 'B', 'Note', 6)])
+    identifiants = identifier_documents(donnees, strict=True)
+    assert identifiants[0] != identifiants[1]
+    verifier_identifiants(identifiants, donnees['INDICE'])
+
+def test_niveau_et_zone_completent_le_numero():
+    donnees = export([('3', 'A', 'Plan', 0), ('3', 'A', 'Plan', 0)], NIVEAU=['R+1', 'R+2'], ZONE=['Z1', 'Z1'])
+    identifiants = identifier_documents(donnees, strict=True)
+    assert identifiants[0] != identifiants[1]
+
+def test_export_synthetique_sans_indice_repete(tmp_path):
+    from ged.chargement import charger_donnees
+    from ged.pretraitement import pretraiter_donnees
+    from ged.synthetique import ecrire_export
+    donnees = pretraiter_donnees(charger_donnees(ecrire_export(str(tmp_path / 'export.csv'), 3000, graine=1)), strict=True)
+    verifier_identifiants(donnees[identite.COLONNE_ID].to_numpy(), donnees['INDICE'])
+    # Chaque numéro synthétique est un document, quel que soit le libellé de ses révisions
+    assert donnees.groupby(['TYPE DE DOCUMENT', 'LOT', 'Numéro'])[identite.COLONNE_ID].nunique().max() == 1
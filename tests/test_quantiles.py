@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ged import quantiles
+
+# Durées aléatoires en jours entiers, avec des valeurs manquantes, par type de document et lot
+def durees(lignes, graine):
+    rng = np.random.default_rng(graine)
+    valeurs = rng.geometric(0.05, size=lignes).astype(float)
+    valeurs[rng.random(lignes) < 0.1] = np.nan
+    return pd.DataFrame({
+        'TYPE DE DOCUMENT': rng.choice(['PLN', 'NOT', 'SYN', 'DET'], size=lignes),
+        'LOT': rng.choice(['GO', 'CVC', 'CFO'], size=lignes),
+        'Durée entre versions': valeurs
+    })
+
+# Statistique exacte calculée par pandas sur les lignes
+def reference(donnees, categorie, type_calcul):
+    groupes = donnees.dropna(subset=['Durée entre versions']).groupby(categorie)['Durée entre versions']
+    if type_calcul in quantiles.QUANTILES:
+        return groupes.quantile(quantiles.QUANTILES[type_calcul]).round(1)
+    return groupes.agg(type_calcul).round(1)
+
+# Statistique lue sur une esquisse, par catégorie
+def lue(esquisse, categorie, type_calcul):
+    return quantiles.statistique_esquisse(esquisse, categorie, type_calcul).set_index(categorie)['Jours']
+
+@pytest.mark.parametrize('type_calcul', ['median', 'p90', 'mean', 'max'])
+@pytest.mark.parametrize('categorie', quantiles.COLONNES_ESQUISSE)
+def test_statistique_esquisse_comme_pandas(categorie, type_calcul):
+    donnees = durees(2000, 0)
+    esquisse = quantiles.esquisse(donnees, 'Durée entre versions')
+    obtenu, attendu = lue(esquisse, categorie, type_calcul), reference(donnees, categorie, type_calcul)
+    pd.testing.assert_series_equal(obtenu.sort_index(), attendu.sort_index(), check_names=False, check_index_type=False)
+
+@pytest.mark.parametrize('type_calcul', ['median', 'p90'])
+def test_fusion_comme_concatenation(type_calcul):
+    projets = [durees(lignes, graine) for graine, lignes in enumerate([500, 37, 1200])]
+    esquisses = [quantiles.esquisse(donnees, 'Durée entre versions').assign(Durée='Durée entre versions') for donnees in projets]
+    fusion = quantiles.fusionner_esquisses(esquisses)
+    attendu = reference(pd.concat(projets, ignore_index=True), 'TYPE DE DOCUMENT', type_calcul)
+    pd.testing.assert_series_equal(lue(fusion, 'TYPE DE DOCUMENT', type_calcul).sort_index(), attendu.sort_index(), check_names=False, check_index_type=False)
+
+def test_durees_par_projet():
+    esquisses = {f'P{graine}': quantiles.esquisse(durees(300, graine), 'Durée entre versions').assign(Durée='Durée entre versions') for graine in range(3)}
+    ensemble, tableau = quantiles.durees_par_projet(esquisses, 'Durée entre versions', 'LOT', 'p90')
+    assert list(tableau.columns) == ['LOT', 'Ensemble des projets', 'Durées', 'P0', 'P1', 'P2']
+    assert tableau['Durées'].sum() == sum(esquisse['Effectif'].sum() for esquisse in esquisses.values())
+    for nom, esquisse in esquisses.items():
+        assert np.allclose(tableau.set_index('LOT')[nom].sort_index(), lue(esquisse, 'LOT', 'p90').sort_index())
+
+def test_esquisse_vide():
+    esquisse = quantiles.esquisse(durees(10, 0).assign(**{'Durée entre versions': np.nan}), 'Durée entre versions')
+    assert quantiles.statistique_esquisse(esquisse, 'LOT', 'median').empty
+
+def test_esquisses_durees_de_chaque_metrique(tmp_path):
+    from ged.agregations import calendrier, durees_entre_indices
+    from ged.chargement import charger_donnees
+    from ged.identite import COLONNE_ID
+    from ged.pretraitement import pretraiter_donnees
+    from ged.synthetique import ecrire_export
+    from ged.visas import demandes_visa
+    donnees = pretraiter_donnees(charger_donnees(ecrire_export(str(tmp_path / 'export.csv'), 3000, graine=2)), strict=True)
+    demandes = demandes_visa(donnees)
+    esquisses = quantiles.esquisses_durees(donnees, demandes)
+    assert sorted(esquisses['Durée'].unique()) == sorted(quantiles.DUREES)
+
+    indices = durees_entre_indices(donnees)
+    lignes = {
+        'Durée entre versions': donnees['Durée entre versions'],
+        'Durée entre indices': indices['Durée entre indices (jours)'],
+        'Différence en jours': donnees.drop_duplicates(COLONNE_ID)['Différence en jours'],
+        'Délai de visa': demandes['Délai (jours)'],
+        'Jours de retard': demandes['Jours de retard']
+    }
+    for duree, valeurs in lignes.items():
+        esquisse = esquisses[esquisses['Durée'] == duree]
+        assert esquisse['Effectif'].sum() == valeurs.notna().sum()
+        mediane = quantiles.statistique_esquisse(esquisse.assign(Tout='tout'), 'Tout', 'median')['Jours'].iloc[0]
+        assert mediane == round(valeurs.dropna().median(), 1)
+
+    # Calendrier : une durée par (type, lot), celle du Gantt du lot restreint à ce type
+    gantt = esquisses[esquisses['Durée'] == 'Durée en jours (calendrier)']
+    lot = donnees['LOT'].dropna().iloc[0]
+    attendu = calendrier(donnees[donnees['LOT'] == lot], 'TYPE DE DOCUMENT').set_index('TYPE DE DOCUMENT')['Durée en jours']
+    obtenu = gantt[gantt['LOT'] == lot].set_index('TYPE DE DOCUMENT')['Jours']
+    assert obtenu.sort_index().tolist() == attendu.sort_index().tolist()